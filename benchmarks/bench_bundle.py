@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Measure the cost of loading a YAMLCONF bundle file, with a section for each
+host of a fleet, as the number of hosts grows: only the section selected
+for the current host is composed and constructed, e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_bundle.py --hosts 10 100 1000
+"""
+
+import argparse
+import io
+import timeit
+
+import yaml
+
+import django_yamlconf
+from django_yamlconf import positions
+
+
+def generate(n_hosts, n_attrs=20):
+    """
+    Generate a bundle with a common section and a section per host.
+    """
+    sections = [yaml.safe_dump({
+        f"ATTR_{i}": f"{{BASE_DIR}}/common/{i}" for i in range(n_attrs)
+    })]
+    for host in range(n_hosts):
+        section = {':select': {'OS_NODE': f"host-{host:05d}"}}
+        section.update({
+            f"ATTR_{i}": f"{{BASE_DIR}}/host-{host}/{i}"
+            for i in range(n_attrs)
+        })
+        sections.append(yaml.safe_dump(section, sort_keys=False))
+    return "---\n".join(sections)
+
+
+def main():
+    """
+    Time the bundle load against the parsing of all the sections.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hosts", type=int, nargs="+",
+                        default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    _, _, kwargs = django_yamlconf.select_loader("yaml")
+    select = {'OS_NODE': "host-00000"}
+    for n_hosts in args.hosts:
+        text = generate(n_hosts)
+        bundle = min(timeit.repeat(
+            lambda: positions.load(io.StringIO(text), select=select, **kwargs),
+            number=1,
+            repeat=args.repeat,
+        ))
+        full = min(timeit.repeat(
+            lambda: list(yaml.load_all(io.StringIO(text), **kwargs)),
+            number=1,
+            repeat=args.repeat,
+        ))
+        print(
+            f"{n_hosts:6d} hosts {len(text):10d} bytes"
+            f"  bundle {bundle * 1000:10.2f} ms"
+            f"  all sections {full * 1000:10.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
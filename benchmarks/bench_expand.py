@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Compare the expansion of attribute references with the previous fixed
+point expansion (each string formatted, with the full attribute set as
+keyword arguments, until unchanged) for a large set of attributes, e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_expand.py --attributes 10000
+"""
+
+import argparse
+import copy
+import logging
+import time
+
+import django_yamlconf
+
+
+def generate(n_attrs):
+    """
+    Generate the attribute information for "n_attrs" attributes: chains of
+    references, repeated directory templates, lists, dicts and literals.
+    """
+    attributes = {}
+    django_yamlconf.add_attr_info(attributes, "BASE_DIR", "/srv/app")
+    for i in range(n_attrs):
+        if i % 4 == 0:
+            value = "{BASE_DIR}/log"
+        elif i % 4 == 1:
+            value = f"{{ATTR_{i - 1}}}/{i}"
+        elif i % 4 == 2:
+            value = [f"{{ATTR_{i - 1}}}", "literal", i]
+        else:
+            value = {'path': "{BASE_DIR}/data", 'size': i}
+        django_yamlconf.add_attr_info(attributes, f"ATTR_{i}", value)
+    return attributes
+
+
+def legacy_expand(attributes):
+    """
+    The previous expansion: every string is formatted with the complete
+    attribute set, until unchanged.
+    """
+    def helper(value, wrt):
+        if isinstance(value, dict):
+            for key in value.keys():
+                value[key] = helper(value[key], wrt)
+        elif isinstance(value, list):
+            for i, _ in enumerate(value):
+                value[i] = helper(value[i], wrt)
+        elif isinstance(value, str):
+            for _ in range(10):
+                new_value = value.format(**wrt)
+                if new_value == value:
+                    break
+                value = new_value
+        return value
+
+    values = {key: info['value'] for key, info in attributes.items()}
+    helper(values, values)
+    for key, value in values.items():
+        attributes[key]['evalue'] = value
+
+
+def main():
+    """
+    Time the two expansions of the generated attributes.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attributes", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    attributes = generate(args.attributes)
+    print(f"{len(attributes)} attributes")
+    for title, expand in (
+            ("legacy", legacy_expand),
+            ("graph", django_yamlconf.expand_attribute_refs)):
+        timings = []
+        for _ in range(args.repeat):
+            data = copy.deepcopy(attributes)
+            start = time.perf_counter()
+            expand(data)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+        print(f"    {title:<10} {elapsed * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
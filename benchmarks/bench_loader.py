@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Compare the YAMLCONF loader backends parsing a realistic, large, YAMLCONF
+file (a LOGGING configuration, database definitions, documentation
+strings and lists of values), e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_loader.py --attributes 2000
+"""
+
+import argparse
+import io
+import json
+import timeit
+
+import yaml
+
+import django_yamlconf
+
+
+def generate(n_attrs):
+    """
+    Generate the data for a configuration with "n_attrs" attributes.
+    """
+    data = {
+        'LOGGING': {
+            'version': 1,
+            'formatters': {
+                f"fmt{i}": {'format': '%(asctime)s %(levelname)s %(message)s'}
+                for i in range(10)
+            },
+            'handlers': {
+                f"handler{i}": {
+                    'class': 'logging.FileHandler',
+                    'filename': f"{{LOG_DIR}}/handler{i}.log",
+                    'formatter': f"fmt{i % 10}",
+                }
+                for i in range(50)
+            },
+        },
+    }
+    for i in range(n_attrs):
+        data[f"ATTR_{i}"] = f"{{BASE_DIR}}/path/to/value/{i}"
+        data[f"ATTR_{i}:doc"] = (
+            f"Documentation for attribute number {i}, describing the "
+            "expected value on production and development servers."
+        )
+        if i % 10 == 0:
+            data[f"LIST_{i}"] = [f"item-{j}" for j in range(20)]
+        if i % 20 == 0:
+            data[f"DATABASES.db{i}.HOST"] = f"db{i}.example.com"
+    return data
+
+
+def main():
+    """
+    Time each available backend parsing the generated file.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attributes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    data = generate(args.attributes)
+    texts = {
+        'yaml': yaml.safe_dump(data, default_flow_style=False),
+        'json': json.dumps(data, indent=2),
+    }
+    for syntax, text in texts.items():
+        print(f"{syntax}: {len(text)} bytes")
+        # pylint: disable=protected-access
+        backends = django_yamlconf._LOADER_BACKENDS[syntax]
+        for backend, factory in backends.items():
+            if factory() is None:
+                print(f"    {backend:<10} not available")
+                continue
+            _, loader, kwargs = django_yamlconf.select_loader(
+                syntax,
+                backend
+            )
+            elapsed = min(timeit.repeat(
+                lambda: loader(io.StringIO(text), **kwargs),
+                number=1,
+                repeat=args.repeat,
+            ))
+            print(f"    {backend:<10} {elapsed * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Compare the rendering of nested values for the YAMLCONF views by the
+"yamlconf_value" template tag with the recursive "yamlconf/value.html"
+template include, e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_render.py --handlers 10 100
+"""
+
+import argparse
+import timeit
+
+import django
+from django.conf import settings
+
+
+def generate(n_handlers):
+    """
+    Generate a LOGGING like value with the given number of handlers.
+    """
+    return {
+        'version': 1,
+        'formatters': {
+            'simple': {'format': "%(asctime)s %(levelname)s %(message)s"},
+        },
+        'handlers': {
+            f"handler_{i}": {
+                'class': "logging.handlers.RotatingFileHandler",
+                'filename': f"/var/log/app/handler_{i}.log",
+                'formatter': "simple",
+                'backupCount': 5,
+                'filters': ["require_debug_false", f"filter_{i}"],
+            }
+            for i in range(n_handlers)
+        },
+        'loggers': {
+            f"app.module_{i}": {
+                'handlers': [f"handler_{i}"],
+                'level': "INFO",
+                'propagate': False,
+            }
+            for i in range(n_handlers)
+        },
+    }
+
+
+def main():
+    """
+    Time the two renderings of the generated values.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--handlers", type=int, nargs="+",
+                        default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    settings.configure(
+        # The complete values are rendered, as for the template include
+        YAMLCONF_VIEW_MAX_DEPTH=1000,
+        YAMLCONF_VIEW_MAX_ITEMS=10 ** 9,
+        INSTALLED_APPS=["django_yamlconf"],
+        TEMPLATES=[{
+            'BACKEND': "django.template.backends.django.DjangoTemplates",
+            'APP_DIRS': True,
+        }],
+    )
+    django.setup()
+    # pylint: disable=import-outside-toplevel
+    from django.template import engines
+    engine = engines["django"]
+    include = engine.from_string(
+        '{% include "yamlconf/value.html" with value=value hide=False %}'
+    )
+    tag = engine.from_string(
+        "{% load yamconf_tags %}{% yamlconf_value value %}"
+    )
+    for n_handlers in args.handlers:
+        context = {'value': generate(n_handlers)}
+        timings = {}
+        for title, compiled in (("include", include), ("tag", tag)):
+            timings[title] = min(timeit.repeat(
+                lambda compiled=compiled: compiled.render(context),
+                number=1,
+                repeat=args.repeat,
+            ))
+        print(
+            f"{n_handlers:6d} handlers"
+            f"  include {timings['include'] * 1000:10.2f} ms"
+            f"  tag {timings['tag'] * 1000:10.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
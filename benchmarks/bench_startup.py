@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Measure the start-up cost of YAMLCONF in fresh Python processes: the time
+to import the module and to create, expand and inject the predefined
+attributes into a settings module, e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_startup.py --runs 20
+
+The import time can be broken down further via
+
+    $ PYTHONPATH=src python -X importtime -c "import django_yamlconf"
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_SCRIPT = """
+import json, time, types
+start = time.perf_counter()
+import django_yamlconf
+imported = time.perf_counter()
+settings = types.ModuleType("bench_settings")
+attributes = django_yamlconf.bootstrap_attributes("/srv/app")
+django_yamlconf.expand_attribute_refs(attributes)
+django_yamlconf.inject_attr(attributes, settings)
+done = time.perf_counter()
+print(json.dumps([imported - start, done - imported]))
+"""
+
+
+def main():
+    """
+    Run the start-up script in fresh processes reporting the best times.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")
+    timings = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT],
+            check=True,
+            capture_output=True,
+            env=env,
+            text=True,
+        ).stdout
+        timings.append(json.loads(output))
+    print(f"import     {min(t[0] for t in timings) * 1000:8.2f} ms")
+    print(f"bootstrap  {min(t[1] for t in timings) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Benchmark the load, merge, expand and inject hot paths for a synthetic
+configuration, recording the time and peak (tracemalloc) memory of each,
+and compare the results against a stored baseline, e.g.,
+
+    $ PYTHONPATH=src python benchmarks/bench_suite.py
+    $ PYTHONPATH=src python benchmarks/bench_suite.py --save
+
+Times are compared as ratios to a reference workload, timed in the same
+run, so the baseline can be compared on other (or busier) machines.  The
+exit status is 1 if a result exceeds the baseline by more than the
+threshold for the metric (fractions, e.g., 0.25 for 25%, stored in the
+baseline file or given via --time-threshold and --memory-threshold).
+"""
+
+import argparse
+import copy
+import gc
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+import yaml
+
+import django_yamlconf
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+THRESHOLDS = {'time': 0.25, 'memory': 0.10}
+
+
+def generate(directory, attributes=2000, depth=5, fanout=2, dict_depth=3,
+             files=3, extend=0.1):
+    """
+    Generate a synthetic configuration, returning the list of layered
+    YAMLCONF files written to the directory:
+
+    - "attributes" attributes, in chains of "depth" references, i.e.,
+      each attribute references the previous attribute in its chain,
+    - each attribute also references "fanout" of the BASE_* attributes,
+    - every fourth attribute is a dictionary nested "dict_depth" deep,
+    - the attributes are defined in the first file, each of the later
+      "files" overrides an equal share of the attributes,
+    - a fraction, "extend", of the attributes are lists extended via
+      ":append" and ":prepend" in the later files.
+    """
+    # pylint: disable=too-many-positional-arguments,too-many-arguments
+    layers = [{} for _ in range(max(files, 1))]
+    for k in range(fanout):
+        layers[0][f"BASE_{k}"] = f"{{BASE_DIR}}/base/{k}"
+    bases = "".join(f"/{{BASE_{k}}}" for k in range(fanout))
+    n_lists = int(attributes * extend)
+    for i in range(attributes):
+        name = f"ATTR_{i}"
+        ref = f"{{ATTR_{i - 1}}}" if i % depth else "{BASE_DIR}"
+        if i < n_lists:
+            value = [f"{ref}{bases}", i]
+        elif i % 4 == 3:
+            value = f"{ref}{bases}/{i}"
+            for level in range(dict_depth):
+                value = {f"level_{level}": value, 'size': i}
+            layers[0][f"{name}:doc"] = f"Nested dictionary {i}"
+        else:
+            value = f"{ref}{bases}/{i}"
+        layers[0][name] = value
+        if len(layers) > 1:
+            layer = layers[1 + i % (len(layers) - 1)]
+            if i < n_lists:
+                marker = ":append" if i % 2 else ":prepend"
+                layer[f"{name}{marker}"] = [f"{{BASE_DIR}}/extra/{i}"]
+            elif i % 2:
+                layer[name] = copy.deepcopy(value)
+    filenames = []
+    for index, layer in enumerate(layers):
+        filename = os.path.join(directory, f"layer{index}.yaml")
+        with open(filename, "w", encoding="utf-8") as stream:
+            yaml.safe_dump(layer, stream, sort_keys=False)
+        filenames.append(filename)
+    return filenames
+
+
+def new_settings(directory):
+    """
+    Return a new, empty, settings module.
+    """
+    settings = types.ModuleType("bench_settings")
+    settings.__file__ = os.path.join(directory, "bench", "settings.py")
+    return settings
+
+
+def merged_attributes(directory, filenames):
+    """
+    Return the bootstrap attributes with the data parsed from the YAMLCONF
+    files merged, along with the parsed data.
+    """
+    loader, loader_kwargs = django_yamlconf.get_loader("yaml")
+    data = [
+        (filename, django_yamlconf.read_conffile(
+            loader, loader_kwargs, filename
+        ))
+        for filename in filenames
+    ]
+    attributes = django_yamlconf.bootstrap_attributes(directory)
+    settings = new_settings(directory)
+    for filename, values in data:
+        django_yamlconf.merge_conffile(attributes, settings, filename, values)
+    return attributes, data
+
+
+def cases(directory, filenames):
+    """
+    Return the benchmark cases: the name mapped to a "setup" routine,
+    returning the arguments for the timed routine, and the routine.
+    """
+    attributes, data = merged_attributes(directory, filenames)
+    expanded = copy.deepcopy(attributes)
+    django_yamlconf.expand_attribute_refs(expanded)
+
+    def load_setup():
+        return (new_settings(directory),)
+
+    def load(settings):
+        django_yamlconf.load(
+            settings=settings,
+            conffiles=filenames,
+            snapshot_dir="",
+            lazy=False,
+        )
+
+    def merge_setup():
+        return (
+            django_yamlconf.bootstrap_attributes(directory),
+            new_settings(directory),
+        )
+
+    def merge(bootstrap, settings):
+        for filename, values in data:
+            django_yamlconf.merge_conffile(
+                bootstrap,
+                settings,
+                filename,
+                values
+            )
+
+    def expand_setup():
+        return (copy.deepcopy(attributes),)
+
+    def inject_setup():
+        return (expanded, new_settings(directory))
+
+    return {
+        'load': (load_setup, load),
+        'merge': (merge_setup, merge),
+        'expand': (expand_setup, django_yamlconf.expand_attribute_refs),
+        'inject': (inject_setup, django_yamlconf.inject_attr),
+    }
+
+
+def reference(data):
+    """
+    The reference workload the times are compared to: pure Python work
+    (copying and serializing the parsed data) not using the package, so it
+    tracks the speed of the machine rather than of the code benchmarked.
+    """
+    json.dumps(copy.deepcopy(data))
+
+
+def measure(setup, function, repeat):
+    """
+    Return the median time, in seconds, of "repeat" calls and the peak
+    memory allocated, in bytes, by a further call (traced separately as
+    tracing slows down the code).  As for "timeit", the garbage collector
+    is disabled for the timed calls.
+    """
+    timings = []
+    for _ in range(repeat):
+        args = setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function(*args)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    args = setup()
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def compare(results, baseline, thresholds):
+    """
+    Write the results, compared with the baseline results, returning the
+    list of regressions, i.e., the (case, metric) pairs exceeding the
+    baseline by more than the metric threshold.  Times are compared via
+    their ratios to the reference workload.
+    """
+    regressions = []
+    for name, result in results.items():
+        line = f"{name:<8}"
+        for metric, key, scale, unit in (("time", "ratio", 1000, "ms"),
+                                         ("memory", "memory", 1 / 1024,
+                                          "KiB")):
+            line += f" {result[metric] * scale:10.2f} {unit:<3}"
+            if key != metric:
+                line += f" {result[key]:7.3f}x"
+            base = baseline.get(name, {}).get(key)
+            if not base:
+                line += " " * 16
+                continue
+            change = result[key] / base - 1
+            flag = " "
+            if change > thresholds[metric]:
+                flag = "!"
+                regressions.append((name, metric))
+            line += f" {change * 100:+8.1f}% {flag:<4}"
+        print(line.rstrip())
+    return regressions
+
+
+def main():
+    """
+    Run the benchmark cases, saving the results as the new baseline or
+    comparing them with the stored baseline.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--attributes", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fanout", type=int, default=2)
+    parser.add_argument("--dict-depth", type=int, default=3)
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--extend", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--cases", nargs="+")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true",
+                        help="Save the results as the new baseline")
+    parser.add_argument("--time-threshold", type=float)
+    parser.add_argument("--memory-threshold", type=float)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    os.environ.pop("YAMLCONF_CONFFILE", None)
+    config = {
+        'attributes': args.attributes,
+        'depth': args.depth,
+        'fanout': args.fanout,
+        'dict_depth': args.dict_depth,
+        'files': args.files,
+        'extend': args.extend,
+    }
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)
+    thresholds = dict(THRESHOLDS, **baseline.get('thresholds', {}))
+    if args.time_threshold is not None:
+        thresholds['time'] = args.time_threshold
+    if args.memory_threshold is not None:
+        thresholds['memory'] = args.memory_threshold
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = generate(directory, **config)
+        _, data = merged_attributes(directory, filenames)
+        base_time, _ = measure(lambda: (data,), reference, args.repeat)
+        results = {}
+        for name, (setup, function) in cases(directory, filenames).items():
+            if args.cases and name not in args.cases:
+                continue
+            elapsed, peak = measure(setup, function, args.repeat)
+            results[name] = {
+                'time': elapsed,
+                'ratio': elapsed / base_time,
+                'memory': peak,
+            }
+    print(f"{'reference':<8} {base_time * 1000:7.2f} ms")
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as stream:
+            json.dump({
+                'config': config,
+                'thresholds': thresholds,
+                'python': sys.version.split()[0],
+                'reference': base_time,
+                'results': results,
+            }, stream, indent=2)
+            stream.write("\n")
+        compare(results, {}, thresholds)
+        print(f"Saved the baseline {args.baseline}")
+        return 0
+    if baseline.get('config', config) != config:
+        print(f"The baseline {args.baseline} is for a different"
+              f" configuration: {baseline['config']}")
+        baseline = {}
+    regressions = compare(results, baseline.get('results', {}), thresholds)
+    if regressions:
+        print("Regressions: " + ", ".join(
+            f"{name} {metric}" for name, metric in regressions
+        ))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
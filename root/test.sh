@@ -0,0 +1,3 @@
+#!/bin/bash
+
+echo This is a test script running on vm
\ No newline at end of file
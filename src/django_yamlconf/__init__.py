@@ -9,32 +9,45 @@ Handle YAML based Django settings: load Django settings from YAML files
 based on a Django project name.  See the README.rst for additional
 information.
 """
+# pylint: disable=too-many-lines
 from __future__ import unicode_literals
 
+import collections.abc
 import copy
-import getpass
+import fnmatch
+import functools
 import json
 import logging
-import multiprocessing
 import os
-import platform
+import re
 import sys
 import textwrap
-import traceback
+import threading
+import time
+import types
+
+from django_yamlconf import hooks
+from django_yamlconf.graph import AttributeGraph
 
 __all__ = [
     'add_attributes',
+    'attr_dependencies',
     'defined_attributes',
     'explain',
     'list_attrs',
+    'list_deps',
     'load',
+    'profile_load',
+    'reload',
     'sysfiles',
+    'watch',
     'VERSION',
 ]
 
 __version__ = '1.5.0'
 VERSION = __version__
 V_MAJOR, V_MINOR, V_PATCH = VERSION.split(".", maxsplit=2)
+LIST_FORMATS = ("text", "json", "ndjson", "tsv")
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +57,18 @@ _HIDE_MARKER = ":hide"
 _PREPEND_MARKER = ":prepend"
 _RAW_MARKER = ":raw"
 _YAMLCONF_ATTRIBUTES = "_YAMLCONF_ATTRIBUTES"
+_YAMLCONF_LAZY = "_YAMLCONF_LAZY"
+_YAMLCONF_PROVENANCE = "_YAMLCONF_PROVENANCE"
+_YAMLCONF_VERSION = "_YAMLCONF_VERSION"
+_HISTORY_MODES = ("full", "last", "source", "off")
+_LIST_BATCH = 100
+_TSV_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+_DISCOVERY_CACHE = {}
 
 
 def add_attributes(settings, attributes, source):
@@ -63,6 +88,9 @@ def add_attributes(settings, attributes, source):
 
     """
     cur_attributes = get_cached_attributes(settings)
+    if not isinstance(cur_attributes, dict):
+        # Read-only shared attribute table: use a private copy
+        cur_attributes = dict(cur_attributes.items())
     for key, value in attributes.items():
         set_attr_value(cur_attributes, settings, source, key, value)
     expand_attribute_refs(cur_attributes)
@@ -74,16 +102,260 @@ def add_attr_info(attributes, name, value, source="**INTERNAL**"):
     Initialize a new attribute definition in the internal dict used to
     store the attribute and history of settings from various YAML files.
     """
-    attributes[name] = {
-        'value': value,
-        'evalue': None,
-        'source': source,
-        'doc': [],
-        'history': [],
-        'hide': ('PASSWORD' in name),
+    attributes[name] = AttributeInfo(value, source, 'PASSWORD' in name)
+
+
+class AttributeInfo(collections.abc.Mapping):
+    """
+    The information for an attribute: the value, expanded value ('evalue'),
+    source, position in the source (see ``positions.SourcePosition``, for
+    YAML files), documentation strings, eclipsed values ('history', a list
+    of value and source tuples, most recent first) and whether the value
+    should be hidden.  The documentation and history lists are only
+    allocated when the first entry is added.
+
+    The fields are available as attributes, or via the dictionary interface
+    used by earlier versions, e.g., ``info['value']``, and by the templates.
+    """
+
+    __slots__ = (
+        'value', 'evalue', 'source', 'position', 'hide', '_doc', '_history'
+    )
+    _FIELDS = (
+        'value', 'evalue', 'source', 'position', 'doc', 'history', 'hide'
+    )
+    pending = False
+
+    def __init__(self, value, source, hide=False):
+        self.value = value
+        self.evalue = None
+        self.source = source
+        self.position = None
+        self.hide = hide
+        self._doc = None
+        self._history = None
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+    def __repr__(self):
+        return f"AttributeInfo({dict(self.items())!r})"
+
+    @property
+    def doc(self):
+        """
+        The list of documentation strings (empty tuple if none).
+        """
+        return () if self._doc is None else self._doc
+
+    @doc.setter
+    def doc(self, value):
+        self._doc = list(value) if value else None
+
+    @property
+    def history(self):
+        """
+        The list of eclipsed value and source tuples (empty tuple if none).
+        """
+        return () if self._history is None else self._history
+
+    @history.setter
+    def history(self, value):
+        self._history = list(value) if value else None
+
+    def add_doc(self, docstring):
+        """
+        Add a documentation string (before the existing strings).
+        """
+        if self._doc is None:
+            self._doc = []
+        self._doc.insert(0, docstring)
+
+    def add_history(self, value, source):
+        """
+        Record an eclipsed value and its source (most recent first).
+        """
+        if self._history is None:
+            self._history = []
+        self._history.insert(0, (value, source))
+
+
+class PredefinedInfo(AttributeInfo):
+    """
+    The information for a predefined attribute (see "bootstrap_attributes")
+    whose value is computed by the "factory" function when first used, e.g.,
+    when referenced by another attribute or read via the settings module.
+    The attribute is "pending" until the value is computed.
+    """
+
+    __slots__ = ('_factory', '_value', '_evalue', '_computed')
+
+    def __init__(self, factory, source="**INTERNAL**"):
+        super().__init__(None, source)
+        self._factory = factory
+        self._computed = ()
+
+    def __getstate__(self):
+        # Copies and pickles keep the factory, i.e., do not compute the value
+        return {name: getattr(self, name) for name in _PREDEFINED_STATE}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def pending(self):
+        """
+        True if the value has not been computed.
+        """
+        return self._factory is not None
+
+    @property
+    def computed(self):
+        """
+        The system value computed by the factory, as a 1-tuple, an empty
+        tuple if the value was not computed.  The value of the attribute
+        can later be replaced, e.g., by a YAMLCONF file.
+        """
+        return self._computed
+
+    @property
+    def value(self):
+        """
+        The attribute value, computed on first use.
+        """
+        self.resolve()
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._factory = None
+        self._value = value
+
+    @property
+    def evalue(self):
+        """
+        The expanded attribute value (the value), computed on first use.
+        """
+        self.resolve()
+        return self._evalue
+
+    @evalue.setter
+    def evalue(self, value):
+        self._evalue = value
+
+    def resolve(self):
+        """
+        Compute the value, if pending.
+        """
+        if self._factory is not None:
+            factory, self._factory = self._factory, None
+            self._value = self._evalue = factory()
+            self._computed = (self._value,)
+
+
+_PENDING_VALUE = "**PREDEFINED**"
+_PREDEFINED_STATE = tuple(
+    name for name in AttributeInfo.__slots__ if name not in ('value', 'evalue')
+) + PredefinedInfo.__slots__
+
+
+def attribute_values(attributes):
+    """
+    Return the dictionary of the attribute values (not expanded) used to
+    detect changes, e.g., for snapshot keys.  The values of pending
+    predefined attributes (see "PredefinedInfo") are not computed: these
+    are given as "_PENDING_VALUE", i.e., the system values are assumed to
+    be unchanged for the life of a snapshot, or process.
+    """
+    return {
+        name: _PENDING_VALUE if info.pending else info['value']
+        for name, info in attributes.items()
+    }
+
+
+def computed_values(attributes):
+    """
+    Return the dictionary of the system values computed for predefined
+    attributes (see "PredefinedInfo"), e.g., referenced by other values or
+    used to select bundle sections.  These are checked, rather than all
+    the predefined values, to validate a snapshot.
+    """
+    return {
+        name: info.computed[0] for name, info in attributes.items()
+        if isinstance(info, PredefinedInfo) and info.computed
     }
 
 
+class ResolvedValues(dict):
+    """
+    The dictionary of expanded attribute values used to expand references
+    (see "expand_attributes").  The values of pending predefined attributes
+    are computed, and saved, when first referenced.
+    """
+
+    def __init__(self, attributes, values=()):
+        super().__init__(values)
+        self.attributes = attributes
+
+    def __missing__(self, name):
+        info = self.attributes.get(name)
+        if info is None or not info.pending:
+            raise KeyError(name)
+        self[name] = info['evalue']
+        return self[name]
+
+
+class SelectionContext(collections.abc.Mapping):
+    """
+    The attribute values used to select the sections of YAML bundle files
+    (see ``positions.load``): the bootstrap attribute values, e.g.,
+    "OS_NODE", overridden by the ``YAMLCONF_*`` environment variables,
+    e.g., "YAMLCONF_PROFILE" defines "PROFILE".  The values are fixed
+    before any YAMLCONF file is loaded, i.e., files can be parsed in any
+    order.  Predefined values are computed when first used.
+    """
+
+    def __init__(self, attributes):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._values = {}
+        for name, info in attributes.items():
+            if info.pending:
+                self._pending[name] = info
+            else:
+                self._values[name] = info['value']
+        for name, value in os.environ.items():
+            if name.startswith("YAMLCONF_"):
+                self._values[name[len("YAMLCONF_"):]] = value
+
+    def __getitem__(self, name):
+        if name not in self._values and name in self._pending:
+            with self._lock:
+                if name not in self._values:
+                    self._values[name] = self._pending[name]['value']
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(set(self._values) | set(self._pending))
+
+    def __len__(self):
+        return len(set(self._values) | set(self._pending))
+
+
 def extend_value(name, cur_value, value, append=True):
     """
     Append or prepend (depending on append argument)  the "value" to an
@@ -119,6 +391,75 @@ def extend_value(name, cur_value, value, append=True):
     return [cur_value, value]
 
 
+def attr_dependencies(name, settings=None, reverse=False, recursive=False):
+    """
+    Return the sorted list of attributes referenced by the named attribute
+    via "{NAME}" references (or, if "reverse", the attributes referencing
+    the named attribute).  If "recursive", indirect references are included.
+
+    :param name: the YAMLCONF controlled setting name
+    :param settings: the Django settings module
+    :param reverse: return the attributes referencing the attribute
+    :param recursive: include indirect references
+    :return: list of attribute names, `None` if the attribute is not
+        managed by YAMLCONF
+    """
+    attributes = get_cached_attributes(settings, expand=False)
+    if name not in attributes:
+        return None
+    graph = AttributeGraph(attributes)
+    if recursive:
+        return sorted(graph.closure([name], reverse=reverse))
+    if reverse:
+        return sorted(graph.dependents(name))
+    return sorted(graph.dependencies(name))
+
+
+def attributes_version(settings=None):
+    """
+    Return the fingerprint of the cached attributes, a hash of the
+    attribute definitions (values, sources, documentation, etc.), and the
+    time the attributes were last changed, i.e., loaded, added to or
+    reloaded.  The fingerprint is computed when first requested after a
+    change, it is the same for processes loading the same definitions.
+    This is used to cache, and validate, the pages generated by the
+    YAMLCONF views.
+    """
+    settings = get_cached_settings(settings)
+    attributes = get_cached_attributes(settings, expand=False)
+    version = getattr(settings, _YAMLCONF_VERSION, None)
+    if version is None:
+        version = [time.time(), None]
+        setattr(settings, _YAMLCONF_VERSION, version)
+    if version[1] is None:
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+
+        digest = hashlib.sha256(VERSION.encode("utf-8"))
+        for name in sorted(attributes.keys()):
+            info = attributes[name]
+            digest.update(repr((
+                name,
+                info['value'],
+                info['source'],
+                info['position'],
+                info['hide'],
+                info['doc'],
+            )).encode("utf-8", "backslashreplace"))
+        version[1] = digest.hexdigest()[:32]
+    return version[1], version[0]
+
+
+def attributes_version_computed(settings=None):
+    """
+    Return True if the fingerprint of the cached attributes (see
+    "attributes_version") is computed, i.e., requesting it is cheap.
+    """
+    settings = get_cached_settings(settings)
+    version = getattr(settings, _YAMLCONF_VERSION, (None, None))
+    return version[1] is not None
+
+
 def bootstrap_attributes(base_dir):
     """
     Create the initial attribute set for YAMLCONF.  This set includes values
@@ -126,17 +467,21 @@ def bootstrap_attributes(base_dir):
     attributes are available for attribute references in other values, e.g.,
 
         LOG_DIR: "{BASE_DIR}/log"
+
+    The values requiring system calls, or subprocesses, e.g., "OS_PROCESSOR",
+    are only computed when used (see "PredefinedInfo").
     """
     result = {}
-    add_attr_info(result, 'CPU_COUNT', multiprocessing.cpu_count())
+    result['CPU_COUNT'] = PredefinedInfo(os.cpu_count)
     add_attr_info(result, 'TOP_DIR', os.path.dirname(base_dir))
     add_attr_info(result, 'BASE_DIR', base_dir)
     add_attr_info(result, 'VIRTUAL_ENV', os.environ.get("VIRTUAL_ENV", None))
-    add_attr_info(result, 'USER', getpass.getuser())
+    result['USER'] = PredefinedInfo(_getuser)
 
     for name in ['machine', 'node', 'processor', 'release', 'system']:
-        method = getattr(platform, name)
-        add_attr_info(result, f'OS_{name.upper()}', method())
+        result[f'OS_{name.upper()}'] = PredefinedInfo(
+            functools.partial(_platform_value, name)
+        )
 
     add_attr_info(result, 'PYTHON', {
         'MAJOR': sys.version_info.major,
@@ -149,6 +494,24 @@ def bootstrap_attributes(base_dir):
     return result
 
 
+def _getuser():
+    """
+    Return the user name for the "USER" predefined attribute.
+    """
+    # pylint: disable=import-outside-toplevel
+    import getpass
+    return getpass.getuser()
+
+
+def _platform_value(name):
+    """
+    Return the "platform" module value for the "OS_*" predefined attributes.
+    """
+    # pylint: disable=import-outside-toplevel
+    import platform
+    return getattr(platform, name)()
+
+
 # pylint: disable=unused-argument
 def defined_attributes(settings=None, template_use=False):
     """
@@ -181,7 +544,64 @@ def defined_attributes(settings=None, template_use=False):
     return result
 
 
-def dirtree_find(filename, start_dir):
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def conffile_names(attr_filename, settings_dir, conffiles=None,
+                   discovery=None, cached=True):
+    """
+    Return the list of YAMLCONF files to load: the explicit list of files,
+    if given, otherwise the files found via "find_conffiles", followed by
+    the file named by the YAMLCONF_CONFFILE environment variable, if
+    defined.  Explicitly listed files that cannot be read are reported and
+    ignored.  The files found by earlier searches are used unless "cached"
+    is False.
+    """
+    if conffiles is not None:
+        filenames = []
+        for filename in conffiles:
+            if os.access(filename, os.R_OK):
+                filenames.append(filename)
+            else:
+                logger.error('Cannot read the YAMLCONF file "%s"', filename)
+    else:
+        filenames = find_conffiles(
+            attr_filename,
+            settings_dir,
+            discovery,
+            cached
+        )
+    final_conf = os.environ.get("YAMLCONF_CONFFILE", None)
+    if final_conf:
+        filenames.append(final_conf)
+    return filenames
+
+
+def dirtree_dirs(start_dir, stop_dir=None, max_depth=None, root_markers=()):
+    """
+    Iterator generating the directories searched for YAMLCONF files: the
+    start_dir and its parent directories up to the root directory of the
+    file system.  The search stops at the "stop_dir" directory, after
+    "max_depth" parent directories, or at the first directory containing
+    one of the "root_markers", e.g., ".git", whichever comes first.
+    """
+    curdir = os.path.abspath(start_dir or os.getcwd())
+    stop_dir = os.path.abspath(stop_dir) if stop_dir else None
+    depth = 0
+    done = False
+    while not done:
+        yield curdir
+        newdir = os.path.dirname(curdir)
+        done = newdir == curdir or curdir == stop_dir or \
+            (max_depth is not None and depth >= max_depth) or \
+            any(
+                os.path.exists(os.path.join(curdir, marker))
+                for marker in root_markers
+            )
+        curdir = newdir
+        depth += 1
+
+
+def dirtree_find(filename, start_dir, stop_dir=None, max_depth=None,
+                 root_markers=()):
     """
     Iterator generating the instances of the given file name from the
     start_dir upto the root directory of the file system, e.g., the
@@ -190,16 +610,52 @@ def dirtree_find(filename, start_dir):
         /u/mrohan/clients/curwork/lib/python/xmpl.yaml
         /u/mrohan/clients/xmpl.yaml
         /u/mrohan/xmpl.yaml
+
+    The search can be bounded, see "dirtree_dirs".
     """
-    curdir = os.path.abspath(start_dir or os.getcwd())
-    done = False
-    while not done:
+    for curdir in dirtree_dirs(start_dir, stop_dir, max_depth, root_markers):
         test_file = os.path.join(curdir, filename)
         if os.access(test_file, os.R_OK):
             yield test_file
-        newdir = os.path.dirname(curdir)
-        done = newdir == curdir
-        curdir = newdir
+
+
+def clear_discovery_cache():
+    """
+    Clear the YAMLCONF files found by "find_conffiles" for the process,
+    e.g., when YAMLCONF files have been added or removed.
+    """
+    _DISCOVERY_CACHE.clear()
+
+
+def find_conffiles(filename, start_dir, discovery=None, cached=True):
+    """
+    Return the list of YAMLCONF files found via "dirtree_find".  The
+    "discovery" dictionary can define the search bounds: the 'stop_dir',
+    'max_depth' and 'root_markers'.
+
+    The files found are remembered for the process: later searches with
+    the same parameters return the same list, without checking the file
+    system, unless "cached" is False (see "clear_discovery_cache").
+    """
+    discovery = dict(discovery or {})
+    stop_dir = discovery.pop('stop_dir', None)
+    max_depth = discovery.pop('max_depth', None)
+    root_markers = tuple(discovery.pop('root_markers', ()))
+    for name in discovery:
+        logger.warning('Unknown YAMLCONF discovery option "%s"', name)
+    start_dir = os.path.abspath(start_dir or os.getcwd())
+    key = (filename, start_dir, stop_dir, max_depth, root_markers)
+    files = _DISCOVERY_CACHE.get(key) if cached else None
+    if files is None:
+        files = list(dirtree_find(
+            filename,
+            start_dir,
+            stop_dir,
+            max_depth,
+            root_markers
+        ))
+        _DISCOVERY_CACHE[key] = files
+    return list(files)
 
 
 def expand_attribute_refs(attributes):
@@ -217,68 +673,165 @@ def expand_attribute_refs(attributes):
     As can be seen from this example, attribute references use the Python
     dictionary formatting syntax to refer to other attributes.
 
-    The routine "expand_attr_helper" is used to recurse over the attribute
-    data.
-    The set of expanded attribute values created is used to set the 'evalue's
-    for each attribute.
+    The routine "expand_attributes" is used to expand the attributes in
+    dependency order.  The set of expanded attribute values created is used
+    to set the 'evalue's for each attribute.
     """
-    values = expand_attr_helper(
-        {key: attributes[key]['value'] for key in attributes.keys()}
-    )
-    for key, value in values.items():
-        attributes[key]['evalue'] = value
+    with hooks.event("expand_attribute_refs") as expand_event:
+        expand_attributes(attributes)
+        expand_event.attributes = len(attributes)
+
+
+def expand_attributes(attributes, names=None, resolved=None, graph=None,
+                      profile=None):
+    """
+    Expand the named attributes (default all), and the attributes they
+    reference, setting the 'evalue' for each attribute.  The attributes are
+    expanded in dependency order (see ``graph.AttributeGraph``), i.e., each
+    string is formatted once, after the attributes it references have been
+    expanded.  Attributes that are part of recursive definitions are
+    reported, with the reference cycle, and are not expanded.
+
+    The "resolved" dictionary maps the names of attributes already expanded
+    to their expanded values.  It is updated with the new expansions and
+    returned.  Pending predefined attributes are not expanded: their
+    values are computed when referenced (see "ResolvedValues").  If a
+    profile is given, the time taken to expand each attribute, and the
+    number of format passes made, are recorded.
+    """
+    graph = graph or AttributeGraph(attributes)
+    resolved = ResolvedValues(attributes) if resolved is None else resolved
+    results = {}
+    order, cycles = graph.order(names, resolved)
+    for name in order:
+        info = attributes[name]
+        if info.pending:
+            continue
+        if name in cycles:
+            logger.error(
+                'Recursive definition for "%s": %s',
+                name,
+                " -> ".join(cycles[name])
+            )
+            info['evalue'] = copy.deepcopy(info['value'])
+        elif graph.is_raw(name):
+            info['evalue'] = copy.deepcopy(info['value'])
+        elif profile is None:
+            info['evalue'] = expand_attr_helper(
+                info['value'],
+                f"root[{name}]",
+                resolved,
+                results
+            )
+        else:
+            passes = len(results)
+            start = time.perf_counter()
+            info['evalue'] = expand_attr_helper(
+                info['value'],
+                f"root[{name}]",
+                resolved,
+                results
+            )
+            profile.add_expansion(
+                name,
+                time.perf_counter() - start,
+                len(results) - passes
+            )
+        resolved[name] = info['evalue']
+    return resolved
 
 
-def expand_attr_helper(value, name="root", wrt=None):
+def expand_attr_helper(value, name="root", wrt=None, results=None):
     """
-    Recurse over the attributes loaded expanding references.
+    Recurse over an attribute value expanding references, returning the
+    expanded value (the value given is not modified).
 
     The name parameter is used to generate a path name to the attribute
     in case of errors, gives the user a little more information on which
     attribute has issues.
 
-    The "wrt" (with respect to) is the set of attribute definitions.  This
-    routine recursively expands included dictionaries and lists.  While
-    the "value" to expand traverses down the full attribute set, the "wrt"
-    value is always the top level attribute set.
+    The "wrt" (with respect to) is the set of expanded attribute values
+    used to expand references.  This routine recursively expands included
+    dictionaries and lists.  While the "value" to expand traverses down
+    the full attribute value, the "wrt" value is always the top level
+    attribute set.  Each string is formatted once: references in the values
+    substituted are not expanded.
+
+    The "results" dictionary, if given, maps format strings to their
+    expansions: identical strings, e.g., "{BASE_DIR}/log", are formatted
+    once.  The caller must ensure the "wrt" values referenced do not change
+    while the "results" are used.
     """
-    wrt = wrt or value
+    wrt = value if wrt is None else wrt
     if isinstance(value, dict):
-        for key in value.keys():
-            if not value.get(f"{key}{_RAW_MARKER}", False):
-                value[key] = expand_attr_helper(
-                    value[key],
-                    f"{name}[{key}]",
-                    wrt
-                )
-    elif isinstance(value, list):
-        for i, _ in enumerate(value):
-            value[i] = expand_attr_helper(
-                value[i],
-                f"{name}[{i}]",
-                wrt
-            )
-    elif isinstance(value, str):
-        n_expand = 0
-        done = False
-        while not done:
-            try:
-                new_value = value.format(**wrt)
-                done = new_value == value
-                value = new_value
-            except ValueError:
-                logger.error('Invalid format value "%s" for "%s"', value, name)
-                done = True
-            except KeyError:
-                logger.error('Undefined attribute "%s" in "%s"', value, name)
-                done = True
-            n_expand += 1
-            if n_expand >= 10:
-                logger.error('Recursive definition for "%s"', name)
-                done = True
+        return {
+            key: copy.deepcopy(item)
+            if value.get(f"{key}{_RAW_MARKER}", False)
+            else expand_attr_helper(item, f"{name}[{key}]", wrt, results)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [
+            expand_attr_helper(item, f"{name}[{i}]", wrt, results)
+            for i, item in enumerate(value)
+        ]
+    if isinstance(value, str) and ('{' in value or '}' in value):
+        if results is not None and value in results:
+            return results[value]
+        try:
+            result = value.format_map(wrt)
+            if results is not None:
+                results[value] = result
+            return result
+        except ValueError:
+            logger.error('Invalid format value "%s" for "%s"', value, name)
+        except KeyError:
+            logger.error('Undefined attribute "%s" in "%s"', value, name)
     return value
 
 
+class LazyExpansion:
+    """
+    Expansion of attribute references on first use (the "lazy" option for
+    "load").  The attributes are expanded individually, along with the
+    attributes they reference, via "expand_attributes" when first accessed
+    via the settings module, "get_attr_info", etc.  Expanded values are
+    saved as the attribute 'evalue', i.e., each attribute is expanded at
+    most once.
+    """
+
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self.graph = AttributeGraph(attributes)
+        self.resolved = ResolvedValues(attributes)
+
+    def expand(self, name):
+        """
+        Return the information for the named attribute, expanding the value,
+        if not already expanded.
+        """
+        if name not in self.resolved:
+            expand_attributes(
+                self.attributes,
+                [name],
+                self.resolved,
+                self.graph
+            )
+        return self.attributes[name]
+
+    def expand_all(self):
+        """
+        Expand all the pending attributes.
+        """
+        if len(self.resolved) < len(self.attributes):
+            expand_attributes(
+                self.attributes,
+                None,
+                self.resolved,
+                self.graph
+            )
+
+
 def explain(name, settings=None, stream=None):
     """
     Explain the source for an attribute definition including sources that
@@ -299,9 +852,8 @@ def explain(name, settings=None, stream=None):
         stream.write(f"The setting \"{name}\" is not managed by YAMLCONF\n")
         return
     stream.write("---------------------------\n")
-    stream.write(
-        f"{name} = \"{attr_info['value']}\" (via \"{attr_info['source']}\")\n"
-    )
+    source = format_source(attr_info['source'], attr_info['position'])
+    stream.write(f"{name} = \"{attr_info['value']}\" (via \"{source}\")\n")
     if attr_info['value'] != attr_info['evalue']:
         stream.write(f"{'':{len(name)}} = \"{attr_info['evalue']}\"\n")
     stream.write("\n")
@@ -321,15 +873,49 @@ def explain(name, settings=None, stream=None):
             stream.write(f"    \"{value}\" via \"{source}\"\n")
 
 
+def format_source(source, position=None):
+    """
+    Return the source name for display: the file name and line number for
+    values with a source position.
+    """
+    if position is None:
+        return source
+    return f"{source}:{position.line}"
+
+
 def get_attr_info(name, settings=None):
     """
     Get the information an attribute.
     """
-    attributes = get_cached_attributes(settings)
-    return attributes.get(name, None)
+    attributes = get_cached_attributes(settings, expand=False)
+    if name not in attributes:
+        return None
+    lazy = getattr(get_cached_settings(settings), _YAMLCONF_LAZY, None)
+    info = attributes[name] if lazy is None else lazy.expand(name)
+    if not info['history']:
+        history = rebuild_history(settings)
+        if history is not None:
+            info['history'] = history.get(name, ())
+    return info
 
 
-def get_settings_value(settings, name):
+def get_attr_items(names, settings=None):
+    """
+    Return the list of (name, information) pairs for the given attribute
+    names (names not defined are skipped).  If the attributes were loaded
+    in "lazy" mode, only the given attributes, and the attributes they
+    reference, are expanded.
+    """
+    attributes = get_cached_attributes(settings, expand=False)
+    lazy = getattr(get_cached_settings(settings), _YAMLCONF_LAZY, None)
+    return [
+        (name, attributes[name] if lazy is None else lazy.expand(name))
+        for name in names
+        if name in attributes
+    ]
+
+
+def get_settings_value(settings, name, log_errors=True):
     """
     Get the value of an attribute defined in the settings module.  Dict
     access named attributes, are handled by digging into the dict in the
@@ -340,7 +926,12 @@ def get_settings_value(settings, name):
     result = getattr(settings, components[0], None)
     for component in components[1:]:
         if not isinstance(result, dict):
-            logger.error('Not a dictionary: "%s" at "%s"', name, component)
+            if log_errors:
+                logger.error(
+                    'Not a dictionary: "%s" at "%s"',
+                    name,
+                    component
+                )
             return None
         if component in result:
             result = result[component]
@@ -351,7 +942,8 @@ def get_settings_value(settings, name):
 
 def get_attr_data(attributes, settings, name):
     """
-    Return the dict describing an attribute value loaded from a YAML file.
+    Return the AttributeInfo describing an attribute value loaded from a YAML
+    file.
     If this attribute has not already been seen, a new entry is created for
     it and returned.
     """
@@ -365,43 +957,179 @@ def get_attr_data(attributes, settings, name):
     return attributes[name]
 
 
-def get_cached_attributes(settings=None):
+def get_cached_attributes(settings=None, expand=True):
     """
     When the YAML config files have been loaded, the data associated with
     the attributes defined is "cached" in the settings module via the attribute
-    _YAMLCONF_ATTRIBUTES, this routine returns this cached data.
+    _YAMLCONF_ATTRIBUTES, this routine returns this cached data.  If the
+    attributes were loaded in "lazy" mode, any attributes not yet expanded
+    are expanded (unless "expand" is False).
 
     This routine is used to support the management commands for YAMLCONF.
     """
-    if settings is None:
-        # pylint: disable=import-outside-toplevel
-        from django.conf import settings
+    settings = get_cached_settings(settings)
     if not hasattr(settings, _YAMLCONF_ATTRIBUTES):
         logger.error("No YAMLCONF attributes defined")
         logger.error('"django_yamlconf.load" forgotten in the settings file?')
         setattr(settings, _YAMLCONF_ATTRIBUTES, {})
+    lazy = getattr(settings, _YAMLCONF_LAZY, None)
+    if expand and lazy is not None:
+        lazy.expand_all()
     return getattr(settings, _YAMLCONF_ATTRIBUTES)
 
 
-def get_loader(syntax):
+def get_cached_settings(settings=None):
+    """
+    Return the settings module used to cache the attribute data, defaults to
+    the Django settings.
+    """
+    if settings is None:
+        # pylint: disable=import-outside-toplevel
+        from django.conf import settings
+    return settings
+
+
+def set_cached_attributes(settings, attributes):
+    """
+    Cache the data associated with the attributes in the settings module
+    (see "get_cached_attributes"), recording the time of the change (see
+    "attributes_version").
+    """
+    setattr(settings, _YAMLCONF_ATTRIBUTES, attributes)
+    setattr(settings, _YAMLCONF_VERSION, [time.time(), None])
+
+
+def get_option(settings, name, value=None, default=None):
+    """
+    Return the value of a YAMLCONF load option: the value given as an
+    argument to ``load``, if given, otherwise the value of the
+    ``YAMLCONF_<NAME>`` attribute of the settings module, if defined,
+    otherwise the default value.
+    """
+    if value is not None:
+        return value
+    return getattr(settings, f"YAMLCONF_{name.upper()}", default)
+
+
+def get_loader(syntax, backend=None):
     """
     Return the "load" routine associated with the given file syntax, e.g., the
     "yaml.load" function.  The file syntax is assumed to name a module that
     has a "load" routine which parse an open file and returns dict/list of the
     file contents, e.g., "yaml.load", "json.load".
+
+    The fastest available backend is used (see ``select_loader``), unless
+    a backend is explicitly requested.
     """
+    name, loader, kwargs = select_loader(syntax, backend)
+    if loader is not None:
+        logger.debug('Using the "%s" loader for "%s" files', name, syntax)
+    return loader, kwargs
+
+
+def loads_loader(loads):
+    """
+    Return a "load" routine, parsing an open file, for a module only
+    supporting the parsing of strings, e.g., "orjson.loads".
+    """
+    def loader(stream):
+        return loads(stream.read())
+    return loader
+
+
+def select_loader(syntax, backend=None):
+    """
+    Select the loader backend for the given file syntax.  For the "yaml" and
+    "json" syntaxes, the backends are tried in the order defined by
+    _LOADER_BACKENDS, i.e., the C accelerated "libyaml" safe loader is used
+    in preference to the pure Python safe loader, "orjson" or "ujson" are
+    used in preference to the standard "json" module.  If a backend is given
+    it is used if available, otherwise the default selection is made.
+
+    Other syntaxes name a module with a "load" routine (using the module's
+    "CSafeLoader" or "SafeLoader", if defined).
+
+    :return: the tuple (backend name, load routine, load keyword arguments),
+        the load routine is `None` if no loader is available.
+    """
+    backends = _LOADER_BACKENDS.get(syntax, {})
+    if backend:
+        if backend in backends:
+            result = backends[backend]()
+            if result is not None:
+                return (backend,) + result
+        logger.warning(
+            'YAMLCONF loader backend "%s" not available for "%s"',
+            backend,
+            syntax
+        )
+    for name, factory in backends.items():
+        result = factory()
+        if result is not None:
+            return (name,) + result
     loader = None
     kwargs = {}
     try:
         module = __import__(syntax)
         loader = module.load
-        if hasattr(module, "SafeLoader"):
-            kwargs = {'Loader': getattr(module, "SafeLoader")}
+        for loader_class in ("CSafeLoader", "SafeLoader"):
+            if hasattr(module, loader_class):
+                kwargs = {'Loader': getattr(module, loader_class)}
+                break
     except ImportError as ex:
         logger.error('Unsupported YAMLCONF format "%s": %s', syntax, ex)
     except AttributeError as ex:
         logger.error('Loader "%s" has no "load" method: %s', syntax, ex)
-    return loader, kwargs
+    return syntax, loader, kwargs
+
+
+def _json_loader(module_name):
+    """
+    Return a factory for JSON loader backends: the factory returns `None`
+    if the module is not installed.
+    """
+    def factory():
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            return None
+        if hasattr(module, "load"):
+            return module.load, {}
+        return loads_loader(module.loads), {}
+    return factory
+
+
+def _yaml_loader(loader_class):
+    """
+    Return a factory for YAML loader backends: the factory returns `None`
+    if PyYAML is not installed or the loader class is not available, e.g.,
+    "CSafeLoader" when PyYAML was built without libyaml.
+    """
+    def factory():
+        try:
+            # pylint: disable=import-outside-toplevel
+            import yaml
+        except ImportError:
+            return None
+        if not hasattr(yaml, loader_class):
+            return None
+        # pylint: disable=import-outside-toplevel
+        from django_yamlconf import positions
+        return positions.load, {'Loader': getattr(yaml, loader_class)}
+    return factory
+
+
+_LOADER_BACKENDS = {
+    'yaml': {
+        'libyaml': _yaml_loader("CSafeLoader"),
+        'python': _yaml_loader("SafeLoader"),
+    },
+    'json': {
+        'orjson': _json_loader("orjson"),
+        'ujson': _json_loader("ujson"),
+        'json': _json_loader("json"),
+    },
+}
 
 
 def get_settings():
@@ -415,8 +1143,9 @@ def get_settings():
     name.  Simply return "appname.settings" from the loaded modules in
     "sys.modules".
     """
+    # pylint: disable=protected-access
     app_name = os.path.basename(os.path.dirname(
-        traceback.extract_stack(limit=3)[0][0]
+        sys._getframe(2).f_code.co_filename
     ))
     return sys.modules[
         f"{app_name}.settings"
@@ -431,14 +1160,30 @@ def get_settings_dir(settings):
     module is actually a class, return the __file__ value for the module
     defining the class.
     """
-    path = os.getcwd()
-    if hasattr(settings, "__file__"):
-        path = settings.__file__
-    elif hasattr(settings, "__module__"):
-        path = sys.modules[settings.__module__].__file__
+    path = get_settings_file(settings)
+    if path is None:
+        return os.getcwd()
     return os.path.dirname(path)
 
 
+def get_settings_file(settings):
+    """
+    Return the path to the file defining the settings module (the module
+    named by "SETTINGS_MODULE" for the Django settings object, or the
+    module defining the class if the settings object is a class instance),
+    `None` if it cannot be determined.
+    """
+    if hasattr(settings, "__file__"):
+        return settings.__file__
+    module_name = getattr(settings, "SETTINGS_MODULE", None)
+    if isinstance(module_name, str) and module_name in sys.modules:
+        # The Django "LazySettings" object for the settings module
+        return getattr(sys.modules[module_name], "__file__", None)
+    if hasattr(settings, "__module__"):
+        return getattr(sys.modules[settings.__module__], "__file__", None)
+    return None
+
+
 def inject_attr(attributes, settings):
     """
     When the attributes have been loaded from various YAML files, this
@@ -450,57 +1195,324 @@ def inject_attr(attributes, settings):
     To support the YAMLCONF management commands, the data accumlated on
     the attributes loaded is "cached" in the settings module via the
     attribute name _YAMLCONF_ATTRIBUTES.
+
+    Pending predefined attributes (see "PredefinedInfo") are made available
+    via the module "__getattr__" (see "install_lazy_hooks") if the settings
+    object is a module.
     """
-    setattr(settings, _YAMLCONF_ATTRIBUTES, attributes)
-    for attr in attributes.keys():
-        value = attributes[attr]['evalue']
-        if '.' in attr:
-            # Nested attribute (elements of a dict in the settings file)
-            components = attr.split(".")
-            target = getattr(settings, components[0], {})
-            for key in components[1:-1]:
-                if key not in target:
-                    target[key] = {}
-                target = target[key]
-            if isinstance(target, dict):
-                target[components[-1]] = value
-        elif ':' not in attr:
-            # Attributes with colons (:raw, :hide, etc) are not injected into
-            # the settings module
-            setattr(settings, attr, value)
-
-
-def list_attrs(settings=None, stream=None):
+    with hooks.event("inject_attr") as inject_event:
+        set_cached_attributes(settings, attributes)
+        if getattr(settings, _YAMLCONF_LAZY, None) is not None:
+            setattr(settings, _YAMLCONF_LAZY, None)
+            uninstall_lazy_hooks(settings)
+        pending = [
+            attr for attr in attributes.keys() if attributes[attr].pending
+        ]
+        if pending and isinstance(settings, types.ModuleType):
+            # Predefined values are computed when read via the settings
+            # module
+            install_lazy_hooks(settings, LazyExpansion(attributes), pending)
+        else:
+            pending = ()
+        for attr in attributes.keys():
+            if attr in pending:
+                continue
+            value = attributes[attr]['evalue']
+            if '.' in attr:
+                inject_nested_attr(settings, attr, value)
+            elif ':' not in attr:
+                # Attributes with colons (:raw, :hide, etc) are not injected
+                # into the settings module
+                setattr(settings, attr, value)
+        inject_event.attributes = len(attributes)
+
+
+def inject_lazy(attributes, settings):
+    """
+    The "lazy" version of "inject_attr": the attribute values are expanded
+    and injected on first access.  If the settings object is a module, the
+    top level attributes are made available via a module "__getattr__"
+    (see PEP 562) which expands and sets the attribute value.  For other
+    settings objects, the values must be set and are expanded immediately.
+    Attributes naming dictionary elements are always expanded and injected
+    immediately.
+    """
+    with hooks.event("inject_attr") as inject_event:
+        lazy = LazyExpansion(attributes)
+        set_cached_attributes(settings, attributes)
+        setattr(settings, _YAMLCONF_LAZY, lazy)
+        names = [
+            attr for attr in attributes.keys()
+            if '.' not in attr and ':' not in attr
+        ]
+        if isinstance(settings, types.ModuleType):
+            install_lazy_hooks(settings, lazy, names)
+        else:
+            for attr in names:
+                setattr(settings, attr, lazy.expand(attr)['evalue'])
+        for attr in attributes.keys():
+            if '.' in attr:
+                inject_nested_attr(
+                    settings,
+                    attr,
+                    lazy.expand(attr)['evalue']
+                )
+        inject_event.attributes = len(attributes)
+
+
+def inject_nested_attr(settings, attr, value):
+    """
+    Inject a nested attribute (elements of a dict in the settings file),
+    traversing and creating the supporting dictionaries in the settings
+    module.
+    """
+    components = attr.split(".")
+    target = getattr(settings, components[0], {})
+    for key in components[1:-1]:
+        if key not in target:
+            target[key] = {}
+        target = target[key]
+    if isinstance(target, dict):
+        target[components[-1]] = value
+
+
+def install_lazy_hooks(settings, lazy, names):
+    """
+    Install the module "__getattr__" and "__dir__" functions used to access
+    lazily expanded attributes.  The current module values for the
+    attributes are removed (they are available via the attribute history).
+    Any existing "__getattr__" is used for other names.  The "lazy" object
+    is the ``LazyExpansion``, or shared table, giving the attribute
+    information via its "expand" method.
+    """
+    uninstall_lazy_hooks(settings)
+    module_getattr = getattr(settings, "__getattr__", None)
+    managed = set(names)
+    for name in names:
+        if name in settings.__dict__:
+            delattr(settings, name)
+
+    def lazy_getattr(name):
+        if name in managed:
+            value = lazy.expand(name)['evalue']
+            setattr(settings, name, value)
+            return value
+        if module_getattr is not None:
+            return module_getattr(name)
+        raise AttributeError(
+            f"module {settings.__name__!r} has no attribute {name!r}"
+        )
+
+    def lazy_dir():
+        return sorted(set(settings.__dict__.keys()) | managed)
+
+    lazy_getattr.yamlconf_hooked = module_getattr
+    lazy_getattr.yamlconf_managed = managed
+    settings.__getattr__ = lazy_getattr
+    settings.__dir__ = lazy_dir
+
+
+def uninstall_lazy_hooks(settings):
+    """
+    Remove the module hooks installed by "install_lazy_hooks", if any,
+    restoring the original module "__getattr__".
+    """
+    module_getattr = getattr(settings, "__getattr__", None)
+    if not hasattr(module_getattr, "yamlconf_hooked"):
+        return
+    del settings.__dir__
+    if module_getattr.yamlconf_hooked is None:
+        del settings.__getattr__
+    else:
+        settings.__getattr__ = module_getattr.yamlconf_hooked
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def list_attrs(settings=None, stream=None, fmt="text", pattern=None,
+               source=None, evalue=False):
     """
     Write a list of attributes managed by YAMLCONF to the given stream
     (defaults to ``sys.stdout``).
     Additional information can be printed using the ``explain`` routine.
 
+    The attributes can be selected by name, via a shell style pattern, and
+    by source, the file defining the value (see "list_names").  The list
+    is written a batch of attributes at a time
+    as text, a JSON list, newline delimited JSON or tab separated values
+    (see ``LIST_FORMATS``): records with the name, the value, or expanded
+    value, and the source.
+
     This routine is only used by the YAMLCONF management command ``yclist``.
 
     :param settings: the Django settings module
     :param stream: the stream to write the list text
+    :param fmt: the output format, one of ``LIST_FORMATS``
+    :param pattern: the shell style pattern for the attribute names listed
+    :param source: the source of the attributes listed
+    :param evalue: list the expanded values rather than the values
     :return: `None`
 
     """
     stream = stream or sys.stdout
-    attributes = get_cached_attributes(settings)
+    if fmt not in LIST_FORMATS:
+        logger.error('Invalid YAMLCONF list format "%s"', fmt)
+        return
+    field = "evalue" if evalue else "value"
+    attributes = get_cached_attributes(settings, expand=False)
     if not attributes:
-        stream.write("No YAMLCONF atttributes defined\n")
+        if fmt == "text":
+            stream.write("No YAMLCONF atttributes defined\n")
+        elif fmt == "json":
+            stream.write("[]\n")
         return
-    stream.write("Listing YAMLCONF managed attributes\n\n")
-    # Determine the max attribute name length
-    keylen = 0
-    for name in attributes.keys():
-        keylen = max(keylen, len(name))
-    for name in sorted(attributes.keys()):
-        stream.write(f"{name:<{keylen}}   {attributes[name]['value']}\n")
-    stream.write(
-        "\nUse \"ycexplain\" for more information on individual attributes\n"
-    )
+    names = list_names(attributes, pattern, source)
+    if fmt == "text":
+        stream.write("Listing YAMLCONF managed attributes\n\n")
+    elif fmt == "json":
+        stream.write("[\n")
+    elif fmt == "tsv":
+        stream.write(f"name\t{field}\tsource\n")
+    keylen = max((len(name) for name in names), default=0)
+    pending = None
+    for chunk in list_records(names, field, fmt, keylen, settings):
+        if pending:
+            stream.write(pending)
+        pending = chunk
+    if pending:
+        # The last JSON record is not followed by a comma
+        stream.write(pending[:-2] + "\n" if fmt == "json" else pending)
+    if fmt == "json":
+        stream.write("]\n")
+    elif fmt == "text":
+        stream.write(
+            "\nUse \"ycexplain\" for more information on individual"
+            " attributes\n"
+        )
 
 
-def load(syntax="yaml", settings=None, base_dir=None, project=None):
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def list_names(attributes, pattern=None, source=None):
+    """
+    Return the sorted list of the attribute names matching the shell style
+    pattern (case sensitive), if given, and defined by the source, if
+    given.  The attributes are filtered directly: the search index used by
+    the views (see ``django_yamlconf.search``) computes the fingerprint of
+    the attributes, and so the predefined values, when built.
+    """
+    names = attributes.keys()
+    if pattern:
+        regex = re.compile(fnmatch.translate(pattern))
+        names = [name for name in names if regex.match(name)]
+    if source is not None:
+        names = [
+            name for name in names
+            if str(attributes[name]['source']) == source
+        ]
+    return sorted(names)
+
+
+def list_records(names, field, fmt, keylen=0, settings=None):
+    """
+    Generate the listing of the named attributes, for the "list_attrs"
+    format, a batch of attributes at a time.  Only the attributes of the
+    batch are expanded, if loaded in "lazy" mode.
+    """
+    separator = ",\n" if fmt == "json" else "\n"
+    for start in range(0, len(names), _LIST_BATCH):
+        lines = []
+        for name, info in get_attr_items(
+                names[start:start + _LIST_BATCH],
+                settings):
+            if fmt == "text":
+                lines.append(f"{name:<{keylen}}   {info[field]}\n")
+            elif fmt == "tsv":
+                lines.append("\t".join(
+                    tsv_field(value)
+                    for value in (name, info[field], info['source'])
+                ) + "\n")
+            else:
+                lines.append(json.dumps(
+                    {'name': name, field: info[field],
+                     'source': info['source']},
+                    default=str
+                ) + separator)
+        yield "".join(lines)
+
+
+def tsv_field(value):
+    """
+    Return a value as a tab separated values field: strings with the
+    backslash, tab and newline characters escaped, other values as JSON.
+    """
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str)
+    return value.translate(_TSV_ESCAPES)
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def list_deps(name, settings=None, stream=None, recursive=False):
+    """
+    List the attributes referenced by an attribute and the attributes
+    referencing it.  Recursive definitions involving the attribute are
+    reported with the reference cycle.
+
+    This routine is only used by the YAMLCONF management command ``ycdeps``.
+
+    :param name: the YAMLCONF controlled setting name
+    :param settings: the Django settings module
+    :param stream: the stream to write the dependency text (defaults to
+        ``sys.stdout``)
+    :param recursive: include indirect references
+    :return: `None`
+    """
+    stream = stream or sys.stdout
+    attributes = get_cached_attributes(settings, expand=False)
+    if name not in attributes:
+        stream.write(f"The setting \"{name}\" is not managed by YAMLCONF\n")
+        return
+    stream.write("---------------------------\n")
+    stream.write(f"{name} = \"{attributes[name]['value']}\"\n\n")
+    _, cycles = AttributeGraph(attributes).order([name])
+    if name in cycles:
+        stream.write(
+            f"Recursive definition: {' -> '.join(cycles[name])}\n\n"
+        )
+    for title, reverse in (("References", False), ("Referenced by", True)):
+        names = attr_dependencies(name, settings, reverse, recursive)
+        if names:
+            stream.write(f"{title}:\n")
+            for ref in names:
+                stream.write(f"    {ref}\n")
+            stream.write("\n")
+
+
+class _NullPhase:
+    """
+    Context manager used for the phases of loads that are not profiled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def _profile_phase(profile, name):
+    """
+    Return the context manager timing a phase of a load, a no-op if the
+    load is not profiled.
+    """
+    return _NULL_PHASE if profile is None else profile.phase(name)
+
+
+def load(syntax="yaml", settings=None, base_dir=None, project=None,
+         snapshot_dir=None, loader_backend=None, parallel=None,
+         lazy=None, shared=None, reloadable=None, history=None,
+         conffiles=None, discovery=None, profile=None, statsd=None):
     """
     Load the set of YAML files for a Django project.  The simplest usage is
     to call this at the end of a settings file.  In this context, no arguments
@@ -519,25 +1531,190 @@ def load(syntax="yaml", settings=None, base_dir=None, project=None):
         settings module.
     :param project: The "project" is the name of the Django project and
         defaults to the name of the directory containing the settings modules.
+    :param snapshot_dir: If given (or defined via the settings module
+        attribute ``YAMLCONF_SNAPSHOT_DIR``), the directory used to save a
+        snapshot of the fully merged and expanded attributes.  Later loads
+        with unchanged inputs (configuration files, ``YAMLCONF_*``
+        environment variables and bootstrap attributes) inject the
+        snapshot attributes without parsing the configuration files.
+    :param loader_backend: The parser backend to use, e.g., "libyaml" or
+        "python" for YAML files, "orjson", "ujson" or "json" for JSON files
+        (also defined via the settings module attribute
+        ``YAMLCONF_LOADER_BACKEND``).  By default, the fastest available
+        backend is used.
+    :param parallel: The maximum number of threads used to read and parse
+        the YAMLCONF files concurrently (also defined via the settings
+        module attribute ``YAMLCONF_PARALLEL``).  The data parsed is merged
+        in the normal order.  By default, files are parsed one at a time.
+    :param lazy: If True (also defined via the settings module attribute
+        ``YAMLCONF_LAZY``), attribute references are expanded, and the
+        values injected into the settings module, when first accessed
+        rather than for all attributes at load time.
+    :param shared: If True, or the path for the table file, (also defined
+        via the settings module attribute ``YAMLCONF_SHARED``), the final
+        attribute table is written to a read-only memory mapped file used
+        for provenance queries, e.g., ``ycexplain`` and the YAMLCONF views.
+        Worker processes forked by a pre-forking server then share this
+        table rather than each holding a copy.  This implies eager
+        expansion.
+    :param reloadable: If True (also defined via the settings module
+        attribute ``YAMLCONF_RELOADABLE``), the state needed to reload
+        changed YAMLCONF files, via the ``reload`` or ``watch`` functions,
+        is saved.  This implies eager expansion and snapshots are only
+        written, not used.
+    :param history: The eclipsed values recorded for attributes (also
+        defined via the settings module attribute ``YAMLCONF_HISTORY``):
+        "full" (the default) records copies of all eclipsed values, "last"
+        only the most recently eclipsed value, "source" the positions of
+        the eclipsed values in the YAML files (parsed again when displayed)
+        and "off" none.  With "off", the history is rebuilt, by merging the
+        YAMLCONF files again, when first requested, e.g., by ``ycexplain``
+        or the YAMLCONF views.
+    :param conffiles: The explicit list of YAMLCONF files to load (also
+        defined via the settings module attribute ``YAMLCONF_CONFFILES``),
+        in order, instead of the files found by searching the directory
+        tree.  The ``YAMLCONF_CONFFILE`` environment variable still names
+        a final file.
+    :param discovery: The dictionary of bounds for the directory tree
+        search (also defined via the settings module attribute
+        ``YAMLCONF_DISCOVERY``): 'stop_dir', the highest directory searched,
+        'max_depth', the maximum number of parent directories searched, and
+        'root_markers', file names, e.g., ".git", marking the highest
+        directory searched.
+    :param profile: A ``profiling.LoadProfile`` recording the time spent in
+        each phase of the load, the files parsed and the cost of expanding
+        each attribute (see also ``profile_load``).
+    :param statsd: The address of a StatsD server, "host:port" for UDP or
+        the path of a Unix domain socket, (also defined via the settings
+        module attribute ``YAMLCONF_STATSD``) the load metrics are sent to
+        (see ``hooks.StatsdHook``).
     :return: `None`
     """
-    loader, loader_kwargs = get_loader(syntax)
-    if loader is None:
-        return
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
     settings = settings or get_settings()
-    settings_dir = get_settings_dir(settings)
-    base_dir = base_dir or os.path.dirname(settings_dir)
-    project = project or os.path.basename(settings_dir)
-    attr_filename = f"{project}.{syntax}"
-    attributes = bootstrap_attributes(base_dir)
-    for filename in dirtree_find(attr_filename, settings_dir):
-        load_conffile(attributes, settings, loader, loader_kwargs, filename)
-    final_conf = os.environ.get("YAMLCONF_CONFFILE", None)
-    if final_conf:
-        load_conffile(attributes, settings, loader, loader_kwargs, final_conf)
-    load_envdefs(attributes, settings)
-    expand_attribute_refs(attributes)
-    inject_attr(attributes, settings)
+    statsd = get_option(settings, "statsd", statsd)
+    if statsd:
+        hooks.statsd(statsd)
+    with hooks.event("load") as load_event:
+        with _profile_phase(profile, "setup"):
+            loader, loader_kwargs = get_loader(
+                syntax,
+                get_option(settings, "loader_backend", loader_backend)
+            )
+            if loader is None:
+                return
+            settings_dir = get_settings_dir(settings)
+            base_dir = base_dir or os.path.dirname(settings_dir)
+            project = project or os.path.basename(settings_dir)
+            attr_filename = f"{project}.{syntax}"
+            attributes = bootstrap_attributes(base_dir)
+            loader_kwargs = section_kwargs(loader, loader_kwargs, attributes)
+        with _profile_phase(profile, "discovery"):
+            conffiles = get_option(settings, "conffiles", conffiles)
+            discovery = get_option(settings, "discovery", discovery)
+            filenames = conffile_names(
+                attr_filename,
+                settings_dir,
+                conffiles,
+                discovery
+            )
+        load_event.files = len(filenames)
+        shared = get_option(settings, "shared", shared)
+        reloadable = get_option(settings, "reloadable", reloadable, False)
+        lazy = get_option(settings, "lazy", lazy, False) and \
+            not (shared or reloadable)
+        inject = inject_lazy if lazy else inject_attr
+        history = get_option(settings, "history", history, "full")
+        if history not in _HISTORY_MODES:
+            logger.error('Invalid YAMLCONF history mode "%s"', history)
+            history = "full"
+        if getattr(settings, _YAMLCONF_PROVENANCE, None) is not None:
+            setattr(settings, _YAMLCONF_PROVENANCE, None)
+        snapshot_dir = get_option(settings, "snapshot_dir", snapshot_dir)
+        if snapshot_dir:
+            with _profile_phase(profile, "snapshot"):
+                snapshot = load_snapshot(
+                    snapshot_dir,
+                    settings,
+                    (syntax, base_dir, project, bool(lazy), history),
+                    attributes,
+                    filenames
+                )
+            if snapshot['attributes'] is not None and not reloadable:
+                if history == "off":
+                    with _profile_phase(profile, "state"):
+                        save_provenance(
+                            settings,
+                            filenames,
+                            (loader, loader_kwargs),
+                            attributes,
+                            snapshot['attributes']
+                        )
+                with _profile_phase(profile, "injection"):
+                    inject(snapshot['attributes'], settings)
+                load_event.attributes = len(snapshot['attributes'])
+                if shared:
+                    with _profile_phase(profile, "share"):
+                        share_attributes(settings, shared)
+                return
+        bootstrap_names = set(attributes.keys())
+        merge_settings = settings
+        bootstrap = None
+        if reloadable or history == "off":
+            # pylint: disable=import-outside-toplevel
+            from django_yamlconf import reloader
+            bootstrap = copy.deepcopy(attributes)
+            merge_settings = reloader.SettingsBaseline(settings)
+        file_data = merge_conffiles(
+            attributes,
+            merge_settings,
+            filenames,
+            (loader, loader_kwargs),
+            get_option(settings, "parallel", parallel),
+            history,
+            profile
+        )
+        with _profile_phase(profile, "environment"):
+            load_envdefs(attributes, merge_settings, history)
+        with _profile_phase(profile, "state"):
+            if history == "off":
+                save_provenance(
+                    settings,
+                    filenames,
+                    (loader, loader_kwargs),
+                    bootstrap,
+                    baseline=merge_settings
+                )
+            if reloadable:
+                reloader.save_state(
+                    settings,
+                    attr_filename=attr_filename,
+                    settings_dir=settings_dir,
+                    conffiles=conffiles,
+                    discovery=discovery,
+                    loader=loader,
+                    loader_kwargs=loader_kwargs,
+                    bootstrap=bootstrap,
+                    baseline=merge_settings,
+                    files=file_data,
+                    values=attribute_values(attributes),
+                    shared=shared,
+                    history=history
+                )
+        if not lazy:
+            with _profile_phase(profile, "expansion"), \
+                    hooks.event("expand_attribute_refs") as expand_event:
+                expand_attributes(attributes, profile=profile)
+                expand_event.attributes = len(attributes)
+        if snapshot_dir:
+            with _profile_phase(profile, "snapshot"):
+                save_snapshot(snapshot, attributes, settings, bootstrap_names)
+        with _profile_phase(profile, "injection"):
+            inject(attributes, settings)
+        load_event.attributes = len(attributes)
+        if shared:
+            with _profile_phase(profile, "share"):
+                share_attributes(settings, shared)
 
 
 def load_conffile(attributes, settings, loader, loader_kwargs, filename):
@@ -545,29 +1722,147 @@ def load_conffile(attributes, settings, loader, loader_kwargs, filename):
     Load an individual YAML file.  The data loaded is merged into the
     current set of attributes via the "set_attr_value" routine.
     """
+    with hooks.event("load_conffile") as file_event:
+        data = read_conffile(loader, loader_kwargs, filename)
+        merge_conffile(attributes, settings, filename, data)
+        file_event.filename = filename
+        file_event.files = 1
+        file_event.attributes = len(data or ())
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def merge_conffiles(attributes, settings, filenames, loader, parallel=None,
+                    history="full", profile=None):
+    """
+    Read, parse (see "read_conffiles") and merge, in order, the YAMLCONF
+    files into the current set of attributes.  The loader is the tuple of
+    the load routine and its keyword arguments.  The list of (filename,
+    data) pairs for the files is returned.
+    """
+    result = []
+    with _profile_phase(profile, "read"):
+        for file_event, (filename, data) in hooks.each(
+                "load_conffile",
+                read_conffiles(filenames, *loader, parallel, profile)):
+            result.append((filename, data))
+            with _profile_phase(profile, "merge"):
+                merge_conffile(attributes, settings, filename, data, history)
+            file_event.filename = filename
+            file_event.files = 1
+            file_event.attributes = len(data or ())
+    return result
+
+
+def merge_conffile(attributes, settings, filename, data, history="full"):
+    """
+    Merge the data read from a YAML file (see "read_conffile") into the
+    current set of attributes via the "set_attr_value" routine.  If the file
+    could not be parsed (data is `None`), the file is ignored.  The selected
+    sections of bundle files (see ``positions.SectionedData``) are merged
+    in order.
+    """
+    if data is None:
+        return
+    for section in getattr(data, "sections", (data,)):
+        positions = getattr(section, "positions", {})
+        for name, value in section.items():
+            set_attr_value(
+                attributes,
+                settings,
+                filename,
+                name,
+                value,
+                history,
+                positions.get(name)
+            )
+
+
+def section_kwargs(loader, loader_kwargs, attributes):
+    """
+    Return the keyword arguments for the loader: for YAML files, the
+    "select" context (see "SelectionContext") for the sections of bundle
+    files is added.
+    """
+    if getattr(loader, "__module__", None) != "django_yamlconf.positions":
+        return loader_kwargs
+    return dict(loader_kwargs, select=SelectionContext(attributes))
+
+
+def read_conffile(loader, loader_kwargs, filename, profile=None):
+    """
+    Read and parse an individual YAML file.  The data read is returned if
+    it is a dictionary.  Parse errors, and non-dictionary data, are logged
+    and `None` is returned.  If a profile is given, the file size and the
+    read and parse times are recorded.
+    """
     with open(filename, "r", encoding="utf-8") as defs:
         try:
-            data = loader(defs, **loader_kwargs)
+            if profile is None:
+                data = loader(defs, **loader_kwargs)
+            else:
+                with profile.parsing(filename, defs) as contents:
+                    data = loader(contents, **loader_kwargs)
         except Exception as ex:  # pylint: disable=broad-exception-caught
             logger.error('Failed to load "%s": %s', filename, ex)
-            return
+            return None
     if not isinstance(data, dict):
         logger.error(
             '"%s" did not define a dictionary: %s',
             filename,
             type(data)
         )
+        return None
+    return data
+
+
+def read_conffiles(filenames, loader, loader_kwargs, parallel=None,
+                   profile=None):
+    """
+    Generate the (filename, data) pairs for the list of YAML files via
+    the "read_conffile" routine, in the order given.  If "parallel" gives
+    more than one worker, the files are read and parsed concurrently using
+    a thread pool of at most that size.  The results are still generated in
+    the order of the file names, i.e., the order in which they must be
+    merged.
+    """
+    if not parallel or parallel < 2 or len(filenames) < 2:
+        for filename in filenames:
+            yield filename, read_conffile(
+                loader,
+                loader_kwargs,
+                filename,
+                profile
+            )
         return
-    for name, value in data.items():
-        set_attr_value(attributes, settings, filename, name, value)
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=min(parallel, len(filenames)),
+        thread_name_prefix="yamlconf"
+    ) as pool:
+        futures = [
+            pool.submit(
+                read_conffile,
+                loader,
+                loader_kwargs,
+                filename,
+                profile
+            )
+            for filename in filenames
+        ]
+        for filename, future in zip(filenames, futures):
+            yield filename, future.result()
 
 
-def load_envdefs(attributes, settings):
+def load_envdefs(attributes, settings, history="full"):
     """
     Load YAMLCONF attribute definitions from the environment.
     """
-    for name, value in os.environ.items():
-        if name.startswith("YAMLCONF_"):
+    with hooks.event("load_envdefs") as env_event:
+        for name, value in os.environ.items():
+            if not name.startswith("YAMLCONF_"):
+                continue
             attrname = name.replace("YAMLCONF_", "")
             if attributes.get(attrname + ":jsonenv"):
                 try:
@@ -582,24 +1877,252 @@ def load_envdefs(attributes, settings):
                 settings,
                 "**ENVIRONMENT**",
                 attrname,
-                value
+                value,
+                history
             )
+            env_event.attributes += 1
 
 
-def set_attr_value(attributes, settings, filename, name, value):
+def load_snapshot(snapshot_dir, settings, context, bootstrap, filenames):
+    """
+    Look up the snapshot of the attributes for a load.  The snapshot is
+    used if the load inputs are unchanged and the values of the settings
+    module attributes updated via YAMLCONF, and the predefined values
+    computed for the snapshot (see "computed_values"), are the same as when
+    the snapshot was created.  The dictionary returned gives the snapshot
+    'path', 'key' and, for a valid snapshot, the 'attributes' (`None`
+    otherwise).
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import snapshot
+
+    context = (
+        VERSION,
+        getattr(settings, "__name__", type(settings).__name__),
+    ) + tuple(context)
+    settings_file = get_settings_file(settings)
+    key = snapshot.snapshot_key(
+        ([settings_file] if settings_file else []) + filenames,
+        {
+            name: value for name, value in os.environ.items()
+            if name.startswith("YAMLCONF_")
+        },
+        attribute_values(bootstrap),
+        context
+    )
+    result = {
+        'path': snapshot.snapshot_path(snapshot_dir, context),
+        'key': key,
+        'attributes': None,
+    }
+    if key is None:
+        return result
+    data = snapshot.read_snapshot(result['path'], key)
+    if data is None:
+        return result
+    for name, value in data['origins'].items():
+        if get_settings_value(settings, name, log_errors=False) != value:
+            logger.debug(
+                'YAMLCONF snapshot: settings value "%s" changed',
+                name
+            )
+            return result
+    for name, value in data['predefined'].items():
+        if name not in bootstrap or bootstrap[name]['value'] != value:
+            logger.debug(
+                'YAMLCONF snapshot: predefined value "%s" changed',
+                name
+            )
+            return result
+    logger.debug('Using YAMLCONF snapshot "%s"', result['path'])
+    result['attributes'] = data['attributes']
+    return result
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def save_provenance(settings, filenames, loader, bootstrap, attributes=None,
+                    baseline=None):
+    """
+    Save the inputs needed to rebuild the attribute history for settings
+    loaded with the history "off": the YAMLCONF files, the loader and its
+    arguments, the bootstrap attributes and the settings values before
+    any YAMLCONF values were injected.  If the settings values were not
+    recorded while merging (the attributes were loaded from a snapshot),
+    the values for the given attributes are recorded now.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import reloader
+
+    if baseline is None:
+        baseline = reloader.SettingsBaseline(settings)
+        for name in attributes.keys():
+            if ':' not in name:
+                getattr(baseline, name.split(".")[0], None)
+    setattr(settings, _YAMLCONF_PROVENANCE, {
+        'filenames': filenames,
+        'loader': loader,
+        'bootstrap': bootstrap,
+        'baseline': baseline,
+        'history': None,
+    })
+
+
+def save_snapshot(snapshot, attributes, settings, bootstrap_names):
+    """
+    Save the attributes loaded to the snapshot file (see ``load_snapshot``).
+    The settings module values for the attributes defined (prior to the
+    injection of the YAMLCONF values) are saved to verify the settings
+    module is unchanged when using the snapshot, along with the system
+    values computed for predefined attributes.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import snapshot as snapshot_mod
+
+    if snapshot['key'] is None:
+        return
+    origins = {
+        name: get_settings_value(settings, name, log_errors=False)
+        for name in attributes.keys()
+        if name not in bootstrap_names and ':' not in name
+    }
+    snapshot_mod.write_snapshot(
+        snapshot['path'],
+        snapshot['key'],
+        attributes=attributes,
+        origins=origins,
+        predefined=computed_values(attributes)
+    )
+
+
+def share_attributes(settings, path=True):
+    """
+    Replace the attribute data cached in the settings module with a
+    read-only view of the data written to a memory mapped file (see
+    ``snapshot.share_attributes``).  The path is the file to use, if True,
+    an anonymous temporary file is used.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import snapshot
+
+    shared = snapshot.share_attributes(
+        get_cached_attributes(settings),
+        path if isinstance(path, str) else None
+    )
+    if shared is not None:
+        set_cached_attributes(settings, shared)
+        hooked = getattr(
+            getattr(settings, "__getattr__", None),
+            "yamlconf_managed",
+            None
+        )
+        if hooked:
+            # The pending predefined values are read via the shared table,
+            # i.e., the hooks no longer reference the private table
+            install_lazy_hooks(settings, shared, sorted(hooked))
+
+
+def profile_load(settings=None, **kwargs):
+    """
+    Profile a load of the YAMLCONF files for the settings, returning the
+    ``profiling.LoadProfile`` giving the time spent in each phase of the
+    load, the size and parse time of each file and the cost of expanding
+    each attribute.  The load is made into a scratch copy of the settings,
+    i.e., the settings are not changed (see ``profiling.ScratchSettings``).
+
+    :param settings: the Django settings module
+    :param kwargs: the arguments for ``load``, e.g., "project"
+    :return: the ``profiling.LoadProfile`` for the load
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import profiling
+
+    settings = get_cached_settings(settings)
+    profile = profiling.LoadProfile()
+    load(
+        settings=profiling.ScratchSettings(
+            settings,
+            get_settings_file(settings)
+        ),
+        profile=profile,
+        **kwargs
+    )
+    return profile
+
+
+def get_provenance(settings=None):
+    """
+    Return the inputs saved to rebuild the attribute history (see
+    "save_provenance") for settings loaded with the history "off", `None`
+    for other settings.
+    """
+    try:
+        return getattr(get_cached_settings(settings), _YAMLCONF_PROVENANCE)
+    except AttributeError:
+        return None
+
+
+def rebuild_history(settings=None):
+    """
+    Return the dictionary mapping attribute names to their history for
+    settings loaded with the history "off", `None` for other settings.  The
+    history is rebuilt, on first use, by merging the YAMLCONF files again
+    against the settings values saved at load time (the files are read
+    again, changes since the load are reflected in the history).
+    """
+    provenance = get_provenance(settings)
+    if provenance is None:
+        return None
+    if provenance['history'] is None:
+        logger.debug("Rebuilding YAMLCONF attribute history")
+        attributes = copy.deepcopy(provenance['bootstrap'])
+        loader, loader_kwargs = provenance['loader']
+        for filename, data in read_conffiles(
+                provenance['filenames'],
+                loader,
+                loader_kwargs):
+            merge_conffile(attributes, provenance['baseline'], filename, data)
+        load_envdefs(attributes, provenance['baseline'])
+        provenance['history'] = {
+            name: info['history'] for name, info in attributes.items()
+        }
+    return provenance['history']
+
+
+def reload(settings=None):
+    """
+    Reload the YAMLCONF files for settings loaded with the ``reloadable``
+    option.  Only files that changed are parsed again, and only attributes
+    whose values changed, or that reference changed values, are expanded
+    again.  The changed values are updated in the settings module and in
+    Django's settings object, if configured from the settings module.
+
+    :param settings: the Django settings module
+    :return: the set of attribute names whose values changed
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import reloader
+
+    return reloader.reload(settings)
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def set_attr_value(attributes, settings, filename, name, value,
+                   history="full", position=None):
     """
     Set an attribute value loaded from a YAML file.  If the attribute name
     ends with the _DOC_MARKED, the value is the documentation string for the
-    attribute, set the 'doc' key instead.
+    attribute, added to the attribute's 'doc' strings instead.
 
     For regular attributes, the current value is stored in the history of
     loaded values (displayed via the "explain" routine and the "ycexplain"
-    management command).
+    management command), see "record_history".  The position, if given, is
+    the position of the definition in a YAML file (see
+    ``positions.SourcePosition``).
     """
     if name.endswith(_DOC_MARKER):
         name = name[:-len(_DOC_MARKER)]
         attr_data = get_attr_data(attributes, settings, name)
-        attr_data['doc'].insert(0, value)
+        attr_data.add_doc(value)
     elif name.endswith(_HIDE_MARKER):
         name = name[:-len(_HIDE_MARKER)]
         attr_data = get_attr_data(attributes, settings, name)
@@ -607,20 +2130,16 @@ def set_attr_value(attributes, settings, filename, name, value):
     elif name.endswith(_APPEND_MARKER):
         name = name[:-len(_APPEND_MARKER)]
         attr_data = get_attr_data(attributes, settings, name)
-        attr_data['history'].insert(
-            0,
-            (copy.deepcopy(attr_data['value']), attr_data['source'])
-        )
+        record_history(attr_data, history)
         attr_data['source'] = filename
+        attr_data['position'] = extended_position(position)
         attr_data['value'] = extend_value(name, attr_data['value'], value)
     elif name.endswith(_PREPEND_MARKER):
         name = name[:-len(_PREPEND_MARKER)]
         attr_data = get_attr_data(attributes, settings, name)
-        attr_data['history'].insert(
-            0,
-            (copy.deepcopy(attr_data['value']), attr_data['source'])
-        )
+        record_history(attr_data, history)
         attr_data['source'] = filename
+        attr_data['position'] = extended_position(position)
         attr_data['value'] = extend_value(
             name,
             attr_data['value'],
@@ -629,14 +2148,50 @@ def set_attr_value(attributes, settings, filename, name, value):
         )
     else:
         attr_data = get_attr_data(attributes, settings, name)
-        attr_data['history'].insert(
-            0,
-            (copy.deepcopy(attr_data['value']), attr_data['source'])
-        )
+        record_history(attr_data, history)
         attr_data['source'] = filename
+        attr_data['position'] = position
         attr_data['value'] = value
 
 
+def extended_position(position):
+    """
+    Return the position recorded for an ":append" or ":prepend" definition:
+    the text at the position only defines part of the value.
+    """
+    if position is None:
+        return None
+    return position._replace(start=None, end=None)
+
+
+def record_history(attr_data, history="full"):
+    """
+    Record the current value of an attribute, about to be eclipsed, in the
+    attribute history depending on the history mode:
+
+    - "full": all eclipsed values are recorded (deep copied),
+    - "last": only the most recently eclipsed value is recorded (not
+      copied, the merge creates new values rather than modifying values),
+    - "source": values defined by YAML files are recorded as references
+      to the defining text (``positions.SourceSpan``) parsed again when
+      displayed, other values are recorded as for "last",
+    - "off": no history is recorded (see "rebuild_history").
+    """
+    position = attr_data['position']
+    source = format_source(attr_data['source'], position)
+    if history == "full":
+        attr_data.add_history(copy.deepcopy(attr_data['value']), source)
+    elif history == "last":
+        attr_data['history'] = [(attr_data['value'], source)]
+    elif history == "source":
+        value = attr_data['value']
+        if position is not None and position.start is not None:
+            # pylint: disable=import-outside-toplevel
+            from django_yamlconf import positions
+            value = positions.SourceSpan(attr_data['source'], position)
+        attr_data.add_history(value, source)
+
+
 # pylint: disable=too-many-positional-arguments,too-many-arguments
 def sf_init_file(create, noop, attrs, dst_filepath, src_filepath, render=None):
     """
@@ -680,6 +2235,26 @@ def sf_init_file(create, noop, attrs, dst_filepath, src_filepath, render=None):
         )
 
 
+def watch(settings=None, interval=5.0, debounce=1.0, callback=None):
+    """
+    Start a background thread polling the YAMLCONF files, for settings
+    loaded with the ``reloadable`` option, and calling ``reload`` when they
+    change.  Once a change is seen, the reload waits until the files have
+    not changed for the debounce period.
+
+    :param settings: the Django settings module
+    :param interval: the polling interval in seconds
+    :param debounce: the debounce period in seconds
+    :param callback: called with the set of changed attribute names after
+        each reload that changes values
+    :return: the watcher thread, which has a ``stop`` method
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_yamlconf import reloader
+
+    return reloader.watch(settings, interval, debounce, callback)
+
+
 def sysfiles(create, noop, settings, rootdir="", render=None):
     """
     Traverse the sys templates directory expanding files to the destination
@@ -695,9 +2270,13 @@ def sysfiles(create, noop, settings, rootdir="", render=None):
         ``render_to_string``
     :return: `None`
     """
-    attributes = defined_attributes(settings, template_use=True)
-    templates_dir = attributes.get("YAMLCONF_SYSFILES_DIR", None)
-    if templates_dir:
+    with hooks.event("sysfiles") as sysfiles_event:
+        attributes = defined_attributes(settings, template_use=True)
+        sysfiles_event.attributes = len(attributes)
+        templates_dir = attributes.get("YAMLCONF_SYSFILES_DIR", None)
+        if not templates_dir:
+            logger.error("No YAMLCONF_SYSFILES_DIR settings defined")
+            return
         td_len = len(templates_dir)
         for root, _, files in os.walk(templates_dir):
             dst_dir = f"{rootdir}{root[td_len:]}"
@@ -712,5 +2291,4 @@ def sysfiles(create, noop, settings, rootdir="", render=None):
                     src_path,
                     render
                 )
-    else:
-        logger.error("No YAMLCONF_SYSFILES_DIR settings defined")
+                sysfiles_event.files += 1
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Native asynchronous variants of the YAMLCONF views for ASGI deployments,
+see ``django_yamlconf.urls`` (Django 5.1, or later, is required).  The
+views read the cached attribute table directly, i.e., without a thread
+hop.  Pages are served from a small per-process cache of the pages most
+recently served, then the Django cache: templates are only rendered, in
+a thread, for pages not yet cached (index pages are streamed, the rows
+rendered a batch at a time).  The work that can scale with the number
+of attributes, e.g., the API records or the fingerprint of the
+definitions for the ETag and last modified checks (when first requested
+after a change), is run in a thread.
+"""
+
+import collections
+import functools
+import threading
+
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.views.decorators.http import condition
+from django_yamlconf import attributes_version
+from django_yamlconf import attributes_version_computed
+from django_yamlconf import get_cached_attributes
+from django_yamlconf import rebuild_history
+from django_yamlconf import views
+
+MAX_PAGES = 32
+
+_PAGES = collections.OrderedDict()
+_PAGES_LOCK = threading.Lock()
+
+
+def local_page(key):
+    """
+    Return the page cached in this process for the key, `None` if not
+    cached.
+    """
+    with _PAGES_LOCK:
+        content = _PAGES.get(key)
+        if content is not None:
+            _PAGES.move_to_end(key)
+        return content
+
+
+def save_local_page(key, content):
+    """
+    Cache a page in this process, dropping the least recently used pages
+    beyond ``MAX_PAGES``.
+    """
+    with _PAGES_LOCK:
+        _PAGES[key] = content
+        _PAGES.move_to_end(key)
+        while len(_PAGES) > MAX_PAGES:
+            _PAGES.popitem(last=False)
+
+
+def render_page(template, context):
+    """
+    Render a page, the context is a function returning the template
+    context.
+    """
+    return render_to_string(template, context())
+
+
+async def cached_page(key, template, context):
+    """
+    Return the response for a page: the page cached in this process, in
+    the Django cache, or, otherwise, rendered (in a thread) and cached.
+    """
+    cache = views.page_cache()
+    if cache is None:
+        content = await sync_to_async(render_page)(template, context)
+        return HttpResponse(content)
+    content = local_page(key)
+    if content is None:
+        content = await cache.aget(key)
+        if content is None:
+            content = await sync_to_async(render_page)(template, context)
+            await cache.aset(key, content)
+        save_local_page(key, content)
+    return HttpResponse(content)
+
+
+def versioned(view):
+    """
+    Decorator computing the fingerprint of the attribute definitions (see
+    "attributes_version"), in a thread, before the view's ETag and last
+    modified checks: the whole attribute table is hashed when first
+    requested after a change.  Once computed, the checks use it directly,
+    without a thread hop.
+    """
+    @functools.wraps(view)
+    async def versioned_view(request, *args, **kwargs):
+        if not attributes_version_computed():
+            await sync_to_async(attributes_version)()
+        return await view(request, *args, **kwargs)
+    return versioned_view
+
+
+async def thread_chunks(chunks):
+    """
+    Generate the chunks from a synchronous generator, each chunk generated
+    in a thread.
+    """
+    next_chunk = sync_to_async(next)
+    while True:
+        chunk = await next_chunk(chunks, None)
+        if chunk is None:
+            break
+        yield chunk
+
+
+@staff_member_required
+@versioned
+@condition(
+    etag_func=views.index_etag,
+    last_modified_func=views.index_last_modified
+)
+async def index(request):
+    """
+    Generate the main page listing the YAMLCONF definitions matching the
+    search parameters, one page at a time.
+    """
+    params = views.index_params(request)
+    key = views.index_key(params)
+    cache = views.page_cache() if key is not None else None
+    if cache is not None:
+        content = local_page(key)
+        if content is None:
+            content = await cache.aget(key)
+        if content is not None:
+            save_local_page(key, content)
+            return HttpResponse(content)
+    return StreamingHttpResponse(
+        cache_chunks(cache, key, views.index_chunks(params))
+    )
+
+
+async def cache_chunks(cache, key, chunks):
+    """
+    Generate the chunks of a page, each chunk generated in a thread,
+    caching the page, if a cache is given, once all the chunks have been
+    generated.
+    """
+    parts = []
+    async for chunk in thread_chunks(chunks):
+        if cache is not None:
+            parts.append(chunk)
+        yield chunk
+    if cache is not None:
+        content = "".join(parts)
+        await cache.aset(key, content)
+        save_local_page(key, content)
+
+
+@staff_member_required
+@versioned
+@condition(
+    etag_func=views.attr_etag,
+    last_modified_func=views.attr_last_modified
+)
+async def attr_info(request, name):  # pylint: disable=unused-argument
+    """
+    Display the page giving information on an individual attribute.
+    """
+    if name not in get_cached_attributes(expand=False):
+        raise Http404
+    return await cached_page(
+        views.attr_key(name),
+        "yamlconf/attribute.html",
+        lambda: views.attr_context(name)
+    )
+
+
+@staff_member_required
+@versioned
+@condition(
+    etag_func=views.index_etag,
+    last_modified_func=views.index_last_modified
+)
+async def attr_value(request):
+    """
+    Return the value, or a nested value, of an attribute as JSON (see
+    "views.attr_value").
+    """
+    params = views.value_params(request)
+    if params is None:
+        return views.value_invalid()
+    # Large values are walked and sized, and the history is rebuilt,
+    # reading the YAMLCONF files, on first use for settings loaded with the
+    # history "off"
+    record = await sync_to_async(views.value_record)(*params)
+    if record is None:
+        raise Http404
+    return views.value_response(record)
+
+
+async def api_stream(names, fields, fmt):
+    """
+    Generate the content for the attributes API (see "views.api_stream"),
+    the records generated in a thread.
+    """
+    async for chunk in thread_chunks(views.api_stream(names, fields, fmt)):
+        yield chunk
+
+
+@staff_member_required
+@versioned
+@condition(
+    etag_func=views.index_etag,
+    last_modified_func=views.index_last_modified
+)
+async def attributes_api(request, fmt="json"):
+    """
+    Stream the attributes matching the search parameters, with the fields
+    selected, as JSON or NDJSON records.
+    """
+    fields = views.api_fields(request)
+    if fields is None:
+        return views.api_invalid_fields()
+    if "history" in fields:
+        # The history is rebuilt, reading the YAMLCONF files, on first use
+        # for settings loaded with the history "off"
+        await sync_to_async(rebuild_history)()
+    names = await sync_to_async(views.api_names)(request)
+    return StreamingHttpResponse(
+        api_stream(names, fields, fmt),
+        content_type=views.API_TYPES[fmt]
+    )
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+The dependency graph for YAMLCONF attributes defined by the "{NAME}"
+attribute references in the attribute values.  The graph gives the order in
+which attributes need to be expanded (references before the attributes
+using them) and identifies recursive definitions.
+"""
+
+import functools
+import re
+import string
+
+_RAW_MARKER = ":raw"
+_FIELD_SEP = re.compile(r"[.\[]")
+_FORMATTER = string.Formatter()
+
+
+def attr_references(value, refs=None):
+    """
+    Return the set of attribute names referenced by a value, i.e., the
+    names used in "{NAME}" references in strings, recursively for lists
+    and dicts.  Dictionary values with the ":raw" qualifier are skipped.
+    Invalid format strings are ignored (reported when expanded).
+    """
+    refs = set() if refs is None else refs
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not value.get(f"{key}{_RAW_MARKER}", False):
+                attr_references(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            attr_references(item, refs)
+    elif isinstance(value, str) and '{' in value:
+        refs.update(format_fields(value) or ())
+    return refs
+
+
+@functools.lru_cache(maxsize=8192)
+def format_fields(template):
+    """
+    Return the tuple of attribute names referenced by a format string, or
+    `None` if the format string is invalid.  The format strings are parsed
+    once: the results are cached (the same strings are seen when building
+    the graph for each load or reload, and are frequently repeated, e.g.,
+    "{BASE_DIR}/log").
+    """
+    try:
+        return tuple(
+            _FIELD_SEP.split(field, maxsplit=1)[0]
+            for _, field, _, _ in _FORMATTER.parse(template)
+            if field
+        )
+    except ValueError:
+        return None
+
+
+class AttributeGraph:
+    """
+    Dependency graph for a set of attributes (the internal dictionary of
+    attribute information).  The references for an attribute are determined
+    from the attribute's raw 'value' when first needed.
+    """
+
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self._dependencies = {}
+        self._dependents = None
+
+    def dependencies(self, name):
+        """
+        Return the set of (defined) attribute names directly referenced by
+        the named attribute.  Pending predefined attributes, with values
+        computed when first used, do not reference other attributes.
+        """
+        if name not in self._dependencies:
+            refs = set()
+            info = self.attributes.get(name)
+            if info is not None and not self.is_raw(name) and \
+                    not getattr(info, "pending", False):
+                refs = {
+                    ref for ref in attr_references(info['value'])
+                    if ref in self.attributes
+                }
+            self._dependencies[name] = refs
+        return self._dependencies[name]
+
+    def dependents(self, name):
+        """
+        Return the set of attribute names directly referencing the named
+        attribute.
+        """
+        if self._dependents is None:
+            self._dependents = {}
+            for attr in self.attributes.keys():
+                for ref in self.dependencies(attr):
+                    self._dependents.setdefault(ref, set()).add(attr)
+        return self._dependents.get(name, set())
+
+    def closure(self, names, reverse=False):
+        """
+        Return the set of attributes the given names depend on, directly or
+        indirectly, (or, if reverse, the attributes depending on the names),
+        not including the names themselves unless part of a cycle.
+        """
+        edges = self.dependents if reverse else self.dependencies
+        result = set()
+        pending = list(names)
+        while pending:
+            for ref in edges(pending.pop()):
+                if ref not in result:
+                    result.add(ref)
+                    pending.append(ref)
+        return result
+
+    def is_raw(self, name):
+        """
+        Return True if the attribute has the ":raw" qualifier set.
+        """
+        info = self.attributes.get(f"{name}{_RAW_MARKER}")
+        return bool(info is not None and info['value'])
+
+    def order(self, names=None, resolved=()):
+        """
+        Return the order in which to expand the given attributes (default
+        all) and the attributes they reference: references are ordered
+        before the attributes using them.  Attributes in "resolved" are
+        considered already expanded.  The second value returned maps
+        attributes that are part of recursive definitions to the cycle
+        path, e.g., ['X', 'Y', 'X'].
+        """
+        order = []
+        cycles = {}
+        for scc in self.components(names, resolved):
+            if len(scc) > 1 or scc[0] in self.dependencies(scc[0]):
+                members = set(scc)
+                for name in scc:
+                    cycles[name] = self.cycle_path(name, members)
+            order.extend(reversed(scc))
+        return order, cycles
+
+    def components(self, names=None, resolved=()):
+        """
+        Generate the strongly connected components of the graph reachable
+        from the given names (Tarjan's algorithm, iterative to support deep
+        reference chains).  Components are generated with the components
+        they depend on first.
+        """
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        if names is None:
+            names = self.attributes.keys()
+        for root in names:
+            if root in index or root in resolved or \
+                    root not in self.attributes:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.dependencies(root)))]
+            while work:
+                node, refs = work[-1]
+                ref = _successor(node, refs, resolved, index, low, on_stack)
+                if ref is not None:
+                    index[ref] = low[ref] = len(index)
+                    stack.append(ref)
+                    on_stack.add(ref)
+                    work.append((ref, iter(self.dependencies(ref))))
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    scc = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    yield scc
+
+    def cycle_path(self, name, members):
+        """
+        Return the shortest reference path from the named attribute back to
+        itself within the given set of (strongly connected) attributes.
+        """
+        previous = {}
+        pending = [name]
+        while pending:
+            following = []
+            for node in pending:
+                for ref in sorted(self.dependencies(node) & members):
+                    if ref == name:
+                        chain = []
+                        while node != name:
+                            chain.append(node)
+                            node = previous[node]
+                        return [name] + chain[::-1] + [name]
+                    if ref not in previous:
+                        previous[ref] = node
+                        following.append(ref)
+            pending = following
+        return [name, name]
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def _successor(node, refs, resolved, index, low, on_stack):
+    """
+    Return the next reference of the node not yet visited by the components
+    traversal (None once all references are seen), lowering the node's low
+    link for references visited and still on the stack.
+    """
+    for ref in refs:
+        if ref in resolved:
+            continue
+        if ref not in index:
+            return ref
+        if ref in on_stack:
+            low[node] = min(low[node], index[ref])
+    return None
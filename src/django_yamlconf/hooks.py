@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Instrumentation hooks for the YAMLCONF load pipeline.  Callbacks registered
+via ``register`` are called with a ``HookEvent`` when each of the following
+operations completes:
+
+- "load": the complete ``load`` of the YAMLCONF files,
+- "load_conffile": the reading, parsing and merging of a YAMLCONF file,
+- "load_envdefs": the merging of the ``YAMLCONF_*`` environment variables,
+- "expand_attribute_refs": the expansion of the attribute references,
+- "inject_attr": the injection of the attributes into the settings,
+- "sysfiles": the creation of the system files by ``sysfiles``.
+
+The ``StatsdHook`` callback sends the events as StatsD metrics to a local
+UDP or Unix domain socket.  When no callbacks are registered, the cost of
+the hooks is a check of the list of callbacks.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+EVENTS = (
+    "load",
+    "load_conffile",
+    "load_envdefs",
+    "expand_attribute_refs",
+    "inject_attr",
+    "sysfiles",
+)
+
+_CALLBACKS = []
+_LOCK = threading.Lock()
+_STATSD_HOOKS = {}
+
+
+class HookEvent:
+    """
+    The event passed to the hook callbacks: the operation "name", its
+    "duration" in seconds, the number of "files" and "attributes" processed
+    and the number of "errors" logged by YAMLCONF during the operation
+    (errors logged by other threads at the same time are also counted).
+    The "filename" is given for "load_conffile" events.
+    """
+
+    __slots__ = (
+        "name",
+        "duration",
+        "files",
+        "attributes",
+        "errors",
+        "filename",
+        "_started",
+    )
+
+    def __init__(self, name):
+        self.name = name
+        self.duration = None
+        self.files = 0
+        self.attributes = 0
+        self.errors = 0
+        self.filename = None
+        # The start time and error count, None once cancelled
+        self._started = None
+
+    def __enter__(self):
+        self._started = (time.perf_counter(), _ERROR_COUNTER.count)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started is not None:
+            start, errors = self._started
+            self.duration = time.perf_counter() - start
+            self.errors = _ERROR_COUNTER.count - errors
+            fire(self)
+        return False
+
+    def __repr__(self):
+        return (
+            f"HookEvent({self.name!r}, duration={self.duration},"
+            f" files={self.files}, attributes={self.attributes},"
+            f" errors={self.errors})"
+        )
+
+    def cancel(self):
+        """
+        Do not call the callbacks for this event.
+        """
+        self._started = None
+
+
+class _NullEvent:
+    """
+    Event used when no callbacks are registered: the event values set are
+    ignored.
+    """
+
+    name = None
+    duration = None
+    files = 0
+    attributes = 0
+    errors = 0
+    filename = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+    def cancel(self):
+        """
+        Ignored.
+        """
+
+
+_NULL_EVENT = _NullEvent()
+
+
+class _ErrorCounter(logging.Handler):
+    """
+    Logging handler counting the errors logged by YAMLCONF.
+    """
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+_ERROR_COUNTER = _ErrorCounter()
+
+
+class StatsdHook:
+    """
+    Hook callback sending the events as StatsD metrics, e.g., for a "load"
+    event with the default "yamlconf" prefix:
+
+        yamlconf.load.duration:12.415|ms
+        yamlconf.load.files:3|g
+        yamlconf.load.attributes:187|g
+        yamlconf.load.errors:0|c
+
+    The address is either a "host:port" for UDP or the path of a Unix
+    domain (datagram) socket, e.g., "/var/run/statsd.sock".  The metrics
+    for an event are sent as a single datagram.  Failures to send are
+    ignored: metrics must not impact the application.
+    """
+
+    def __init__(self, address="localhost:8125", prefix="yamlconf"):
+        self.address = address
+        self.prefix = prefix
+        self._socket = None
+
+    def __call__(self, hook_event):
+        name = f"{self.prefix}.{hook_event.name}"
+        lines = [
+            f"{name}.duration:{hook_event.duration * 1000:.3f}|ms",
+            f"{name}.files:{hook_event.files}|g",
+            f"{name}.attributes:{hook_event.attributes}|g",
+            f"{name}.errors:{hook_event.errors}|c",
+        ]
+        self.send("\n".join(lines))
+
+    def send(self, payload):
+        """
+        Send a StatsD payload.
+        """
+        # pylint: disable=import-outside-toplevel
+        import socket
+
+        try:
+            if self._socket is None:
+                if self.address.startswith("/"):
+                    self._socket = socket.socket(
+                        socket.AF_UNIX,
+                        socket.SOCK_DGRAM
+                    )
+                    self._socket.connect(self.address)
+                else:
+                    host, port = self.address.rsplit(":", 1)
+                    self._socket = socket.socket(
+                        socket.AF_INET,
+                        socket.SOCK_DGRAM
+                    )
+                    self._socket.connect((host, int(port)))
+                self._socket.setblocking(False)
+            self._socket.send(payload.encode("utf-8"))
+        except (OSError, ValueError) as ex:
+            logger.debug('Failed to send StatsD metrics to "%s": %s',
+                         self.address, ex)
+            self.close()
+
+    def close(self):
+        """
+        Close the socket (a new socket is created for the next event).
+        """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def each(name, items):
+    """
+    Generate (event, item) pairs for the items of an iterable, e.g., the
+    files read: each event covers the time to generate the item and the
+    time the caller spends on it, i.e., until the next item is requested.
+    """
+    if not _CALLBACKS:
+        for item in items:
+            yield _NULL_EVENT, item
+        return
+    iterator = iter(items)
+    while True:
+        with HookEvent(name) as item_event:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                item_event.cancel()
+                return
+            yield item_event, item
+
+
+def event(name):
+    """
+    Return the event, a context manager timing an operation, for the named
+    operation.  The callbacks are called when the operation completes.
+    """
+    if not _CALLBACKS:
+        return _NULL_EVENT
+    return HookEvent(name)
+
+
+def fire(hook_event):
+    """
+    Call the registered callbacks for a completed event.  Callback errors
+    are logged and otherwise ignored.
+    """
+    for callback in list(_CALLBACKS):
+        try:
+            callback(hook_event)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logger.warning('YAMLCONF hook "%r" failed: %s', callback, ex)
+
+
+def register(callback):
+    """
+    Register a callback called with the ``HookEvent`` for each completed
+    operation.  The callback is returned, i.e., this can be used as a
+    decorator.
+    """
+    with _LOCK:
+        if not _CALLBACKS:
+            logging.getLogger("django_yamlconf").addHandler(_ERROR_COUNTER)
+        if callback not in _CALLBACKS:
+            _CALLBACKS.append(callback)
+    return callback
+
+
+def statsd(address, prefix="yamlconf"):
+    """
+    Register, once per address and prefix, and return a ``StatsdHook``.
+    """
+    with _LOCK:
+        key = (address, prefix)
+        if key not in _STATSD_HOOKS:
+            _STATSD_HOOKS[key] = StatsdHook(address, prefix)
+    return register(_STATSD_HOOKS[key])
+
+
+def unregister(callback):
+    """
+    Unregister a callback.
+    """
+    with _LOCK:
+        if callback in _CALLBACKS:
+            _CALLBACKS.remove(callback)
+        if not _CALLBACKS:
+            logging.getLogger("django_yamlconf").removeHandler(_ERROR_COUNTER)
+        for key, hook in list(_STATSD_HOOKS.items()):
+            if hook is callback:
+                hook.close()
+                del _STATSD_HOOKS[key]
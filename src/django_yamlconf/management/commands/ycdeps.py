@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+List the attribute references for settings loaded via the YAMLCONF module.
+"""
+from __future__ import unicode_literals
+
+from django_yamlconf import list_deps
+from django_yamlconf.management.commands import YCBaseCommand
+
+
+class Command(YCBaseCommand):
+    """
+    Implementation class for the "ycdeps" Django management command.
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options for "ycdeps"
+        """
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--recursive',
+            action="store_true",
+            help="Include indirect references"
+        )
+        parser.add_argument(
+            'attribute',
+            nargs="+",
+            help="Attribute to list the references for"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle, i.e., execute, the command given the command line arguments
+        "args" and "options".
+        """
+        super().handle(*args, **options)
+        for name in options['attribute']:
+            list_deps(
+                name,
+                stream=self.stdout,
+                recursive=options['recursive']
+            )
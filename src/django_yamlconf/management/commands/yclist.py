@@ -4,6 +4,7 @@
 """
 List the settings defined via the YAMLCONF module.
 """
+from django_yamlconf import LIST_FORMATS
 from django_yamlconf import list_attrs
 from django_yamlconf.management.commands import YCBaseCommand
 
@@ -13,10 +14,44 @@ class Command(YCBaseCommand):
     Implementation class for the "yclist" Django management command.
     """
 
+    def add_arguments(self, parser):
+        """
+        Add the command line options for "yclist"
+        """
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--format',
+            dest='fmt',
+            choices=LIST_FORMATS,
+            default="text",
+            help="Output format (default text)"
+        )
+        parser.add_argument(
+            '--name',
+            dest='pattern',
+            help="List the attributes matching the shell style pattern,"
+                 " e.g., \"LOGGING.*\""
+        )
+        parser.add_argument(
+            '--source',
+            help="List the attributes defined by the source file"
+        )
+        parser.add_argument(
+            '--evalue',
+            action="store_true",
+            help="List the expanded values"
+        )
+
     def handle(self, *args, **options):
         """
         Handle, i.e., execute, the command given the command line arguments
         "args" and "options".
         """
         super().handle(*args, **options)
-        list_attrs(stream=self.stdout)
+        list_attrs(
+            stream=self.stdout,
+            fmt=options['fmt'],
+            pattern=options['pattern'],
+            source=options['source'],
+            evalue=options['evalue']
+        )
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Profile the loading of the YAMLCONF files for the settings.
+"""
+from __future__ import unicode_literals
+
+from django_yamlconf import profile_load
+from django_yamlconf.management.commands import YCBaseCommand
+
+
+class Command(YCBaseCommand):
+    """
+    Implementation class for the "ycprofile" Django management command.
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options for "ycprofile"
+        """
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--format',
+            choices=("text", "json"),
+            default="text",
+            help="Output format"
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help="Number of the slowest attributes to list"
+        )
+        parser.add_argument(
+            '--project',
+            help="Project name (default the settings directory name)"
+        )
+        parser.add_argument(
+            '--syntax',
+            default="yaml",
+            help="YAMLCONF file syntax"
+        )
+        parser.add_argument(
+            '--cold',
+            action="store_true",
+            help="Do not use, or write, a snapshot"
+        )
+        parser.add_argument(
+            '--eager',
+            action="store_true",
+            help="Expand the attributes even if configured as lazy"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle, i.e., execute, the command given the command line arguments
+        "args" and "options".
+        """
+        super().handle(*args, **options)
+        kwargs = {}
+        if options['cold']:
+            kwargs['snapshot_dir'] = ""
+        if options['eager']:
+            kwargs['lazy'] = False
+        profile = profile_load(
+            syntax=options['syntax'],
+            project=options['project'],
+            **kwargs
+        )
+        if options['format'] == "json":
+            profile.write_json(self.stdout, options['top'])
+        else:
+            profile.write_text(self.stdout, options['top'])
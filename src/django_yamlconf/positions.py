@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Source positions for the attributes defined in YAMLCONF YAML files.  The
+files are parsed via the PyYAML node (compose) interface so the line and
+column of each top level definition are available, at no additional
+parsing cost.
+
+Eclipsed values can then be recorded as references to the text defining
+them (``SourceSpan``), parsed again when displayed, rather than as copies
+of the values.
+
+YAML files can also be "bundles" of several documents (sections), each
+section can be restricted, via a ":select" definition, to hosts, profiles,
+etc.  The documents are composed in turn from the parser events of the
+one stream, so "..." markers and directives are handled by the parser.
+Only the parser events for the ":select" definition are composed for
+sections that are not selected: the rest of the section is scanned and
+parsed, but not composed or constructed.
+"""
+
+import collections
+import fnmatch
+import logging
+import re
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_SELECT_KEY = ":select"
+_WILDCARDS = re.compile(r"[*?[]")
+
+SourcePosition = collections.namedtuple(
+    "SourcePosition",
+    ("line", "column", "start", "end", "indent"),
+)
+SourcePosition.__doc__ = """
+The position of an attribute definition in a YAML file: the line and
+column (starting at 1) of the attribute name and the character offsets of
+the value text along with the column the value starts at.  The offsets are
+`None` if the text does not define the complete value, e.g., ":append"
+definitions.
+"""
+
+
+class PositionedData(dict):
+    """
+    The dictionary of definitions parsed from a YAML file along with the
+    "positions" of the definitions, a dictionary mapping the names to their
+    ``SourcePosition``.
+    """
+
+    def __init__(self, data, positions):
+        super().__init__(data)
+        self.positions = positions
+
+
+class SectionedData(PositionedData):
+    """
+    The definitions parsed from the selected sections of a YAML file with
+    several documents.  The sections are merged, in order, via the
+    "sections" list of ``PositionedData``, the dictionary is the union of
+    the sections (later sections overriding earlier sections).
+    """
+
+    def __init__(self, sections):
+        data = {}
+        positions = {}
+        for section in sections:
+            data.update(section)
+            positions.update(section.positions)
+        super().__init__(data, positions)
+        self.sections = sections
+
+
+class SourceSpan:
+    """
+    Reference to the text defining a value in a YAML file.  The text is
+    read, and parsed, again when the value is needed: if the file changed
+    since it was loaded, the value displayed may not be the value that was
+    loaded.
+    """
+
+    __slots__ = ("filename", "position")
+
+    def __init__(self, filename, position):
+        self.filename = filename
+        self.position = position
+
+    def __repr__(self):
+        return f"SourceSpan({self.filename!r}, {self.position.line})"
+
+    def __str__(self):
+        return str(self.value)
+
+    @property
+    def text(self):
+        """
+        The text defining the value, indented to its original column.
+        """
+        with open(self.filename, "r", encoding="utf-8") as src:
+            contents = src.read()
+        return " " * self.position.indent + \
+            contents[self.position.start:self.position.end]
+
+    @property
+    def value(self):
+        """
+        The value parsed from the text, `None` if the file cannot be read or
+        parsed.
+        """
+        try:
+            return yaml.safe_load(self.text)
+        except (OSError, yaml.YAMLError) as ex:
+            logger.warning(
+                'Failed to read the value at "%s:%d": %s',
+                self.filename,
+                self.position.line,
+                ex
+            )
+            return None
+
+
+class SectionComposer(yaml.composer.Composer):
+    """
+    Compose the documents of a YAML stream from the parser events of a
+    loader (PyYAML or libyaml).  For a document starting with a ":select"
+    definition not selected by the "select" mapping of attribute values
+    (see "selected"), only the ":select" value is composed: the remaining
+    events of the document are read without composing, or constructing,
+    nodes and `None` is returned for the document.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, loader, select):
+        super().__init__()
+        self.loader = loader
+        self.select = select
+        self.check_event = loader.check_event
+        self.peek_event = loader.peek_event
+        self.get_event = loader.get_event
+        self.resolve = loader.resolve
+        self.descend_resolver = loader.descend_resolver
+        self.ascend_resolver = loader.ascend_resolver
+
+    def compose_node(self, parent, index):
+        if parent is None and self.check_event(yaml.MappingStartEvent):
+            return self.compose_section()
+        return super().compose_node(parent, index)
+
+    def compose_section(self):
+        """
+        Compose the mapping node for a document, `None` if the document is
+        not selected.
+        """
+        self.descend_resolver(None, None)
+        start_event = self.get_event()
+        tag = start_event.tag
+        if tag is None or tag == "!":
+            tag = self.resolve(yaml.MappingNode, None, start_event.implicit)
+        node = yaml.MappingNode(
+            tag,
+            [],
+            start_event.start_mark,
+            None,
+            flow_style=start_event.flow_style
+        )
+        if start_event.anchor is not None:
+            self.anchors[start_event.anchor] = node
+        while not self.check_event(yaml.MappingEndEvent):
+            key_node = self.compose_node(node, None)
+            value_node = self.compose_node(node, key_node)
+            if not node.value and is_select_key(key_node) and \
+                    not selected(
+                        self.loader.construct_document(value_node),
+                        self.select
+                    ):
+                while not self.check_event(yaml.DocumentEndEvent):
+                    self.get_event()
+                self.ascend_resolver()
+                return None
+            node.value.append((key_node, value_node))
+        node.end_mark = self.get_event().end_mark
+        self.ascend_resolver()
+        return node
+
+
+def load(stream, Loader, select=None):  # pylint: disable=invalid-name
+    """
+    Load a YAML document, the equivalent of ``yaml.load``.  If the document
+    is a mapping, a ``PositionedData`` dictionary is returned.
+
+    If the stream has several documents, each document is a section of a
+    bundle file and must be a mapping.  A section defining ":select" is
+    only loaded if selected (see "selected") by the "select" mapping of
+    attribute values, other sections are always loaded.  The selected
+    sections are returned as ``SectionedData``.  Sections starting with a
+    ":select" definition not selected are skipped at the parser event
+    level (see ``SectionComposer``).
+    """
+    loader = Loader(stream)
+    try:
+        composer = SectionComposer(loader, select)
+        nodes = []
+        while composer.check_node():
+            nodes.append(composer.get_node())
+        if len(nodes) == 1 and nodes[0] is not None:
+            if not isinstance(nodes[0], yaml.MappingNode):
+                return loader.construct_document(nodes[0])
+            return select_section(loader, nodes[0], select) or \
+                PositionedData({}, {})
+        if len(nodes) < 2:
+            return PositionedData({}, {}) if nodes else None
+        sections = [
+            document_section(loader, node, select)
+            for node in nodes if node is not None
+        ]
+    finally:
+        loader.dispose()
+    return SectionedData([
+        section for section in sections if section is not None
+    ])
+
+
+def document_section(loader, node, select):
+    """
+    Return the ``PositionedData`` for a document node of a bundle, `None`
+    if the section is not selected or the document is empty.
+    """
+    if isinstance(node, yaml.ScalarNode) and node.tag == _NULL_TAG:
+        return None
+    if not isinstance(node, yaml.MappingNode):
+        raise yaml.constructor.ConstructorError(
+            None,
+            None,
+            "expected a mapping for a section",
+            node.start_mark
+        )
+    return select_section(loader, node, select)
+
+
+def select_section(loader, node, select):
+    """
+    Return the ``PositionedData`` for a mapping node, `None` if the
+    document defines ":select" and is not selected.  Only the ":select"
+    value is constructed for sections not selected.
+    """
+    criteria = select_node(node)
+    if criteria is not None:
+        if not selected(loader.construct_document(criteria), select):
+            return None
+    data = loader.construct_document(node)
+    if not isinstance(data, dict):
+        return data
+    data.pop(_SELECT_KEY, None)
+    return PositionedData(data, node_positions(node))
+
+
+def select_node(node):
+    """
+    Return the value node for the ":select" key of a mapping node, `None`
+    if the document does not define ":select".
+    """
+    for key_node, value_node in node.value:
+        if is_select_key(key_node):
+            return value_node
+    return None
+
+
+def is_select_key(node):
+    """
+    Return True if a key node is the ":select" key.
+    """
+    return isinstance(node, yaml.ScalarNode) and node.value == _SELECT_KEY
+
+
+def selected(criteria, select):
+    """
+    Return True if a section is selected: the ":select" criteria map
+    attribute names to a pattern, or list of patterns, (``fnmatch`` style,
+    e.g., "web-*") and all attribute values (in the "select" mapping) must
+    match one of the patterns.
+    """
+    if not isinstance(criteria, dict):
+        logger.error('Invalid YAMLCONF section selection: %s', criteria)
+        return False
+    for name, patterns in criteria.items():
+        if select is None or name not in select:
+            return False
+        if not isinstance(patterns, list):
+            patterns = [patterns]
+        value = str(select[name])
+        if not any(match_pattern(value, str(pattern))
+                   for pattern in patterns):
+            return False
+    return True
+
+
+def match_pattern(value, pattern):
+    """
+    Return True if the value matches the ``fnmatch`` style pattern.  Plain
+    patterns are compared directly (``fnmatch`` compiles a regular
+    expression for each pattern, e.g., each host name of a bundle).
+    """
+    if _WILDCARDS.search(pattern) is None:
+        return value == pattern
+    return fnmatch.fnmatchcase(value, pattern)
+
+
+def node_positions(node):
+    """
+    Return the dictionary of ``SourcePosition`` for the string keys of a
+    mapping node.
+    """
+    positions = {}
+    for key_node, value_node in node.value:
+        if isinstance(key_node, yaml.ScalarNode) and key_node.tag == _STR_TAG:
+            positions[key_node.value] = SourcePosition(
+                key_node.start_mark.line + 1,
+                key_node.start_mark.column + 1,
+                value_node.start_mark.index,
+                value_node.end_mark.index,
+                value_node.start_mark.column,
+            )
+    return positions
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Profiling of YAMLCONF loads: the time spent in each phase of a load
+(discovery of the YAMLCONF files, reading and parsing, merging, etc.), the
+size of each file parsed and the cost of expanding each attribute.  A
+``LoadProfile`` is filled in by ``load`` when given via the "profile"
+argument, see also ``profile_load`` and the ``ycprofile`` management
+command.
+"""
+
+import contextlib
+import copy
+import io
+import json
+import os
+import time
+
+PHASES = (
+    "setup",
+    "discovery",
+    "snapshot",
+    "read",
+    "merge",
+    "environment",
+    "state",
+    "expansion",
+    "injection",
+    "share",
+)
+
+
+class LoadProfile:
+    """
+    The profile of a single load.  Phase times are exclusive, i.e., the
+    time of nested phases (e.g., "merge" while reading the files) is only
+    included in the nested phase, the sum of the phase times is the total
+    time of the load.  When the files are parsed concurrently, the file
+    read and parse times can add up to more than the "read" phase time.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.files = []
+        self.attributes = {}
+        self._nested = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Context manager timing a phase of the load.  The time is added to
+        any time already recorded for the phase.
+        """
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+
+    @contextlib.contextmanager
+    def parsing(self, filename, stream):
+        """
+        Context manager for parsing a file: the contents of the open file
+        stream are read and the context value is a stream for the contents.
+        The file size, the read and the parse times are recorded.
+        """
+        start = time.perf_counter()
+        size = os.fstat(stream.fileno()).st_size
+        contents = io.StringIO(stream.read())
+        read = time.perf_counter()
+        try:
+            yield contents
+        finally:
+            self.files.append({
+                'filename': filename,
+                'bytes': size,
+                'read': read - start,
+                'parse': time.perf_counter() - read,
+            })
+
+    def add_expansion(self, name, elapsed, passes):
+        """
+        Record the time taken to expand an attribute and the number of
+        format ("str.format_map") passes made.
+        """
+        self.attributes[name] = (elapsed, passes)
+
+    @property
+    def total(self):
+        """
+        The total time of the load (the sum of the phase times).
+        """
+        return sum(self.phases.values())
+
+    @property
+    def format_passes(self):
+        """
+        The total number of format passes made expanding the attributes.
+        """
+        return sum(passes for _, passes in self.attributes.values())
+
+    def slowest(self, count=10):
+        """
+        Return the list of (name, time, format passes) for the given number
+        of attributes that took the longest to expand.
+        """
+        return sorted(
+            ((name,) + info for name, info in self.attributes.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )[:count]
+
+    def as_dict(self, count=10):
+        """
+        Return the profile as a dictionary (as written by "write_json"),
+        listing the given number of slowest attributes.
+        """
+        return {
+            'total': self.total,
+            'phases': dict(
+                (name, self.phases[name]) for name in self.phase_names()
+            ),
+            'files': copy.deepcopy(self.files),
+            'bytes': sum(info['bytes'] for info in self.files),
+            'attributes': len(self.attributes),
+            'format_passes': self.format_passes,
+            'passes': {
+                name: passes for name, (_, passes) in self.attributes.items()
+            },
+            'slowest': [
+                {'name': name, 'time': elapsed, 'format_passes': passes}
+                for name, elapsed, passes in self.slowest(count)
+            ],
+        }
+
+    def phase_names(self):
+        """
+        Return the names of the phases recorded in load order.
+        """
+        return [name for name in PHASES if name in self.phases] + sorted(
+            name for name in self.phases if name not in PHASES
+        )
+
+    def write_json(self, stream, count=10):
+        """
+        Write the profile as a JSON document.
+        """
+        stream.write(
+            json.dumps(self.as_dict(count), indent=2) + "\n"
+        )
+
+    def write_text(self, stream, count=10):
+        """
+        Write the profile as text: the phase times, the files parsed and
+        the slowest attributes to expand.
+        """
+        total = self.total
+        stream.write(f"Total: {total * 1000:.3f} ms\n\n")
+        stream.write("Phases:\n")
+        for name in self.phase_names():
+            elapsed = self.phases[name]
+            percent = 100 * elapsed / total if total else 0.0
+            stream.write(
+                f"    {name:<12} {elapsed * 1000:10.3f} ms {percent:6.1f}%\n"
+            )
+        if self.files:
+            stream.write("\nFiles:\n")
+            for info in self.files:
+                stream.write(
+                    f"    {info['bytes']:10d} bytes"
+                    f" {info['read'] * 1000:10.3f} ms read"
+                    f" {info['parse'] * 1000:10.3f} ms parse"
+                    f"  {info['filename']}\n"
+                )
+        if self.attributes:
+            stream.write(
+                f"\nAttributes: {len(self.attributes)} expanded,"
+                f" {self.format_passes} format passes\n"
+            )
+            for name, elapsed, passes in self.slowest(count):
+                stream.write(
+                    f"    {elapsed * 1000:10.3f} ms {passes:6d} passes"
+                    f"  {name}\n"
+                )
+
+
+class ScratchSettings:
+    """
+    Settings object for profiled loads: values read from the settings are
+    copied, on first access, values set are only set on this object, i.e.,
+    the settings are not changed by the load.  Note the settings values
+    read already include the values injected by the original load, e.g.,
+    ":append" definitions extend the final values (the work done is the
+    same).
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, settings, settings_file):
+        self._settings = settings
+        self.__file__ = settings_file
+        self.__name__ = getattr(settings, "__name__", type(settings).__name__)
+        self._YAMLCONF_LAZY = None  # pylint: disable=invalid-name
+        self._YAMLCONF_PROVENANCE = None  # pylint: disable=invalid-name
+        self._YAMLCONF_RELOAD = None  # pylint: disable=invalid-name
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name == "_settings":
+            raise AttributeError(name)
+        value = copy.deepcopy(getattr(self._settings, name))
+        setattr(self, name, value)
+        return value
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Incremental reloading of the YAMLCONF files for settings loaded with the
+"reloadable" option.  Only files whose modification time, size and content
+hash changed are parsed again.  The attributes whose values changed, and the
+attributes referencing them, are expanded again and updated in the settings
+module (and Django's settings object, if configured).
+
+The ``Watcher`` thread polls the YAMLCONF files (via ``os.stat``, no OS
+specific file notification services are used) reloading the settings when
+a change is seen.
+"""
+
+import copy
+import importlib
+import logging
+import os
+import threading
+
+from django_yamlconf import snapshot
+from django_yamlconf.graph import AttributeGraph
+from django_yamlconf.graph import attr_references
+
+logger = logging.getLogger(__name__)
+
+_YAMLCONF_RELOAD = "_YAMLCONF_RELOAD"
+_RELOAD_LOCK = threading.RLock()
+
+
+class SettingsBaseline:
+    """
+    Wrapper for the settings module used when merging the YAMLCONF files
+    for reloadable settings.  The settings values read are recorded (deep
+    copied) on first access, i.e., before any YAMLCONF values are injected
+    into the settings module, so the merge can be re-run on reload.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.values = {}
+
+    def __getattr__(self, name):
+        if name not in self.values:
+            self.values[name] = copy.deepcopy(getattr(self.settings, name))
+        return self.values[name]
+
+
+class Watcher(threading.Thread):
+    """
+    Background thread polling the YAMLCONF files every "interval" seconds.
+    When a change is seen, the thread waits until no further changes are
+    seen for "debounce" seconds (e.g., a deployment updating several
+    files) before reloading.  The callback, if given, is called with the
+    set of attribute names changed by the reload (errors raised by the
+    callback are logged, the polling continues).
+    """
+
+    def __init__(self, settings=None, interval=5.0, debounce=1.0,
+                 callback=None):
+        super().__init__(name="yamlconf-watcher", daemon=True)
+        self.settings = settings
+        self.interval = interval
+        self.debounce = debounce
+        self.callback = callback
+        self._stopped = threading.Event()
+        self._state = None
+        self._current = None
+
+    def start(self):
+        # The initial signature is taken before returning to the caller:
+        # changes made once "watch" returns are always seen.
+        self._state = get_state(self.settings)
+        if self._state is not None:
+            self._current = inputs_signature(self._state)
+        super().start()
+
+    def run(self):
+        state = self._state
+        if state is None:
+            return
+        current = self._current
+        while not self._stopped.wait(self.interval):
+            latest = inputs_signature(state)
+            if latest == current:
+                continue
+            while not self._stopped.wait(self.debounce):
+                current = latest
+                latest = inputs_signature(state)
+                if latest == current:
+                    break
+            if self._stopped.is_set():
+                break
+            try:
+                changed = reload(self.settings)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("YAMLCONF reload failed")
+                continue
+            if changed and self.callback is not None:
+                try:
+                    self.callback(changed)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("YAMLCONF reload callback failed")
+
+    def stop(self):
+        """
+        Stop the polling thread.
+        """
+        self._stopped.set()
+
+
+def conffile_names(state):
+    """
+    Return the current list of YAMLCONF files for the reloadable settings:
+    the directories are searched again, i.e., added and removed files are
+    seen.
+    """
+    return package().conffile_names(
+        state['attr_filename'],
+        state['settings_dir'],
+        state['conffiles'],
+        state['discovery'],
+        cached=False
+    )
+
+
+def dependents(attributes, names):
+    """
+    Return the set of attributes names that depend on (reference, directly
+    or indirectly) any of the given names, including the names themselves.
+    """
+    graph = AttributeGraph(attributes)
+    result = set(names)
+    for name, info in attributes.items():
+        if not info.pending and attr_references(info['value']) & result:
+            result.add(name)
+    return result | graph.closure(result, reverse=True)
+
+
+def get_state(settings=None):
+    """
+    Return the reload state saved for the settings, logging an error if the
+    settings were not loaded with the "reloadable" option.
+    """
+    settings = package().get_cached_settings(settings)
+    try:
+        return getattr(settings, _YAMLCONF_RELOAD)
+    except AttributeError:
+        logger.error('YAMLCONF attributes not loaded as "reloadable"')
+        return None
+
+
+def inputs_signature(state):
+    """
+    Return the cheap (stat based) signature of the current reload inputs:
+    the YAMLCONF files names, modification times and sizes, along with the
+    YAMLCONF environment variables.
+    """
+    result = []
+    for filename in conffile_names(state):
+        try:
+            stat = os.stat(filename)
+            result.append((filename, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            result.append((filename, None, None))
+    return tuple(result), yamlconf_environ()
+
+
+def save_state(settings, **kwargs):
+    """
+    Save the state needed to reload the settings: the load parameters, the
+    data parsed for each file, the raw attribute values, etc.
+    """
+    files = {}
+    for filename, data in kwargs.pop('files'):
+        files[filename] = {
+            'signature': snapshot.file_signature(filename),
+            'data': data,
+        }
+    kwargs['files'] = files
+    kwargs['environ'] = yamlconf_environ()
+    setattr(settings, _YAMLCONF_RELOAD, kwargs)
+
+
+def package():
+    """
+    Return the django_yamlconf package: the package imports this module,
+    the package is looked up when used rather than imported here.
+    """
+    return importlib.import_module(__package__)
+
+
+def read_changed(state, filenames):
+    """
+    Return the dictionary of file information for the given files, reading
+    and parsing only new or changed files.  The second value returned
+    indicates if any file changed.
+    """
+    files = {}
+    changed = filenames != list(state['files'].keys())
+    for filename in filenames:
+        info = state['files'].get(filename)
+        if info is not None and info['signature'] is not None:
+            try:
+                stat = os.stat(filename)
+                if (stat.st_mtime_ns, stat.st_size) == info['signature'][1:3]:
+                    files[filename] = info
+                    continue
+            except OSError:
+                pass
+        signature = snapshot.file_signature(filename)
+        if info is not None and signature is not None and \
+                signature[3] == info['signature'][3]:
+            files[filename] = dict(info, signature=signature)
+            continue
+        logger.info('Reloading YAMLCONF file "%s"', filename)
+        data = package().read_conffile(
+            state['loader'],
+            state['loader_kwargs'],
+            filename
+        )
+        files[filename] = {
+            'signature': signature,
+            'data': data,
+        }
+        changed = True
+    return files, changed
+
+
+def reload(settings=None):
+    """
+    Reload the YAMLCONF files for settings loaded with the "reloadable"
+    option.  Returns the set of attribute names whose (expanded) values
+    changed.
+    """
+    yamlconf = package()
+    settings = yamlconf.get_cached_settings(settings)
+    with _RELOAD_LOCK:
+        state = get_state(settings)
+        if state is None:
+            return set()
+        environ = yamlconf_environ()
+        if environ != state['environ'] and \
+                'select' in state['loader_kwargs']:
+            # The sections selected in bundle files can depend on the
+            # environment: all files are parsed again
+            state['loader_kwargs'] = yamlconf.section_kwargs(
+                state['loader'],
+                state['loader_kwargs'],
+                state['bootstrap']
+            )
+            state['files'] = {}
+        files, changed = read_changed(state, conffile_names(state))
+        if not changed and environ == state['environ']:
+            return set()
+        attributes = copy.deepcopy(state['bootstrap'])
+        for filename, info in files.items():
+            yamlconf.merge_conffile(
+                attributes,
+                state['baseline'],
+                filename,
+                info['data'],
+                state['history']
+            )
+        yamlconf.load_envdefs(
+            attributes,
+            state['baseline'],
+            state['history']
+        )
+        values = yamlconf.attribute_values(attributes)
+        old_values = state['values']
+        modified = {
+            name for name in set(values) | set(old_values)
+            if name not in values or name not in old_values or
+            values[name] != old_values[name]
+        }
+        changed = update_attributes(
+            settings,
+            attributes,
+            dependents(attributes, modified),
+            modified - set(values)
+        )
+        state.update(files=files, environ=environ, values=values)
+        provenance = yamlconf.get_provenance(settings)
+        if provenance is not None:
+            provenance['history'] = None
+        if state['shared']:
+            yamlconf.share_attributes(settings, state['shared'])
+        logger.info("YAMLCONF reload changed: %s", sorted(changed))
+        return changed
+
+
+def set_setting(settings, name, value, baseline):
+    """
+    Set, or restore the baseline value if the value is the baseline
+    object itself, a setting in the settings module and Django's settings
+    object if configured from this module.
+    """
+    if '.' in name:
+        # Dictionaries are shared with Django's settings object
+        package().inject_nested_attr(settings, name, value)
+        return
+    if value is baseline:
+        if name in baseline.values:
+            value = baseline.values[name]
+        else:
+            if hasattr(settings, name):
+                delattr(settings, name)
+            update_django_settings(settings, name, None, delete=True)
+            return
+    setattr(settings, name, value)
+    update_django_settings(settings, name, value)
+
+
+def update_attributes(settings, attributes, expand, removed):
+    """
+    Expand the given attribute names and update the settings for values that
+    changed.  Other attributes re-use their current expanded values.
+    Pending predefined attributes whose definition is unchanged re-use their
+    current information: their values are not computed by the reload.
+    """
+    yamlconf = package()
+    old_attributes = yamlconf.get_cached_attributes(settings)
+    predefined = set()
+    for name, info in attributes.items():
+        old_info = old_attributes.get(name)
+        if info.pending and isinstance(old_info, yamlconf.PredefinedInfo) \
+                and old_info['source'] == info['source']:
+            attributes[name] = old_info
+            predefined.add(name)
+    resolved = yamlconf.ResolvedValues(attributes, {
+        name: old_attributes[name]['evalue']
+        for name in attributes
+        if name not in expand and name not in predefined and
+        name in old_attributes and not old_attributes[name].pending
+    })
+    yamlconf.expand_attributes(attributes, resolved=resolved)
+    changed = set(removed)
+    for name, info in attributes.items():
+        if name in predefined:
+            continue
+        info['evalue'] = resolved[name]
+        old_info = old_attributes.get(name)
+        if old_info is None or old_info.pending or \
+                old_info['evalue'] != info['evalue']:
+            changed.add(name)
+    yamlconf.set_cached_attributes(settings, attributes)
+    baseline = get_state(settings)['baseline']
+    for name in sorted(changed):
+        if ':' in name:
+            continue
+        if name in attributes:
+            set_setting(settings, name, attributes[name]['evalue'], baseline)
+        elif '.' in name:
+            set_setting(
+                settings,
+                name,
+                yamlconf.get_settings_value(baseline, name, False),
+                baseline
+            )
+        else:
+            set_setting(settings, name, baseline, baseline)
+    return changed
+
+
+def update_django_settings(settings, name, value, delete=False):
+    """
+    Update Django's settings object if it was configured from the given
+    settings module: the Django settings copies the settings module values
+    when configured.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from django.conf import settings as django_settings
+    except ImportError:
+        return
+    if not django_settings.configured or \
+            getattr(django_settings, "SETTINGS_MODULE", None) != \
+            getattr(settings, "__name__", None):
+        return
+    if delete:
+        if hasattr(django_settings, name):
+            delattr(django_settings, name)
+    else:
+        setattr(django_settings, name, value)
+
+
+def watch(settings=None, interval=5.0, debounce=1.0, callback=None):
+    """
+    Start, and return, a ``Watcher`` thread reloading the settings when the
+    YAMLCONF files change.
+    """
+    watcher = Watcher(settings, interval, debounce, callback)
+    watcher.start()
+    return watcher
+
+
+def yamlconf_environ():
+    """
+    Return the dictionary of YAMLCONF environment variables.
+    """
+    return {
+        name: value for name, value in os.environ.items()
+        if name.startswith("YAMLCONF_")
+    }
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Search index for the YAMLCONF attribute names used by the YAMLCONF views
+to filter the attributes listed.  The index is built once for each version
+of the attribute table (see ``django_yamlconf.attributes_version``):
+
+- prefix searches are binary searches of the sorted names,
+- glob searches, e.g., "LOGGING.handlers.*", are binary searches for the
+  literal prefix of the pattern, with the names in that range matched,
+- substring searches (ignoring case) search the single string of all the
+  names, i.e., the names are not scanned one at a time in Python,
+- the names for each source (the file defining the value) are recorded.
+"""
+
+import bisect
+import fnmatch
+import re
+import threading
+
+import django_yamlconf
+
+MODES = ("substring", "prefix", "glob")
+
+_YAMLCONF_INDEX = "_YAMLCONF_INDEX"
+_WILDCARDS = re.compile(r"[*?[]")
+_LOCK = threading.Lock()
+
+
+class AttributeIndex:
+    """
+    Index of the attribute names of an attribute table: the sorted list of
+    names, the lower case names as a single newline separated string with
+    the offset of each name, and the names (as indexes into the list of
+    names) for each source.
+    """
+
+    def __init__(self, attributes):
+        self.names = sorted(attributes.keys())
+        self._text = "\n".join(self.names).lower()
+        self._starts = []
+        offset = 0
+        for name in self.names:
+            self._starts.append(offset)
+            offset += len(name) + 1
+        self._sources = {}
+        for index, name in enumerate(self.names):
+            source = str(attributes[name]['source'])
+            self._sources.setdefault(source, []).append(index)
+
+    @property
+    def sources(self):
+        """
+        The sorted list of sources.
+        """
+        return sorted(self._sources)
+
+    def glob(self, pattern):
+        """
+        Return the indexes of the names matching a shell style pattern
+        (case sensitive).
+        """
+        prefix = _WILDCARDS.split(pattern, maxsplit=1)[0]
+        if prefix == pattern:
+            return [
+                index for index in self.prefix(pattern)
+                if self.names[index] == pattern
+            ]
+        regex = re.compile(fnmatch.translate(pattern))
+        return [
+            index for index in self.prefix(prefix)
+            if regex.match(self.names[index])
+        ]
+
+    def prefix(self, prefix):
+        """
+        Return the indexes of the names starting with the prefix (case
+        sensitive).
+        """
+        low = bisect.bisect_left(self.names, prefix)
+        if not prefix:
+            return list(range(low, len(self.names)))
+        high = bisect.bisect_left(
+            self.names,
+            prefix[:-1] + chr(ord(prefix[-1]) + 1),
+            low
+        )
+        return list(range(low, high))
+
+    def search(self, query="", mode=None, source=None):
+        """
+        Return the sorted list of names matching the query, using the given
+        mode ("substring", "prefix" or "glob", by default "glob" if the
+        query includes wildcard characters, otherwise "substring"), and
+        defined by the source, if given.
+        """
+        if mode is None:
+            mode = "glob" if _WILDCARDS.search(query) else "substring"
+        if mode not in MODES:
+            raise ValueError(f'Invalid search mode "{mode}"')
+        if source is not None:
+            matches = self._sources.get(source, [])
+            if query:
+                selected = set(getattr(self, mode)(query))
+                matches = [index for index in matches if index in selected]
+        elif query:
+            matches = getattr(self, mode)(query)
+        else:
+            return list(self.names)
+        return [self.names[index] for index in matches]
+
+    def substring(self, text):
+        """
+        Return the indexes of the names containing the text (ignoring case).
+        """
+        text = text.lower()
+        result = []
+        if "\n" in text:
+            return result
+        position = self._text.find(text)
+        while position >= 0:
+            index = bisect.bisect_right(self._starts, position) - 1
+            result.append(index)
+            if index + 1 >= len(self._starts):
+                break
+            position = self._text.find(text, self._starts[index + 1])
+        return result
+
+
+def get_index(settings=None):
+    """
+    Return the ``AttributeIndex`` for the cached attributes, building the
+    index when first requested for the current version of the attributes.
+    """
+    settings = django_yamlconf.get_cached_settings(settings)
+    fingerprint, _ = django_yamlconf.attributes_version(settings)
+    # The (fingerprint, index) pair, (None, None) if not yet built
+    cached = getattr(settings, _YAMLCONF_INDEX, (None, None))
+    if cached[0] != fingerprint:
+        with _LOCK:
+            cached = getattr(settings, _YAMLCONF_INDEX, (None, None))
+            if cached[0] != fingerprint:
+                cached = (
+                    fingerprint,
+                    AttributeIndex(
+                        django_yamlconf.get_cached_attributes(
+                            settings,
+                            expand=False
+                        )
+                    )
+                )
+                setattr(settings, _YAMLCONF_INDEX, cached)
+    return cached[1]
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2018-2025, Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Support for on-disk snapshots of the fully merged and expanded YAMLCONF
+attribute table.  A snapshot is keyed by the inputs used to create it: the
+configuration files (path, modification time, size and content hash), the
+``YAMLCONF_*`` environment variables and the bootstrap attributes.  The
+system values computed on first use, e.g., "USER" or "OS_PROCESSOR", are
+not part of the key: the values computed while creating a snapshot are
+saved with it and only these are computed, and compared, on a warm start.
+A warm start with unchanged inputs can then skip the parsing and
+expansion of the configuration files.
+
+The snapshot files are Python pickles: the snapshot directory must only be
+writable by trusted users.
+
+This module also supports sharing the final attribute table between the
+worker processes of pre-forking application servers: the table is written
+once, by the master process, to a read-only memory mapped file.  Lookups
+of individual attributes unpickle just that attribute's data, so workers do
+not hold their own copies of the table.
+"""
+
+import collections.abc
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_FORMAT = 4
+_TABLE_MAGIC = b"YCTABLE1"
+_TABLE_HEADER = struct.Struct("<8sQQ")
+
+
+class SharedAttributes(collections.abc.Mapping):
+    """
+    Read-only mapping of attribute names to the attribute information
+    backed by a memory mapped table written by ``share_attributes``.  Each
+    lookup returns a new copy of the attribute information: changes to the
+    values returned are not saved.  The index of attribute names is read
+    on first use, i.e., in the worker process.
+    """
+
+    def __init__(self, table, path=None):
+        self.path = path
+        self._table = table
+        self._index = None
+
+    def __getitem__(self, name):
+        offset, length = self.index[name]
+        return pickle.loads(self._table[offset:offset + length])
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def expand(self, name):
+        """
+        Return the information for the named attribute: the attributes are
+        expanded before the table is shared, the values of pending
+        predefined attributes are computed for the copy returned (see
+        ``django_yamlconf.LazyExpansion``).
+        """
+        return self[name]
+
+    @property
+    def index(self):
+        """
+        The dictionary mapping attribute names to record offset and length.
+        """
+        if self._index is None:
+            magic, offset, length = _TABLE_HEADER.unpack_from(self._table)
+            if magic != _TABLE_MAGIC:
+                raise ValueError("Invalid YAMLCONF attribute table")
+            self._index = pickle.loads(self._table[offset:offset + length])
+        return self._index
+
+
+def share_attributes(attributes, path=None):
+    """
+    Write the attribute table to a file and return a ``SharedAttributes``
+    mapping for the table memory mapped read-only.  If no path is given, a
+    temporary file is used and removed once mapped.  The file is written
+    atomically (see ``write_snapshot``).  If the table cannot be written,
+    the error is logged and `None` is returned.
+    """
+    tmp_path = None
+    try:
+        records = []
+        index = {}
+        offset = _TABLE_HEADER.size
+        for name, info in attributes.items():
+            record = pickle.dumps(info, protocol=pickle.HIGHEST_PROTOCOL)
+            index[name] = (offset, len(record))
+            records.append(record)
+            offset += len(record)
+        index_data = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) if path else None,
+            prefix=".yamlconf-",
+            suffix=".table"
+        )
+        with os.fdopen(fd, "wb") as dest:
+            dest.write(_TABLE_HEADER.pack(
+                _TABLE_MAGIC,
+                offset,
+                len(index_data)
+            ))
+            for record in records:
+                dest.write(record)
+            dest.write(index_data)
+        if path:
+            os.replace(tmp_path, path)
+            tmp_path = path
+        with open(tmp_path, "rb") as src:
+            table = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        if not path:
+            os.unlink(tmp_path)
+        logger.debug('Shared YAMLCONF attribute table "%s"', tmp_path)
+        return SharedAttributes(table, path)
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        logger.warning('Failed to share YAMLCONF attributes: %s', ex)
+        if tmp_path is not None and tmp_path != path and \
+                os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return None
+
+
+def file_signature(filename):
+    """
+    Return the signature for an input file: the absolute path, modification
+    time, size and SHA256 hash of the contents.  If the file cannot be read,
+    `None` is returned.
+    """
+    try:
+        with open(filename, "rb") as src:
+            stat = os.fstat(src.fileno())
+            digest = hashlib.sha256(src.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+    return (
+        os.path.abspath(filename),
+        stat.st_mtime_ns,
+        stat.st_size,
+        digest,
+    )
+
+
+def snapshot_key(filenames, environ, bootstrap, context):
+    """
+    Return the key identifying the inputs for a snapshot.  If one of the
+    input files cannot be read, `None` is returned, i.e., snapshots are not
+    supported for this load.
+
+    :param filenames: the ordered list of configuration files loaded
+    :param environ: the mapping of ``YAMLCONF_*`` environment variables
+    :param bootstrap: the mapping of bootstrap attribute names to values
+    :param context: other values identifying the load, e.g., the syntax
+    """
+    sha = hashlib.sha256()
+    sha.update(repr(context).encode("utf-8"))
+    for filename in filenames:
+        signature = file_signature(filename)
+        if signature is None:
+            return None
+        sha.update(repr(signature).encode("utf-8"))
+    sha.update(repr(sorted(environ.items())).encode("utf-8"))
+    sha.update(repr(sorted(bootstrap.items())).encode("utf-8"))
+    return sha.hexdigest()
+
+
+def snapshot_path(snapshot_dir, context):
+    """
+    Return the path to the snapshot file for a given load context (settings
+    module name, project, syntax, etc).  Different projects can share the
+    same snapshot directory.
+    """
+    digest = hashlib.sha256(repr(context).encode("utf-8")).hexdigest()
+    return os.path.join(snapshot_dir, f"yamlconf-{digest[:16]}.snapshot")
+
+
+def read_snapshot(path, key):
+    """
+    Read the snapshot file returning the dictionary saved via
+    ``write_snapshot`` if the snapshot key matches, otherwise `None`.
+    """
+    try:
+        with open(path, "rb") as src:
+            data = pickle.load(src)
+    except FileNotFoundError:
+        logger.debug('No YAMLCONF snapshot "%s"', path)
+        return None
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        logger.warning('Ignoring invalid YAMLCONF snapshot "%s": %s', path, ex)
+        return None
+    if not isinstance(data, dict) or \
+            data.get('format') != _SNAPSHOT_FORMAT or \
+            data.get('key') != key:
+        logger.debug('Stale YAMLCONF snapshot "%s"', path)
+        return None
+    return data
+
+
+def write_snapshot(path, key, **kwargs):
+    """
+    Atomically write a snapshot file: the data is written to a temporary
+    file in the snapshot directory which is then renamed to the snapshot
+    file name.  Concurrent writers (workers starting at the same time) each
+    write their own temporary file, the last rename wins.  Failures are
+    logged and otherwise ignored.
+    """
+    data = dict(kwargs, format=_SNAPSHOT_FORMAT, key=key)
+    dirname = os.path.dirname(path)
+    tmp_path = None
+    try:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        os.makedirs(dirname, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=dirname,
+            prefix=".yamlconf-",
+            suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as dest:
+            dest.write(payload)
+        os.replace(tmp_path, path)
+        tmp_path = None
+        logger.debug('Wrote YAMLCONF snapshot "%s"', path)
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        logger.warning('Failed to write YAMLCONF snapshot "%s": %s', path, ex)
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -0,0 +1,81 @@
+/*
+ * -*- coding: utf-8 -*-
+ * Copyright © 2025 Broadcom, Inc.  All rights reserved.
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Fetch, on demand, the large values summarized on the YAMLCONF attribute
+ * pages.  Values too large to display, in turn, are given a level at a
+ * time with links to fetch their items.
+*/
+
+(function () {
+  "use strict";
+
+  function valueElement(value) {
+    var pre = document.createElement("pre");
+    pre.textContent = JSON.stringify(value, null, 2);
+    return pre;
+  }
+
+  function summaryElement(entry) {
+    var div = document.createElement("div");
+    var em = document.createElement("em");
+    var link = document.createElement("a");
+    div.className = "lazy";
+    em.textContent = entry.type + ", " + entry.size + " nested values";
+    link.className = "yamlconf-lazy";
+    link.href = entry.url;
+    link.textContent = "Show";
+    div.appendChild(em);
+    div.appendChild(document.createTextNode(" "));
+    div.appendChild(link);
+    return div;
+  }
+
+  function recordElement(record) {
+    var table, tbody;
+    if (!record.items) {
+      return valueElement(record.value);
+    }
+    table = document.createElement("table");
+    tbody = document.createElement("tbody");
+    record.items.forEach(function (entry) {
+      var row = document.createElement("tr");
+      var key = document.createElement("td");
+      var value = document.createElement("td");
+      var tt = document.createElement("tt");
+      tt.textContent = entry.key;
+      key.appendChild(tt);
+      value.appendChild(
+        entry.url ? summaryElement(entry) : valueElement(entry.value)
+      );
+      row.appendChild(key);
+      row.appendChild(value);
+      tbody.appendChild(row);
+    });
+    table.appendChild(tbody);
+    return table;
+  }
+
+  document.addEventListener("click", function (event) {
+    var link = event.target.closest("a.yamlconf-lazy");
+    if (!link) {
+      return;
+    }
+    event.preventDefault();
+    link.textContent = "Loading...";
+    fetch(link.href, {credentials: "same-origin"})
+      .then(function (response) {
+        if (!response.ok) {
+          throw new Error(response.statusText);
+        }
+        return response.json();
+      })
+      .then(function (record) {
+        link.parentNode.replaceWith(recordElement(record));
+      })
+      .catch(function (error) {
+        link.textContent = "Show (" + error.message + ")";
+      });
+  });
+}());
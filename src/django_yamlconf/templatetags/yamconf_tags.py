@@ -11,9 +11,24 @@ Custom template filters to support display of YAMLCONF values via HTML views.
 """
 
 from django import template
+from django.conf import settings
+from django.utils.html import conditional_escape
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django_yamlconf import get_option
+from django_yamlconf import views
 
 register = template.Library()
 
+MAX_DEPTH = 20
+MAX_ITEMS = 5000
+
+_DICT_START = (
+    "<div><table><thead><tr><th>Key</th><th>Value</th></tr></thead><tbody>"
+)
+_DICT_END = "</tbody></table></div>"
+_LIST_END = "</ol></div>"
+
 
 @register.filter
 def get_type(value):
@@ -22,3 +37,132 @@ def get_type(value):
     values via HTML templates.
     """
     return type(value).__name__
+
+
+def render_mapping(parts, stack, items, shown, depth):
+    """
+    Render the (key, value) items of a dictionary as a table: the table
+    start is added to the parts, the rows for the first "shown" items, and
+    the table end, are pushed on the "render_value" stack.
+    """
+    if not items:
+        parts.append("<div><em>EMPTY DICTIONARY</em></div>")
+        return
+    parts.append(_DICT_START)
+    stack.append(_DICT_END)
+    if shown < len(items):
+        stack.append(
+            f'<tr><td colspan="2"><em>{len(items) - shown}'
+            f' VALUES NOT SHOWN</em></td></tr>'
+        )
+    for key, child in reversed(items[:shown]):
+        stack.append("</td></tr>")
+        stack.append((child, depth + 1))
+        stack.append(f"<tr><td><tt>{conditional_escape(key)}</tt></td><td>")
+
+
+def render_scalar(value):
+    """
+    Return the HTML for a value other than a list or dictionary.
+    """
+    return f"<div><tt>{conditional_escape(value)}</tt></div>"
+
+
+def render_sequence(parts, stack, items, shown, depth):
+    """
+    Render the (index, value) items of a list as a numbered list: the list
+    start is added to the parts, the entries for the first "shown" items,
+    and the list end, are pushed on the "render_value" stack.
+    """
+    if not items:
+        parts.append("<div><em>EMPTY LIST</em></div>")
+        return
+    parts.append(f"<div><b>{len(items)} values:</b><ol>")
+    stack.append(_LIST_END)
+    if shown < len(items):
+        stack.append(
+            f"<li><em>{len(items) - shown} VALUES NOT SHOWN</em></li>"
+        )
+    for _, child in reversed(items[:shown]):
+        stack.append("</li>")
+        stack.append((child, depth + 1))
+        stack.append("<li>")
+
+
+def render_value(value, hide=False, max_depth=MAX_DEPTH, max_items=MAX_ITEMS):
+    """
+    Return the HTML for a value: lists as numbered lists, dictionaries as
+    tables of keys and values, other values as escaped text (the HTML
+    generated by the "yamlconf/value.html" template).  The value is walked
+    iteratively: nested values are not rendered beyond "max_depth" levels
+    and at most "max_items" nested values are rendered, the number of
+    values not shown is given instead.
+    """
+    if hide:
+        return "<div><em>***** Hidden *****</em></div>"
+    parts = []
+    budget = max_items
+    # The stack holds the text to write (str) and the values, with their
+    # depth, to render (tuple), in reverse order
+    stack = [(value, 0)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        value, depth = item
+        if isinstance(value, dict):
+            items = list(value.items())
+            render = render_mapping
+        elif isinstance(value, (list, tuple)):
+            items = list(enumerate(value))
+            render = render_sequence
+        else:
+            parts.append(render_scalar(value))
+            continue
+        shown = min(len(items), budget) if depth < max_depth else 0
+        budget -= shown
+        render(parts, stack, items, shown, depth)
+    return "".join(parts)
+
+
+def render_summary(value, size, url):
+    """
+    Return the HTML summarizing a value not rendered, its type and size,
+    with a link to fetch the value.
+    """
+    return format_html(
+        '<div class="lazy"><em>{}, {} items, {} nested values</em>'
+        ' <a class="yamlconf-lazy" href="{}">Show</a></div>',
+        get_type(value),
+        len(value),
+        size,
+        url
+    )
+
+
+@register.simple_tag
+def yamlconf_value(value, hide=False, name=None, field="evalue",
+                   history=None):
+    """
+    Render a YAMLCONF value (see "render_value"), the depth and number of
+    nested values rendered are limited by the ``YAMLCONF_VIEW_MAX_DEPTH``
+    and ``YAMLCONF_VIEW_MAX_ITEMS`` settings.  If the attribute name is
+    given, values larger than the ``YAMLCONF_VIEW_INLINE_SIZE`` setting are
+    summarized instead, the value fetched on demand from the field, or
+    eclipsed value ("history" index), of the attribute.
+    """
+    if name is not None and not hide:
+        size = views.value_size(value)
+        if size > views.inline_size():
+            return render_summary(
+                value,
+                size,
+                views.value_url(name, field, history)
+            )
+    return mark_safe(render_value(
+        value,
+        hide,
+        get_option(settings, "view_max_depth", None, MAX_DEPTH),
+        get_option(settings, "view_max_items", None, MAX_ITEMS),
+    ))
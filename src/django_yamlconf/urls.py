@@ -9,14 +9,75 @@ for admin users.  The views are protected via
     @login_required(login_url='/admin/login/')
 
 If you have a special environment, you might need to adjust this.
+
+The native asynchronous views (see ``async_views``) are used if the
+``YAMLCONF_ASYNC_VIEWS`` setting is True or, if not defined, when the
+``ASGI_APPLICATION`` setting is defined, i.e., for ASGI deployments.  This
+requires Django 5.1, or later.
 """
 
+import logging
+
+import django
+from django.conf import settings
 from django.urls import path
+from django_yamlconf import get_option
 from django_yamlconf import views
 
+logger = logging.getLogger(__name__)
+
+
+def use_async_views():
+    """
+    Return True if the asynchronous views should be used.
+    """
+    requested = get_option(
+        settings,
+        "async_views",
+        None,
+        hasattr(settings, "ASGI_APPLICATION")
+    )
+    if requested and django.VERSION < (5, 1):
+        logger.warning("YAMLCONF async views require Django 5.1 or later")
+        return False
+    return bool(requested)
+
+
+def view_patterns(module):
+    """
+    Return the URL patterns for the views defined by the given module,
+    ``views`` or ``async_views``.
+    """
+    return [
+        path("", module.index, name='index'),
+        path(
+            "attributes.json",
+            module.attributes_api,
+            {'fmt': "json"},
+            name='attributes_json'
+        ),
+        path(
+            "attributes.ndjson",
+            module.attributes_api,
+            {'fmt': "ndjson"},
+            name='attributes_ndjson'
+        ),
+        path("value.json", module.attr_value, name='attr_value'),
+        path("<path:name>/", module.attr_info, name='attr'),
+    ]
+
+
+def view_module():
+    """
+    Return the module defining the views to use.
+    """
+    if use_async_views():
+        # pylint: disable=import-outside-toplevel
+        from django_yamlconf import async_views
+        return async_views
+    return views
+
+
 # pylint: disable=invalid-name
 app_name = 'django_yamlconf'
-urlpatterns = [
-    path("", views.index, name='index'),
-    path("<path:name>/", views.attr_info, name='attr'),
-]
+urlpatterns = view_patterns(view_module())
@@ -3,48 +3,654 @@
 # SPDX-License-Identifier: BSD-2-Clause
 """
 Basic views to allow browsing of the YAMLCONF definitions.
+
+The pages generated are cached via the Django cache framework (the cache
+named by the ``YAMLCONF_VIEW_CACHE`` setting, "default" if not defined,
+caching is disabled if set to an empty value), keyed by the fingerprint
+of the attribute definitions: pages cached for earlier definitions are
+not used once the attributes change, e.g., via ``add_attributes`` or a
+reload.  The ``ETag`` and ``Last-Modified`` headers allow browsers and
+proxies to revalidate the pages (304 responses).
+
+The index page lists the attributes matching the search parameters ("q",
+the search text, "mode", the search mode, see ``search.AttributeIndex``,
+and "source", the file defining the values), a page ("page") of
+"per_page" attributes at a time (default the ``YAMLCONF_VIEW_PAGE_SIZE``
+setting, or 100, "all" lists all the attributes on a single page, not
+cached).  The index page is streamed, the attribute rows are rendered a
+batch at a time.
+
+The "attributes.json" and "attributes.ndjson" URLs stream the attributes
+matching the same search parameters as JSON (a list) or newline delimited
+JSON (a line per attribute) records.  The "fields" parameter selects the
+fields included (a comma separated list of ``API_FIELDS``, default
+"name,evalue,source").  The values of hidden attributes are replaced by
+``HIDDEN_VALUE``.
+
+Values larger than the ``YAMLCONF_VIEW_INLINE_SIZE`` setting (a number of
+nested values, default ``INLINE_SIZE``) are not rendered on the attribute
+pages, a summary, giving the type and size, is displayed instead.  The
+value is fetched on demand from the "value.json" URL, with the "path"
+parameter, the attribute name followed by the keys, or list indexes, of
+a nested value, e.g., "LOGGING.handlers.file", and the "field", "value"
+or "evalue" (default), or "history", the index of an eclipsed value.
+Large values are returned a level at a time, see ``value_record``.
 """
 
+import datetime
+import hashlib
+import json
 import logging
+from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import caches
+from django.core.paginator import Paginator
 from django.http import Http404
-from django.shortcuts import render
+from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition
+from django_yamlconf import attributes_version
+from django_yamlconf import format_source
 from django_yamlconf import get_cached_attributes
 from django_yamlconf import get_attr_info
+from django_yamlconf import get_attr_items
+from django_yamlconf import get_option
+from django_yamlconf import search
+from django_yamlconf.positions import SourceSpan
 
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_PARAMS = {
+    'q': "",
+    'mode': None,
+    'source': None,
+    'page': "1",
+    'per_page': 100,
+}
+_MAX_PAGE_SIZE = 1000
+_ROWS_BATCH = 100
+_ROWS_MARKER = "<!-- yamlconf:rows -->"
 
-@staff_member_required
-def index(request):
+API_FIELDS = (
+    "name", "value", "evalue", "source", "position", "doc", "history", "hide"
+)
+HIDDEN_VALUE = "***** Hidden *****"
+_API_BATCH = 100
+_API_DEFAULT_FIELDS = ("name", "evalue", "source")
+API_TYPES = {
+    'json': "application/json",
+    'ndjson': "application/x-ndjson",
+}
+INLINE_SIZE = 500
+VALUE_FIELDS = ("value", "evalue")
+
+
+def cached_page(key, template, context):
+    """
+    Return the response for a page, rendering, and caching, the template if
+    the page for the key is not cached.  The context is a function
+    returning the template context.
+    """
+    cache = page_cache()
+    content = None if cache is None else cache.get(key)
+    if content is None:
+        content = render_to_string(template, context())
+        if cache is not None:
+            cache.set(key, content)
+    return HttpResponse(content)
+
+
+def page_cache():
+    """
+    Return the cache used for the pages, `None` if caching is disabled.
+    """
+    alias = get_option(settings, "view_cache", None, "default")
+    return caches[alias] if alias else None
+
+
+def index_etag(request, **kwargs):  # pylint: disable=unused-argument
+    """
+    Return the ETag for the index page: the fingerprint of the attribute
+    definitions.
+    """
+    return attributes_version()[0]
+
+
+def index_last_modified(request, **kwargs):
     """
-    Generate the main page listing the YAMLCONF definitions.
+    Return the last modification time for the index page: the time the
+    attributes were last changed.
+    """
+    # pylint: disable=unused-argument
+    return datetime.datetime.fromtimestamp(
+        attributes_version()[1],
+        tz=datetime.timezone.utc
+    )
+
+
+def index_context(params):
+    """
+    Return the template context for the index page: the page of attributes
+    matching the search parameters.
     """
     logger.debug("Generating index page for YAMLCONF")
-    return render(
-        request,
-        "yamlconf/index.html",
-        {
-            'title': 'YAMLCONF Attributes',
-            'attrs': sorted(list(get_cached_attributes().items())),
-        }
+    attr_index = search.get_index()
+    names = attr_index.search(
+        params['q'],
+        params['mode'],
+        params['source']
     )
+    per_page = params['per_page']
+    if per_page == "all":
+        per_page = max(len(names), 1)
+    page = Paginator(names, per_page).get_page(params['page'])
+    return {
+        'title': 'YAMLCONF Attributes',
+        'rows': mark_safe(_ROWS_MARKER),
+        'page': page,
+        'params': params,
+        'modes': search.MODES,
+        'sources': attr_index.sources,
+        'total': len(attr_index.names),
+        'querystring': urlencode([
+            (key, params[key])
+            for key in ('q', 'mode', 'source', 'per_page')
+            if params[key] and params[key] != _DEFAULT_PARAMS[key]
+        ]),
+    }
+
+
+def index_params(request):
+    """
+    Return the search parameters for the index page, defaults used for
+    invalid values.
+    """
+    params = dict(_DEFAULT_PARAMS)
+    params['per_page'] = get_option(
+        settings,
+        "view_page_size",
+        None,
+        _DEFAULT_PARAMS['per_page']
+    )
+    params['q'] = request.GET.get('q', "").strip()
+    params['page'] = request.GET.get('page', "1")
+    if request.GET.get('mode') in search.MODES:
+        params['mode'] = request.GET['mode']
+    params['source'] = request.GET.get('source') or None
+    if request.GET.get('per_page') == "all":
+        params['per_page'] = "all"
+        return params
+    try:
+        params['per_page'] = min(
+            max(int(request.GET.get('per_page', params['per_page'])), 1),
+            _MAX_PAGE_SIZE
+        )
+    except ValueError:
+        pass
+    return params
 
 
 @staff_member_required
-def attr_info(request, name):
+@condition(etag_func=index_etag, last_modified_func=index_last_modified)
+def index(request):
     """
-    Display the page giving information on an individual attribute.
+    Generate the main page listing the YAMLCONF definitions matching the
+    search parameters, one page at a time.
+    """
+    params = index_params(request)
+    key = index_key(params)
+    cache = page_cache() if key is not None else None
+    content = None if cache is None else cache.get(key)
+    if content is not None:
+        return HttpResponse(content)
+    return StreamingHttpResponse(
+        cache_chunks(cache, key, index_chunks(params))
+    )
+
+
+def cache_chunks(cache, key, chunks):
+    """
+    Generate the chunks of a page, caching the page, if a cache is given,
+    once all the chunks have been generated.
+    """
+    parts = []
+    for chunk in chunks:
+        if cache is not None:
+            parts.append(chunk)
+        yield chunk
+    if cache is not None:
+        cache.set(key, "".join(parts))
+
+
+def index_chunks(params):
+    """
+    Generate the HTML for an index page a chunk at a time: the page up to
+    the attribute rows, the rows for a batch of attributes at a time and
+    the rest of the page.  Only the attributes for a batch of rows are
+    expanded, and rendered, at any time.
+    """
+    context = index_context(params)
+    head, tail = render_to_string(
+        "yamlconf/index.html",
+        context
+    ).split(_ROWS_MARKER, 1)
+    yield head
+    names = context['page'].object_list
+    for start in range(0, len(names), _ROWS_BATCH):
+        yield render_to_string(
+            "yamlconf/index_rows.html",
+            {'attrs': get_attr_items(names[start:start + _ROWS_BATCH])}
+        )
+    yield tail
+
+
+def index_key(params):
+    """
+    Return the cache key for an index page, `None` for pages listing all
+    the attributes (not cached).
+    """
+    if params['per_page'] == "all":
+        return None
+    digest = hashlib.sha256(
+        repr(sorted(params.items())).encode("utf-8")
+    ).hexdigest()[:32]
+    return f"yamlconf:index:{attributes_version()[0]}:{digest}"
+
+
+def attr_etag(request, name):  # pylint: disable=unused-argument
+    """
+    Return the ETag for an attribute page: the fingerprint of the attribute
+    definitions, `None` if the attribute is not defined.
+    """
+    if name not in get_cached_attributes(expand=False):
+        return None
+    return index_etag(request)
+
+
+def attr_last_modified(request, name):
+    """
+    Return the last modification time for an attribute page: the time the
+    attributes were last changed, `None` if the attribute is not defined.
+    """
+    if name not in get_cached_attributes(expand=False):
+        return None
+    return index_last_modified(request)
+
+
+def attr_context(name):
+    """
+    Return the template context for an attribute page.
     """
-    title = f'YAMLCONF: "{name}" Attribute'
     logger.debug("Generating YAMLCONF info page for \"%s\"", name)
     info = get_attr_info(name)
-    if info is None:
+    history = [
+        (value.value if isinstance(value, SourceSpan) else value, source)
+        for value, source in info['history']
+    ]
+    return {
+        'name': name,
+        'info': info,
+        'source': format_source(info['source'], info['position']),
+        'history': history,
+        'title': f'YAMLCONF: "{name}" Attribute',
+    }
+
+
+@staff_member_required
+@condition(etag_func=attr_etag, last_modified_func=attr_last_modified)
+def attr_info(request, name):  # pylint: disable=unused-argument
+    """
+    Display the page giving information on an individual attribute.
+    """
+    if name not in get_cached_attributes(expand=False):
         logger.info("No such YAMLCONF attribute \"%s\"", name)
         raise Http404
-    return render(
-        request,
+    return cached_page(
+        attr_key(name),
         "yamlconf/attribute.html",
-        {'name': name, 'info': info, 'title': title}
+        lambda: attr_context(name)
     )
+
+
+def attr_key(name):
+    """
+    Return the cache key for an attribute page.
+    """
+    digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:32]
+    return f"yamlconf:attr:{attributes_version()[0]}:{digest}"
+
+
+def api_fields(request):
+    """
+    Return the list of fields selected for the attributes API, `None` if
+    the fields are invalid.
+    """
+    fields = [
+        field.strip()
+        for field in request.GET.get(
+            'fields',
+            ",".join(_API_DEFAULT_FIELDS)
+        ).split(",")
+        if field.strip()
+    ]
+    if not fields or any(field not in API_FIELDS for field in fields):
+        return None
+    return fields
+
+
+def api_invalid_fields():
+    """
+    Return the response for invalid attributes API fields.
+    """
+    return HttpResponseBadRequest(
+        "Invalid fields, expected a comma separated list of: "
+        f"{', '.join(API_FIELDS)}\n",
+        content_type="text/plain"
+    )
+
+
+def api_names(request):
+    """
+    Return the names of the attributes matching the search parameters.
+    """
+    params = index_params(request)
+    return search.get_index().search(
+        params['q'],
+        params['mode'],
+        params['source']
+    )
+
+
+def api_record(name, info, fields):
+    """
+    Return the JSON record, with the given fields, for an attribute.
+    Hidden values are masked.
+    """
+    hide = info['hide']
+    record = {}
+    for field in fields:
+        if field == "name":
+            value = name
+        elif field in ("value", "evalue"):
+            value = HIDDEN_VALUE if hide else info[field]
+        elif field == "position":
+            position = info['position']
+            value = None if position is None else {
+                'line': position.line,
+                'column': position.column,
+            }
+        elif field == "history":
+            value = [
+                {
+                    'value': HIDDEN_VALUE if hide else (
+                        value.value if isinstance(value, SourceSpan)
+                        else value
+                    ),
+                    'source': source,
+                }
+                for value, source in info['history']
+            ]
+        else:
+            value = info[field]
+        record[field] = value
+    return record
+
+
+def api_records(names, fields, separator):
+    """
+    Generate the encoded JSON records for the named attributes, a batch of
+    attributes at a time, each record followed by the separator.
+    """
+    for start in range(0, len(names), _API_BATCH):
+        batch = names[start:start + _API_BATCH]
+        if "history" in fields:
+            items = [(name, get_attr_info(name)) for name in batch]
+        else:
+            items = get_attr_items(batch)
+        yield "".join(
+            json.dumps(api_record(name, info, fields), default=str) +
+            separator
+            for name, info in items
+        )
+
+
+def api_stream(names, fields, fmt):
+    """
+    Generate the content for the attributes API: a JSON list or a newline
+    delimited JSON record per attribute.
+    """
+    if fmt == "ndjson":
+        yield from api_records(names, fields, "\n")
+        return
+    yield "["
+    first = True
+    for chunk in api_records(names, fields, ",\n"):
+        if not chunk:
+            continue
+        if not first:
+            yield ",\n"
+        first = False
+        yield chunk[:-2]
+    yield "]\n"
+
+
+@staff_member_required
+@condition(etag_func=index_etag, last_modified_func=index_last_modified)
+def attributes_api(request, fmt="json"):
+    """
+    Stream the attributes matching the search parameters, with the fields
+    selected, as JSON or NDJSON records.
+    """
+    fields = api_fields(request)
+    if fields is None:
+        return api_invalid_fields()
+    return StreamingHttpResponse(
+        api_stream(api_names(request), fields, fmt),
+        content_type=API_TYPES[fmt]
+    )
+
+
+def value_size(value):
+    """
+    Return the number of values nested in a value, i.e., the items of
+    lists and dictionaries, at any depth, zero for other values.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            children = list(value.values())
+        elif isinstance(value, (list, tuple)):
+            children = list(value)
+        else:
+            continue
+        size += len(children)
+        stack.extend(children)
+    return size
+
+
+def inline_size():
+    """
+    Return the size (see "value_size") of the largest values rendered on
+    the attribute pages.
+    """
+    return get_option(settings, "view_inline_size", None, INLINE_SIZE)
+
+
+def value_url(path, field="evalue", history=None):
+    """
+    Return the URL to fetch the value at a path.
+    """
+    params = {'path': path}
+    if history is not None:
+        params['history'] = history
+    elif field != "evalue":
+        params['field'] = field
+    return f"{reverse('django_yamlconf:attr_value')}?{urlencode(params)}"
+
+
+def value_params(request):
+    """
+    Return the path, field and history index requested for the value
+    endpoint, `None` if invalid.
+    """
+    path = request.GET.get('path', "")
+    field = request.GET.get('field', "evalue")
+    history = request.GET.get('history')
+    if not path or field not in VALUE_FIELDS:
+        return None
+    if history is not None:
+        try:
+            history = int(history)
+        except ValueError:
+            return None
+    return path, field, history
+
+
+def value_invalid():
+    """
+    Return the response for invalid value endpoint parameters.
+    """
+    return HttpResponseBadRequest(
+        "Invalid parameters, expected a \"path\", an optional \"field\","
+        f" one of: {', '.join(VALUE_FIELDS)}, or \"history\" index\n",
+        content_type="text/plain"
+    )
+
+
+def path_key(key):
+    """
+    Return the path component for a key of a nested value: "." and "\\"
+    characters are escaped with a "\\", e.g., "django\\.request".
+    """
+    return str(key).replace("\\", "\\\\").replace(".", "\\.")
+
+
+def split_path(path):
+    """
+    Return the components of a value path, split at the "." characters
+    not escaped (see "path_key"), with the escapes removed.
+    """
+    components = [""]
+    chars = iter(path)
+    for char in chars:
+        if char == "\\":
+            components[-1] += next(chars, "")
+        elif char == ".":
+            components.append("")
+        else:
+            components[-1] += char
+    return components
+
+
+def resolve_path(path, field="evalue", history=None):
+    """
+    Return the information for the attribute and the value at a path, the
+    longest attribute name prefixing the path followed by the keys, or
+    list indexes, of the nested value (see "split_path"), (`None`, `None`)
+    if there is no such value.
+    """
+    attributes = get_cached_attributes(expand=False)
+    components = split_path(path)
+    for count in range(len(components), 0, -1):
+        name = ".".join(components[:count])
+        if name in attributes:
+            break
+    else:
+        return None, None
+    if history is None:
+        info = get_attr_items([name])[0][1]
+        value = info[field]
+    else:
+        info = get_attr_info(name)
+        if not -1 < history < len(info['history']):
+            return None, None
+        value = info['history'][history][0]
+        if isinstance(value, SourceSpan):
+            value = value.value
+    for component in components[count:]:
+        if isinstance(value, dict):
+            keys = [key for key in value if str(key) == component]
+            if not keys:
+                return None, None
+            value = value[keys[0]]
+        elif isinstance(value, (list, tuple)) and component.isdigit() \
+                and int(component) < len(value):
+            value = value[int(component)]
+        else:
+            return None, None
+    return info, value
+
+
+def value_record(path, field="evalue", history=None):
+    """
+    Return the JSON record for the value at a path (see "resolve_path"),
+    `None` if there is no such value: the type, the size (see
+    "value_size") and the value.  For values larger than "inline_size",
+    the record gives the items of the value instead, each item with its
+    key, path, type, size and, unless also too large, value, otherwise
+    the URL to fetch the item.  Hidden values are masked.
+    """
+    info, value = resolve_path(path, field, history)
+    if info is None:
+        return None
+    if info['hide']:
+        return {'path': path, 'hide': True, 'value': HIDDEN_VALUE}
+    limit = inline_size()
+    record = {
+        'path': path,
+        'type': type(value).__name__,
+        'size': value_size(value),
+    }
+    if record['size'] <= limit:
+        record['value'] = value
+        return record
+    record['items'] = []
+    for key, item in (value.items() if isinstance(value, dict)
+                      else enumerate(value)):
+        entry = {
+            'key': key,
+            'path': f"{path}.{path_key(key)}",
+            'type': type(item).__name__,
+            'size': value_size(item),
+        }
+        if entry['size'] <= limit:
+            entry['value'] = item
+        else:
+            entry['url'] = value_url(entry['path'], field, history)
+        record['items'].append(entry)
+    return record
+
+
+def value_response(record):
+    """
+    Return the JSON response for a value record.
+    """
+    return HttpResponse(
+        json.dumps(record, default=str),
+        content_type=API_TYPES['json']
+    )
+
+
+@staff_member_required
+@condition(etag_func=index_etag, last_modified_func=index_last_modified)
+def attr_value(request):
+    """
+    Return the value, or a nested value, of an attribute as JSON, the
+    value fetched on demand for large values on the attribute pages.
+    """
+    params = value_params(request)
+    if params is None:
+        return value_invalid()
+    record = value_record(*params)
+    if record is None:
+        logger.info("No such YAMLCONF value \"%s\"", params[0])
+        raise Http404
+    return value_response(record)
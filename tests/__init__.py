@@ -6,6 +6,8 @@ Base definitions to support testing.
 """
 
 import os
+import types
+
 from django.test import TestCase
 
 
@@ -25,3 +27,16 @@ class MockSettings(object):
 
     def __init__(self):
         pass
+
+
+def new_settings(**attrs):
+    """
+    Return a new settings module in the "tests" directory, with a "NESTED"
+    dictionary and the given attributes
+    """
+    settings = types.ModuleType("test_settings")
+    settings.__file__ = os.path.join(os.path.dirname(__file__), "settings.py")
+    settings.NESTED = {"A": 1}
+    for name, value in attrs.items():
+        setattr(settings, name, value)
+    return settings
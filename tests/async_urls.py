@@ -0,0 +1,12 @@
+from django.contrib import admin
+from django.urls import include, path
+from django_yamlconf import async_views
+from django_yamlconf.urls import view_patterns
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path(
+        "yamlconf/",
+        include((view_patterns(async_views), "django_yamlconf"))
+    ),
+]
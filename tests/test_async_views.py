@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the asynchronous variants of the URL views defined by YAMLCONF
+"""
+
+import json
+import threading
+import unittest
+import django
+import pytest
+import django_yamlconf
+
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django_yamlconf import async_views
+from django_yamlconf import urls
+from django_yamlconf import views
+from tests import YCTestCase
+
+
+User = get_user_model()
+
+
+class UseAsyncTests(YCTestCase):
+
+    def test_default(self):
+        self.assertFalse(urls.use_async_views())
+        self.assertIs(urls.view_module(), views)
+
+    @unittest.skipIf(django.VERSION < (5, 1), "Requires Django 5.1")
+    def test_asgi(self):
+        with self.settings(ASGI_APPLICATION="project.asgi.application"):
+            self.assertTrue(urls.use_async_views())
+            self.assertIs(urls.view_module(), async_views)
+            with self.settings(YAMLCONF_ASYNC_VIEWS=False):
+                self.assertFalse(urls.use_async_views())
+
+    def test_old_django(self):
+        with self.settings(YAMLCONF_ASYNC_VIEWS=True), \
+                mock.patch.object(django, "VERSION", (4, 2, 0)):
+            self.assertFalse(urls.use_async_views())
+
+
+@pytest.mark.django_db
+@unittest.skipIf(django.VERSION < (5, 1), "Requires Django 5.1")
+@override_settings(ROOT_URLCONF="tests.async_urls")
+class AsyncViewTests(YCTestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            password="welcome123",
+        )
+        self.admin = User.objects.create_user(
+            username="testadmin",
+            password="welcome123",
+            is_staff=True,
+        )
+        django_yamlconf.load(project="tests", settings=settings)
+        cache.clear()
+        async_views._PAGES.clear()
+
+    async def test_no_access(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:index")
+        )
+        self.assertEqual(response.status_code, 302)
+
+    async def test_index(self):
+        await self.async_client.aforce_login(self.admin)
+        with mock.patch.object(
+                views,
+                "render_to_string",
+                wraps=views.render_to_string) as render:
+            response = await self.async_client.get(
+                reverse("django_yamlconf:index"),
+                {'q': "CPU_COUNT"}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.is_async)
+            content = b"".join([
+                chunk async for chunk in response.streaming_content
+            ])
+            self.assertIn(b"CPU_COUNT", content)
+            rendered = render.call_count
+            again = await self.async_client.get(
+                reverse("django_yamlconf:index"),
+                {'q': "CPU_COUNT"}
+            )
+        self.assertEqual(render.call_count, rendered)
+        self.assertEqual(content, again.content)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:index"),
+            {'q': "CPU_COUNT"},
+            headers={'If-None-Match': response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_attr(self):
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attr", args=["CPU_COUNT"])
+        )
+        self.assertEqual(response.status_code, 200)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attr", args=["NO_SUCH_SETTING"])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_api(self):
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attributes_ndjson"),
+            {'q': "CPU_COUNT", 'fields': "name,history"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        content = b"".join([
+            chunk async for chunk in response.streaming_content
+        ])
+        record = json.loads(content)
+        self.assertEqual(record['name'], "CPU_COUNT")
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attributes_json"),
+            {'fields': "nosuch"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_attr_value(self):
+        for value in ("first", "second"):
+            django_yamlconf.add_attributes(
+                settings,
+                {'ASYNC_VALUE': value},
+                "**ASYNC-TEST**"
+            )
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attr_value"),
+            {'path': "PYTHON.MAJOR"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['type'], "int")
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attr_value"),
+            {'path': "ASYNC_VALUE", 'history': 0}
+        )
+        self.assertEqual(json.loads(response.content)['value'], "first")
+        response = await self.async_client.get(
+            reverse("django_yamlconf:attr_value"),
+            {'path': "NO_SUCH_SETTING"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_off_loop(self):
+        """
+        The fingerprint, when not yet computed, value records and API
+        records are computed in threads, not on the event loop
+        """
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def record_thread(function):
+            def wrapper(*args, **kwargs):
+                calls.append((function.__name__, threading.get_ident()))
+                return function(*args, **kwargs)
+            return wrapper
+
+        await self.async_client.aforce_login(self.admin)
+        with mock.patch.object(
+                async_views,
+                "attributes_version",
+                record_thread(async_views.attributes_version)), \
+                mock.patch.object(
+                    views,
+                    "value_record",
+                    record_thread(views.value_record)), \
+                mock.patch.object(
+                    views,
+                    "api_records",
+                    record_thread(views.api_records)):
+            response = await self.async_client.get(
+                reverse("django_yamlconf:attr_value"),
+                {'path': "PYTHON.MAJOR"}
+            )
+            self.assertEqual(response.status_code, 200)
+            response = await self.async_client.get(
+                reverse("django_yamlconf:attributes_ndjson"),
+                {'q': "CPU_COUNT"}
+            )
+            content = b"".join([
+                chunk async for chunk in response.streaming_content
+            ])
+        self.assertIn(b"CPU_COUNT", content)
+        self.assertEqual(
+            [name for name, _ in calls],
+            ["attributes_version", "value_record", "api_records"]
+        )
+        self.assertNotIn(loop_thread, [thread for _, thread in calls])
+
+    def test_local_pages(self):
+        for i in range(async_views.MAX_PAGES + 5):
+            async_views.save_local_page(f"key{i}", f"page{i}")
+        self.assertIsNone(async_views.local_page("key0"))
+        self.assertEqual(
+            async_views.local_page(f"key{async_views.MAX_PAGES}"),
+            f"page{async_views.MAX_PAGES}"
+        )
+        self.assertEqual(len(async_views._PAGES), async_views.MAX_PAGES)
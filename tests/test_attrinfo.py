@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the attribute information records.
+"""
+
+import copy
+import pickle
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestAttributeInfo(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Initialize the mock settings object
+        """
+        self.settings = MockSettings()
+        django_yamlconf.load(project="ycexplain", settings=self.settings)
+
+    def test_mapping(self):
+        """
+        Fields are available via the dictionary interface
+        """
+        info = django_yamlconf.get_attr_info("A", self.settings)
+        self.assertEqual(info['value'], info.value)
+        self.assertEqual(info.get('evalue'), "Value of A")
+        self.assertEqual(
+            sorted(info.keys()),
+            [
+                'doc', 'evalue', 'hide', 'history', 'position', 'source',
+                'value',
+            ],
+        )
+        self.assertIn('Example documentation', info['doc'][0])
+        with self.assertRaises(KeyError):
+            info['no_such_field']
+
+    def test_lazy_lists(self):
+        """
+        Documentation and history lists are only allocated when used
+        """
+        attributes = {}
+        django_yamlconf.add_attr_info(attributes, "X", 1)
+        info = attributes["X"]
+        self.assertEqual(info['doc'], ())
+        self.assertEqual(info['history'], ())
+        self.assertFalse(hasattr(info, "__dict__"))
+        info.add_history(0, "**TESTING**")
+        self.assertEqual(info['history'], [(0, "**TESTING**")])
+
+    def test_copy(self):
+        """
+        Records can be copied and pickled (snapshots, shared tables)
+        """
+        info = django_yamlconf.get_attr_info("A", self.settings)
+        self.assertEqual(copy.deepcopy(info), info)
+        self.assertEqual(pickle.loads(pickle.dumps(info)), info)
+        self.assertEqual(dict(info)['source'], info.source)
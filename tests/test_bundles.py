@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the YAMLCONF bundle files: multiple document YAML files with sections
+selected by attribute values.
+"""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+import yaml
+
+import django_yamlconf
+from django_yamlconf import positions
+from tests import MockSettings
+from tests import YCTestCase
+
+BUNDLE = """\
+LOG_LEVEL: INFO
+HOSTS: [common]
+---
+:select:
+  PROFILE: staging
+LOG_LEVEL: DEBUG
+HOSTS:append: staging
+---
+:select:
+  OS_NODE: [web-*, api-*]
+HOSTS:append: web
+---
+:select:
+  PROFILE: production
+BROKEN: !!python/object:os.system {}
+"""
+
+
+class TestBundles(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Create the bundle file
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.bundle = os.path.join(self.tmpdir.name, "bundle.yaml")
+        with open(self.bundle, "w", encoding="utf-8") as dest:
+            dest.write(BUNDLE)
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.tmpdir.cleanup()
+
+    def load(self, environ=None, node="db-01", backend=None):
+        """
+        Load the bundle file returning the settings
+        """
+        settings = MockSettings()
+        with mock.patch.dict(os.environ, environ or {}), \
+                mock.patch("platform.node", return_value=node):
+            django_yamlconf.load(
+                settings=settings,
+                conffiles=[self.bundle],
+                loader_backend=backend,
+            )
+        return settings
+
+    def test_default(self):
+        """
+        Sections without a selection are always loaded
+        """
+        settings = self.load()
+        self.assertEqual(settings.LOG_LEVEL, "INFO")
+        self.assertEqual(settings.HOSTS, ["common"])
+
+    def test_profile(self):
+        """
+        Sections selected via the environment, merged in order
+        """
+        for backend in ("python", "libyaml"):
+            if backend == "libyaml" and not hasattr(yaml, "CSafeLoader"):
+                continue
+            settings = self.load({"YAMLCONF_PROFILE": "staging"},
+                                 backend=backend)
+            self.assertEqual(settings.LOG_LEVEL, "DEBUG")
+            self.assertEqual(settings.HOSTS, ["common", "staging"])
+
+    def test_node_pattern(self):
+        """
+        Sections selected via predefined attributes and patterns
+        """
+        settings = self.load({"YAMLCONF_PROFILE": "staging"}, node="api-3")
+        self.assertEqual(settings.HOSTS, ["common", "staging", "web"])
+
+    def test_skipped(self):
+        """
+        Sections not selected are not constructed: the unsafe tag in the
+        "production" section is not seen
+        """
+        data = positions.load(
+            BUNDLE,
+            yaml.SafeLoader,
+            {"PROFILE": "staging", "OS_NODE": "db-01"}
+        )
+        self.assertEqual(len(data.sections), 2)
+        self.assertNotIn("BROKEN", data)
+        with self.assertLogs("django_yamlconf", level="ERROR"):
+            self.load({"YAMLCONF_PROFILE": "production"})
+
+    def test_not_composed(self):
+        """
+        Only the ":select" definition of a section not selected is
+        composed, the rest of the section is only parsed
+        """
+        composed = []
+
+        def compose_scalar_node(composer, anchor):
+            node = yaml.composer.Composer.compose_scalar_node(
+                composer,
+                anchor
+            )
+            composed.append(node.value)
+            return node
+
+        for loader in (yaml.SafeLoader, getattr(yaml, "CSafeLoader", None)):
+            if loader is None:
+                continue
+            del composed[:]
+            with mock.patch.object(
+                    positions.SectionComposer,
+                    "compose_scalar_node",
+                    autospec=True,
+                    side_effect=compose_scalar_node):
+                data = positions.load(BUNDLE, loader, {"PROFILE": "staging"})
+            self.assertEqual(data["LOG_LEVEL"], "DEBUG")
+            self.assertIn("production", composed)
+            self.assertIn("DEBUG", composed)
+            self.assertNotIn("BROKEN", composed)
+            self.assertNotIn("web", composed)
+
+    def test_positions(self):
+        """
+        The line numbers are those of the bundle file
+        """
+        settings = self.load({"YAMLCONF_PROFILE": "staging"})
+        out = StringIO()
+        django_yamlconf.explain("LOG_LEVEL", settings=settings, stream=out)
+        self.assertIn(f'(via "{self.bundle}:6")', out.getvalue())
+        self.assertIn(f'"INFO" via "{self.bundle}:1"', out.getvalue())
+
+    def test_single_document(self):
+        """
+        A single document with a selection not matching is empty
+        """
+        data = positions.load(
+            ":select: {PROFILE: production}\nA: 1\n",
+            yaml.SafeLoader,
+            {"PROFILE": "staging"}
+        )
+        self.assertEqual(data, {})
+        data = positions.load(
+            ":select: {PROFILE: staging}\nA: 1\n",
+            yaml.SafeLoader,
+            {"PROFILE": "staging"}
+        )
+        self.assertEqual(data, {"A": 1})
+
+    def test_markers(self):
+        """
+        Documents are separated by the parser: "..." end markers and
+        directives, rather than "---" lines in the text
+        """
+        data = positions.load(
+            "%YAML 1.1\n"
+            "---\n"
+            "A: 1\n"
+            "...\n"
+            "%YAML 1.1\n"
+            "--- !!map\n"
+            ":select: {PROFILE: staging}\n"
+            "B: |\n"
+            "  text\n"
+            "  --- not a document\n"
+            "...\n",
+            yaml.SafeLoader,
+            {"PROFILE": "staging"}
+        )
+        self.assertEqual(len(data.sections), 2)
+        self.assertEqual(data, {"A": 1, "B": "text\n--- not a document\n"})
+        self.assertEqual(data.positions["B"].line, 8)
+        data = positions.load(
+            "A: 1\n...\n---\n:select: {PROFILE: production}\nB: 2\n",
+            yaml.SafeLoader,
+            {"PROFILE": "staging"}
+        )
+        self.assertEqual(data, {"A": 1})
+
+    def test_not_mapping(self):
+        """
+        The sections of a bundle must be mappings
+        """
+        with self.assertRaises(yaml.YAMLError):
+            positions.load("A: 1\n---\n- 1\n", yaml.SafeLoader)
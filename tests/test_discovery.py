@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the discovery of the YAMLCONF files.
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestDiscovery(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Create the directory tree top/a/b/c with a YAMLCONF file in each
+        directory
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.top = os.path.join(self.tmpdir.name, "top")
+        self.start = os.path.join(self.top, "a", "b", "c")
+        os.makedirs(self.start)
+        self.dirs = [
+            self.start,
+            os.path.dirname(self.start),
+            os.path.dirname(os.path.dirname(self.start)),
+            self.top,
+        ]
+        for dirname in self.dirs:
+            self.write(os.path.join(dirname, "disc.yaml"), f"D: {dirname}\n")
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def write(filename, contents):
+        """
+        Write a file
+        """
+        with open(filename, "w", encoding="utf-8") as dest:
+            dest.write(contents)
+
+    def find(self, **discovery):
+        """
+        Find the "disc.yaml" files from the start directory
+        """
+        return django_yamlconf.find_conffiles(
+            "disc.yaml",
+            self.start,
+            discovery,
+        )
+
+    def test_stop_dir(self):
+        """
+        The search stops at the stop directory
+        """
+        self.assertEqual(self.find(stop_dir=self.dirs[1]), [
+            os.path.join(dirname, "disc.yaml") for dirname in self.dirs[:2]
+        ])
+
+    def test_max_depth(self):
+        """
+        The search stops after the maximum number of parent directories
+        """
+        self.assertEqual(len(self.find(max_depth=0)), 1)
+        self.assertEqual(len(self.find(max_depth=2)), 3)
+
+    def test_root_marker(self):
+        """
+        The search stops at a directory containing a root marker
+        """
+        os.mkdir(os.path.join(self.dirs[2], ".git"))
+        self.assertEqual(len(self.find(root_markers=[".git"])), 3)
+
+    def test_cache(self):
+        """
+        The files found are remembered until the cache is cleared
+        """
+        self.assertEqual(len(self.find(stop_dir=self.top)), 4)
+        os.unlink(os.path.join(self.dirs[1], "disc.yaml"))
+        with mock.patch("os.access", wraps=os.access) as access, \
+                mock.patch("os.stat", wraps=os.stat) as stat:
+            self.assertEqual(len(self.find(stop_dir=self.top)), 4)
+        self.assertEqual(access.call_count, 0)
+        self.assertEqual(stat.call_count, 0)
+        self.assertEqual(
+            len(django_yamlconf.find_conffiles(
+                "disc.yaml",
+                self.start,
+                {'stop_dir': self.top},
+                cached=False,
+            )),
+            3
+        )
+        self.write(os.path.join(self.dirs[1], "disc.yaml"), "D: again\n")
+        self.assertEqual(len(self.find(stop_dir=self.top)), 3)
+        django_yamlconf.clear_discovery_cache()
+        self.assertEqual(len(self.find(stop_dir=self.top)), 4)
+
+    def test_conffiles(self):
+        """
+        An explicit list of files skips the discovery
+        """
+        settings = MockSettings()
+        filenames = [
+            os.path.join(self.dirs[0], "disc.yaml"),
+            os.path.join(self.dirs[0], "missing.yaml"),
+        ]
+        with mock.patch.dict(os.environ, {"YAMLCONF_CONFFILE": ""}):
+            with self.assertLogs("", level="ERROR") as logs:
+                django_yamlconf.load(
+                    project="nosuch",
+                    settings=settings,
+                    conffiles=filenames,
+                )
+        self.assertEqual(settings.D, self.dirs[0])
+        self.assertIn("missing.yaml", logs.output[0])
@@ -73,3 +73,28 @@ class TestExpand(YCTestCase):
                 self.assertIn(
                     "Reference to undefined", "\n".join(logs.output)
                 )
+
+    def test_raw_copied(self):
+        """
+        Raw values are copied: changing the expanded value does not change
+        the definition
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {
+                "RAW": {"K": ["{A}"]},
+                "RAW:raw": True,
+                "NESTED": {"K": {"L": ["{A}"]}, "K:raw": True},
+            },
+            "**TESTING**",
+        )
+        for name in ("RAW", "NESTED"):
+            info = django_yamlconf.get_attr_info(name, self.settings)
+            self.assertEqual(info['evalue'], info['value'])
+            self.assertIn("{A}", str(info['evalue']))
+        info = django_yamlconf.get_attr_info("RAW", self.settings)
+        info['evalue']["K"].append("b")
+        self.assertEqual(info['value'], {"K": ["{A}"]})
+        info = django_yamlconf.get_attr_info("NESTED", self.settings)
+        info['evalue']["K"]["L"].append("b")
+        self.assertEqual(info['value']["K"], {"L": ["{A}"]})
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the attribute reference graph and the single pass expansion.
+"""
+
+from io import StringIO
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestGraph(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Initialize the mock settings object
+        """
+        self.settings = MockSettings()
+        django_yamlconf.load(project="expand", settings=self.settings)
+
+    def test_deep_chain(self):
+        """
+        Deep reference chains are expanded, in any definition order
+        """
+        chain = {f"C{i}": f"{{C{i + 1}}}." for i in range(1000)}
+        chain["C1000"] = "end"
+        django_yamlconf.add_attributes(self.settings, chain, "**TESTING**")
+        self.assertEqual(self.settings.C0, "end" + "." * 1000)
+
+    def test_single_pass(self):
+        """
+        Substituted values are not expanded again
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"P": "{{A}}", "Q": "q{P}"},
+            "**TESTING**",
+        )
+        self.assertEqual(self.settings.P, "{A}")
+        self.assertEqual(self.settings.Q, "q{A}")
+
+    def test_cycle_path(self):
+        """
+        Recursive definitions are reported with the reference cycle
+        """
+        with self.assertLogs("", level="ERROR") as logs:
+            django_yamlconf.add_attributes(
+                self.settings,
+                {"R1": "{R2}", "R2": "{R3}", "R3": "{R1}"},
+                "**TESTING**",
+            )
+        self.assertIn('"R1": R1 -> R2 -> R3 -> R1', "\n".join(logs.output))
+        self.assertEqual(self.settings.R2, "{R3}")
+
+    def test_dependencies(self):
+        """
+        Direct and indirect references
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"D": "{A}/d"},
+            "**TESTING**",
+        )
+        self.assertEqual(
+            django_yamlconf.attr_dependencies("D", self.settings),
+            ["A"],
+        )
+        self.assertEqual(
+            django_yamlconf.attr_dependencies(
+                "D", self.settings, recursive=True
+            ),
+            ["A", "B"],
+        )
+        self.assertEqual(
+            django_yamlconf.attr_dependencies(
+                "B", self.settings, reverse=True, recursive=True
+            ),
+            ["A", "D"],
+        )
+        self.assertIsNone(
+            django_yamlconf.attr_dependencies("NO_SUCH", self.settings)
+        )
+
+    def test_list_deps(self):
+        """
+        Listing of references, including recursive definitions
+        """
+        out = StringIO()
+        django_yamlconf.list_deps("X", settings=self.settings, stream=out)
+        self.assertIn("Recursive definition: X -> Y -> X", out.getvalue())
+        self.assertIn("References:\n    Y\n", out.getvalue())
+        self.assertIn("Referenced by:\n    Y\n", out.getvalue())
+
+    def test_shared_templates(self):
+        """
+        Identical format strings give the same expansion
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"S1": "{A}/s", "S2": ["{A}/s", {"K": "{A}/s"}]},
+            "**TESTING**",
+        )
+        self.assertEqual(self.settings.S1, "ab/s")
+        self.assertEqual(self.settings.S2, ["ab/s", {"K": "ab/s"}])
+
+    def test_no_aliasing(self):
+        """
+        Expanded values do not share containers with the raw values
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"L": ["{B}", ["b"]]},
+            "**TESTING**",
+        )
+        self.settings.L[1].append("c")
+        info = django_yamlconf.get_attr_info("L", self.settings)
+        self.assertEqual(info['value'], ["{B}", ["b"]])
+        self.assertEqual(info['evalue'], ["b", ["b", "c"]])
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the attribute history modes.
+"""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestHistory(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Create a YAMLCONF file eclipsing the values for the "ycexplain"
+        project
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.conffile = os.path.join(self.tmpdir.name, "conf.yaml")
+        with open(self.conffile, "w", encoding="utf-8") as dest:
+            dest.write("A: 'Final value of A'\n")
+        self.environ = mock.patch.dict(
+            os.environ,
+            {"YAMLCONF_CONFFILE": self.conffile},
+        )
+        self.environ.start()
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.environ.stop()
+        self.tmpdir.cleanup()
+
+    def load(self, history, **kwargs):
+        """
+        Load the "ycexplain" project with the given history mode
+        """
+        settings = MockSettings()
+        django_yamlconf.load(
+            project="ycexplain",
+            settings=settings,
+            history=history,
+            **kwargs
+        )
+        return settings
+
+    def test_full(self):
+        """
+        All eclipsed values are recorded
+        """
+        settings = self.load("full")
+        info = django_yamlconf.get_attr_info("A", settings)
+        self.assertEqual(
+            [value for value, _ in info['history']],
+            ["Value of A", None],
+        )
+
+    def test_last(self):
+        """
+        Only the last eclipsed value is recorded
+        """
+        settings = self.load("last")
+        info = django_yamlconf.get_attr_info("A", settings)
+        self.assertEqual(len(info['history']), 1)
+        self.assertEqual(info['history'][0][0], "Value of A")
+
+    def test_off(self):
+        """
+        No history is recorded, it is rebuilt when requested
+        """
+        settings = self.load("off")
+        attributes = django_yamlconf.get_cached_attributes(settings)
+        self.assertEqual(attributes["A"]['history'], ())
+        self.assertEqual(settings.A, "Final value of A")
+        out = StringIO()
+        django_yamlconf.explain("A", settings=settings, stream=out)
+        self.assertIn('"Value of A" via', out.getvalue())
+        self.assertEqual(len(attributes["A"]['history']), 2)
+
+    def test_off_snapshot(self):
+        """
+        The history is rebuilt for attributes loaded from a snapshot
+        """
+        snapshot_dir = os.path.join(self.tmpdir.name, "snapshots")
+        self.load("off", snapshot_dir=snapshot_dir)
+        with mock.patch(
+            "django_yamlconf.merge_conffile",
+            wraps=django_yamlconf.merge_conffile,
+        ) as merge_conffile:
+            settings = self.load("off", snapshot_dir=snapshot_dir)
+        self.assertEqual(merge_conffile.call_count, 0)
+        info = django_yamlconf.get_attr_info("A", settings)
+        self.assertEqual(info['history'][0][0], "Value of A")
+
+    def test_invalid(self):
+        """
+        Invalid history modes are reported
+        """
+        with self.assertLogs("", level="ERROR") as logs:
+            settings = self.load("some")
+        self.assertIn("Invalid YAMLCONF history", "\n".join(logs.output))
+        info = django_yamlconf.get_attr_info("A", settings)
+        self.assertEqual(len(info['history']), 2)
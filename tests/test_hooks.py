@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the load instrumentation hooks.
+"""
+
+import os
+import socket
+import tempfile
+
+import django_yamlconf
+from django_yamlconf import hooks
+from tests import YCTestCase
+from tests import new_settings
+
+
+class TestHooks(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Register a callback recording the events
+        """
+        self.events = []
+        hooks.register(self.events.append)
+
+    def tearDown(self):
+        """
+        Unregister the callback
+        """
+        hooks.unregister(self.events.append)
+
+    def named(self, name):
+        """
+        Return the recorded events with the given name
+        """
+        return [event for event in self.events if event.name == name]
+
+    def test_load_events(self):
+        """
+        A load fires events for each step, the load event is last
+        """
+        django_yamlconf.load(project="lazy", settings=new_settings())
+        self.assertEqual(self.events[-1].name, "load")
+        for name in ("load_conffile", "load_envdefs",
+                     "expand_attribute_refs", "inject_attr"):
+            self.assertTrue(self.named(name), name)
+        load_event = self.named("load")[0]
+        self.assertGreaterEqual(load_event.files, 1)
+        self.assertGreater(load_event.attributes, 0)
+        self.assertGreater(load_event.duration, 0)
+        file_event = self.named("load_conffile")[0]
+        self.assertEqual(
+            file_event.filename,
+            os.path.join(os.path.dirname(__file__), "lazy.yaml")
+        )
+        self.assertEqual(file_event.attributes, 6)
+
+    def test_errors(self):
+        """
+        Errors logged are counted: the recursive definitions of X and Y
+        """
+        django_yamlconf.load(project="lazy", settings=new_settings())
+        self.assertEqual(self.named("expand_attribute_refs")[0].errors, 2)
+        self.assertEqual(self.named("load")[0].errors, 2)
+        self.assertEqual(self.named("load_conffile")[0].errors, 0)
+
+    def test_callback_failure(self):
+        """
+        A failing callback does not fail the load
+        """
+        def failing(event):
+            raise ValueError(event.name)
+
+        hooks.register(failing)
+        try:
+            settings = new_settings()
+            django_yamlconf.load(project="lazy", settings=settings)
+        finally:
+            hooks.unregister(failing)
+        self.assertEqual(settings.A, "ab")
+        self.assertTrue(self.named("load"))
+
+    def test_sysfiles(self):
+        """
+        The sysfiles event counts the files rendered
+        """
+        settings = new_settings()
+        django_yamlconf.load(project="lazy", settings=settings)
+        django_yamlconf.add_attributes(
+            settings,
+            {
+                "YAMLCONF_SYSFILES_DIR": os.path.join(
+                    os.path.dirname(__file__), "sys", "test1"
+                ),
+            },
+            "**TESTING**",
+        )
+        django_yamlconf.sysfiles(
+            create=False,
+            noop=True,
+            settings=settings,
+            render=lambda source, attrs: source,
+        )
+        self.assertEqual(self.named("sysfiles")[0].files, 1)
+
+    def test_unregistered(self):
+        """
+        No events once unregistered
+        """
+        hooks.unregister(self.events.append)
+        django_yamlconf.load(project="lazy", settings=new_settings())
+        self.assertEqual(self.events, [])
+
+
+class TestStatsd(YCTestCase):
+    """
+    Test class
+    """
+
+    def check_metrics(self, server, address):
+        """
+        Load sending the metrics to the address, the load metrics are
+        received by the server socket.
+        """
+        server.settimeout(5)
+        settings = new_settings()
+        settings.YAMLCONF_STATSD = address
+        try:
+            django_yamlconf.load(project="lazy", settings=settings)
+        finally:
+            hooks.unregister(hooks.statsd(address))
+        payloads = []
+        while True:
+            payload = server.recv(4096).decode("utf-8")
+            payloads.append(payload)
+            if payload.startswith("yamlconf.load."):
+                break
+        self.assertIn("yamlconf.load_conffile.files:1|g", payloads[0])
+        lines = payloads[-1].split("\n")
+        self.assertRegex(lines[0], r"^yamlconf\.load\.duration:[0-9.]+\|ms$")
+        self.assertIn("yamlconf.load.errors:2|c", lines)
+
+    def test_udp(self):
+        """
+        Metrics sent via UDP
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+            server.bind(("127.0.0.1", 0))
+            self.check_metrics(server, f"127.0.0.1:{server.getsockname()[1]}")
+
+    def test_unix(self):
+        """
+        Metrics sent via a Unix domain socket
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "statsd.sock")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as server:
+                server.bind(path)
+                self.check_metrics(server, path)
+
+    def test_no_server(self):
+        """
+        Metrics to a missing server are dropped
+        """
+        hook = hooks.StatsdHook("/no/such/statsd.sock")
+        event = hooks.HookEvent("load")
+        event.duration = 0.5
+        hook(event)
+        self.assertIsNone(hook._socket)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the lazy expansion and injection of attributes.
+"""
+
+from io import StringIO
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+from tests import new_settings
+
+
+class TestLazy(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Load the "expand" attributes lazily
+        """
+        self.settings = new_settings(X="original")
+        django_yamlconf.load(
+            project="lazy",
+            settings=self.settings,
+            lazy=True,
+        )
+        self.attributes = getattr(self.settings, "_YAMLCONF_ATTRIBUTES")
+
+    def test_not_expanded(self):
+        """
+        Values are not expanded until accessed
+        """
+        self.assertIsNone(self.attributes['A']['evalue'])
+        self.assertNotIn('A', self.settings.__dict__)
+        self.assertNotIn('X', self.settings.__dict__)
+
+    def test_access(self):
+        """
+        Values are expanded and memoized on first access
+        """
+        self.assertEqual(self.settings.A, "ab")
+        self.assertEqual(self.settings.__dict__['A'], "ab")
+        self.assertEqual(self.attributes['A']['evalue'], "ab")
+        self.assertIsNone(self.attributes['ETC_DIR']['evalue'])
+
+    def test_recursive(self):
+        """
+        Recursive definitions match the eager expansion
+        """
+        self.assertEqual(self.settings.X, "{Y}")
+        self.assertEqual(self.settings.Y, "{X}")
+
+    def test_dir(self):
+        """
+        Lazy attributes are listed by "dir", e.g., for Django's settings
+        """
+        self.assertIn('ETC_DIR', dir(self.settings))
+        with self.assertRaises(AttributeError):
+            getattr(self.settings, "NO_SUCH_ATTRIBUTE")
+
+    def test_nested(self):
+        """
+        Dictionary elements are injected immediately
+        """
+        self.assertEqual(self.settings.__dict__['NESTED'], {"A": 1, "B": "b"})
+        self.assertEqual(self.attributes['NESTED.B']['evalue'], "b")
+
+    def test_explain(self):
+        """
+        The ycexplain output matches the eager mode
+        """
+        eager = new_settings(X="original")
+        django_yamlconf.load(project="lazy", settings=eager)
+        for name in ("A", "ETC_DIR", "NESTED.B", "X"):
+            lazy_out = StringIO()
+            eager_out = StringIO()
+            django_yamlconf.explain(name, self.settings, lazy_out)
+            django_yamlconf.explain(name, eager, eager_out)
+            self.assertEqual(lazy_out.getvalue(), eager_out.getvalue())
+
+    def test_list(self):
+        """
+        The yclist output matches the eager mode
+        """
+        eager = new_settings(X="original")
+        django_yamlconf.load(project="lazy", settings=eager)
+        lazy_out = StringIO()
+        eager_out = StringIO()
+        django_yamlconf.list_attrs(self.settings, lazy_out)
+        django_yamlconf.list_attrs(eager, eager_out)
+        self.assertEqual(lazy_out.getvalue(), eager_out.getvalue())
+
+    def test_add_attributes(self):
+        """
+        Adding attributes expands all attributes
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"B": "c"},
+            "**TESTING**",
+        )
+        self.assertEqual(self.settings.__dict__['A'], "ac")
+        # Only the predefined attributes are still computed on first use
+        self.assertIsNone(self.settings._YAMLCONF_LAZY)
+        self.assertNotIn('OS_NODE', self.settings.__dict__)
+        self.assertIsNotNone(self.settings.OS_NODE)
+
+    def test_not_module(self):
+        """
+        Values are injected immediately for non-module settings
+        """
+        settings = MockSettings()
+        django_yamlconf.load(project="lazy", settings=settings, lazy=True)
+        self.assertEqual(settings.A, "ab")
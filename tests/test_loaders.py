@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the selection of the loader backends.
+"""
+
+import json
+
+import yaml
+
+import django_yamlconf
+from django_yamlconf import positions
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestLoaders(YCTestCase):
+    """
+    Test class
+    """
+
+    def test_yaml_default(self):
+        """
+        The libyaml loader is preferred if available
+        """
+        name, loader, kwargs = django_yamlconf.select_loader("yaml")
+        self.assertIs(loader, positions.load)
+        if hasattr(yaml, "CSafeLoader"):
+            self.assertEqual(name, "libyaml")
+            self.assertIs(kwargs['Loader'], yaml.CSafeLoader)
+        else:
+            self.assertEqual(name, "python")
+            self.assertIs(kwargs['Loader'], yaml.SafeLoader)
+
+    def test_yaml_python(self):
+        """
+        The pure Python loader can be requested
+        """
+        name, _, kwargs = django_yamlconf.select_loader("yaml", "python")
+        self.assertEqual(name, "python")
+        self.assertIs(kwargs['Loader'], yaml.SafeLoader)
+
+    def test_json_stdlib(self):
+        """
+        The standard JSON loader can be requested
+        """
+        name, loader, kwargs = django_yamlconf.select_loader("json", "json")
+        self.assertEqual(name, "json")
+        self.assertIs(loader, json.load)
+        self.assertEqual(kwargs, {})
+
+    def test_unknown_backend(self):
+        """
+        An unknown backend falls back to the default selection
+        """
+        with self.assertLogs("", level="WARNING") as logs:
+            name, _, _ = django_yamlconf.select_loader("yaml", "nosuch")
+        self.assertIn('backend "nosuch" not available', logs.output[0])
+        self.assertIn(name, ("libyaml", "python"))
+
+    def test_load_backends(self):
+        """
+        All available backends load the same attributes
+        """
+        for syntax in ("yaml", "json"):
+            for backend in django_yamlconf._LOADER_BACKENDS[syntax]:
+                settings = MockSettings()
+                settings.YAMLCONF_LOADER_BACKEND = backend
+                django_yamlconf.load(
+                    syntax=syntax,
+                    project="loaders",
+                    settings=settings,
+                )
+                self.assertEqual(settings.A, "ab", (syntax, backend))
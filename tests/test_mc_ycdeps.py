@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the management command ycdeps
+"""
+
+import django_yamlconf
+
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
+from tests import YCTestCase
+
+
+class MgmtCmdYcdepsTest(YCTestCase):
+
+    def setUp(self):
+        django_yamlconf.load(project="tests", settings=settings)
+
+    def test_ycdeps_1(self):
+        out = StringIO()
+        call_command("ycdeps", "--recursive", "XMPL", stdout=out)
+        self.assertIn('XMPL = "Environment defined"', out.getvalue())
+
+    def test_ycdeps_missing(self):
+        out = StringIO()
+        call_command("ycdeps", "NO_SUCH_ATTR", stdout=out)
+        self.assertIn('is not managed by YAMLCONF', out.getvalue())
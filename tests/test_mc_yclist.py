@@ -5,6 +5,7 @@
 Test the management comamnd yclist
 """
 
+import json
 import django_yamlconf
 
 from io import StringIO
@@ -27,3 +28,16 @@ class MgmtCmdYclistTest(YCTestCase):
         out = StringIO()
         call_command("yclist", stdout=out)
         self.assertIn('XMPL           Environment defined', out.getvalue())
+
+    def test_yclist_format(self):
+        out = StringIO()
+        call_command(
+            "yclist",
+            "--format=ndjson",
+            "--name=CPU_*",
+            "--evalue",
+            stdout=out
+        )
+        record = json.loads(out.getvalue())
+        self.assertEqual(record['name'], "CPU_COUNT")
+        self.assertIn('evalue', record)
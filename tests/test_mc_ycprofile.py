@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the management command ycprofile
+"""
+
+import json
+import os
+
+import django_yamlconf
+
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
+from tests import YCTestCase
+
+
+class MgmtCmdYcprofileTest(YCTestCase):
+
+    def setUp(self):
+        django_yamlconf.load(project="tests", settings=settings)
+
+    def test_ycprofile_text(self):
+        out = StringIO()
+        call_command("ycprofile", "--project", "ycexplain", stdout=out)
+        self.assertIn('Phases:', out.getvalue())
+        self.assertIn('expansion', out.getvalue())
+        self.assertIn('Files:', out.getvalue())
+        self.assertIn(
+            os.path.join(os.path.dirname(__file__), "ycexplain.yaml"),
+            out.getvalue()
+        )
+
+    def test_ycprofile_json(self):
+        out = StringIO()
+        call_command(
+            "ycprofile", "--project", "ycexplain", "--format", "json",
+            "--top", "1", stdout=out
+        )
+        data = json.loads(out.getvalue())
+        self.assertIn('read', data['phases'])
+        self.assertIn('merge', data['phases'])
+        self.assertIn(
+            os.path.join(os.path.dirname(__file__), "ycexplain.yaml"),
+            [record['filename'] for record in data['files']]
+        )
+        self.assertIn('A', data['passes'])
+        self.assertEqual(data['passes']['B'], 1)
+        self.assertEqual(len(data['slowest']), 1)
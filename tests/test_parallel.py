@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the concurrent parsing of the YAMLCONF files.
+"""
+
+import os
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+TESTS_DIR = os.path.dirname(__file__)
+
+
+class TestParallel(YCTestCase):
+    """
+    Test class
+    """
+
+    def load(self, parallel):
+        """
+        Load the "expand" attributes with the "env.yaml" file as the final
+        configuration file.
+        """
+        settings = MockSettings()
+        with mock.patch.dict(os.environ, {
+            "YAMLCONF_CONFFILE": os.path.join(TESTS_DIR, "env.yaml"),
+        }):
+            django_yamlconf.load(
+                project="expand",
+                settings=settings,
+                parallel=parallel,
+            )
+        return settings
+
+    def test_same_attributes(self):
+        """
+        The attributes and provenance match the serial load
+        """
+        serial = django_yamlconf.get_cached_attributes(self.load(None))
+        parallel = django_yamlconf.get_cached_attributes(self.load(4))
+        self.assertEqual(serial, parallel)
+        self.assertEqual(
+            parallel['XMPL']['source'],
+            os.path.join(TESTS_DIR, "env.yaml"),
+        )
+
+    def test_read_order(self):
+        """
+        The files are generated in the order given
+        """
+        loader, kwargs = django_yamlconf.get_loader("yaml")
+        filenames = [
+            os.path.join(TESTS_DIR, name)
+            for name in sorted(os.listdir(TESTS_DIR))
+            if name.endswith(".yaml")
+        ]
+        results = list(django_yamlconf.read_conffiles(
+            filenames,
+            loader,
+            kwargs,
+            parallel=3,
+        ))
+        self.assertEqual([name for name, _ in results], filenames)
+        for filename, data in results:
+            self.assertEqual(
+                data,
+                django_yamlconf.read_conffile(loader, kwargs, filename),
+            )
+
+    def test_missing_conffile(self):
+        """
+        A missing configuration file is still an error
+        """
+        loader, kwargs = django_yamlconf.get_loader("yaml")
+        with self.assertRaises(FileNotFoundError):
+            list(django_yamlconf.read_conffiles(
+                [os.path.join(TESTS_DIR, "expand.yaml"), "/no/such.yaml"],
+                loader,
+                kwargs,
+                parallel=2,
+            ))
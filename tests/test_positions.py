@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the source positions recorded for YAML definitions.
+"""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+import django_yamlconf
+from django_yamlconf import positions
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestPositions(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Create a YAMLCONF file eclipsing values for the "ycexplain" project
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.conffile = os.path.join(self.tmpdir.name, "conf.yaml")
+        with open(self.conffile, "w", encoding="utf-8") as dest:
+            dest.write(
+                "# Final definitions\n"
+                "A: 'Final value of A'\n"
+                "NESTED:\n"
+                "  key: value\n"
+                "  list: [1, 2]\n"
+                "NESTED:append:\n"
+                "  other: 3\n"
+            )
+        self.environ = mock.patch.dict(
+            os.environ,
+            {"YAMLCONF_CONFFILE": self.conffile},
+        )
+        self.environ.start()
+        self.settings = MockSettings()
+        django_yamlconf.load(
+            project="ycexplain",
+            settings=self.settings,
+            history="source",
+        )
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.environ.stop()
+        self.tmpdir.cleanup()
+
+    def test_position(self):
+        """
+        The line and column of definitions are recorded
+        """
+        info = django_yamlconf.get_attr_info("A", self.settings)
+        self.assertEqual(info['position'].line, 2)
+        self.assertEqual(info['position'].column, 1)
+        info = django_yamlconf.get_attr_info("NESTED", self.settings)
+        self.assertEqual(info['position'].line, 6)
+        self.assertIsNone(info['position'].start)
+
+    def test_source_history(self):
+        """
+        Eclipsed values are read again from the source files
+        """
+        info = django_yamlconf.get_attr_info("NESTED", self.settings)
+        span, source = info['history'][0]
+        self.assertIsInstance(span, positions.SourceSpan)
+        self.assertEqual(source, f"{self.conffile}:3")
+        self.assertEqual(span.value, {'key': "value", 'list': [1, 2]})
+
+    def test_explain(self):
+        """
+        The explain output includes the line numbers
+        """
+        out = StringIO()
+        django_yamlconf.explain("A", settings=self.settings, stream=out)
+        self.assertIn(f'(via "{self.conffile}:2")', out.getvalue())
+        self.assertIn('"Value of A" via', out.getvalue())
+
+    def test_missing_file(self):
+        """
+        Values from files no longer available are reported
+        """
+        info = django_yamlconf.get_attr_info("NESTED", self.settings)
+        os.unlink(self.conffile)
+        with self.assertLogs("", level="WARNING") as logs:
+            self.assertIsNone(info['history'][0][0].value)
+        self.assertIn("Failed to read the value", logs.output[0])
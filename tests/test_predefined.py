@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the predefined attributes computed on first use.
+"""
+
+import copy
+import importlib.util
+import os
+import platform
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestPredefinedLazy(YCTestCase):
+    """
+    Test class
+    """
+
+    def module_settings(self):
+        """
+        Return a new settings module
+        """
+        spec = importlib.util.spec_from_file_location(
+            "predefined_settings",
+            os.path.join(os.path.dirname(__file__), "settings.py"),
+        )
+        return importlib.util.module_from_spec(spec)
+
+    def test_unreferenced(self):
+        """
+        Unreferenced values are not computed for settings modules
+        """
+        settings = self.module_settings()
+        with mock.patch("platform.processor") as processor:
+            processor.return_value = "cpu"
+            django_yamlconf.load(project="expand", settings=settings)
+            self.assertEqual(processor.call_count, 0)
+            self.assertNotIn("OS_PROCESSOR", settings.__dict__)
+            self.assertEqual(settings.OS_PROCESSOR, "cpu")
+            self.assertEqual(processor.call_count, 1)
+        self.assertEqual(settings.OS_PROCESSOR, "cpu")
+
+    def test_referenced(self):
+        """
+        Referenced values are computed when expanded
+        """
+        settings = MockSettings()
+        django_yamlconf.load(project="expand", settings=settings)
+        django_yamlconf.add_attributes(
+            settings,
+            {"HOST_DIR": "/srv/{OS_NODE}"},
+            "**TESTING**",
+        )
+        self.assertEqual(settings.HOST_DIR, f"/srv/{platform.node()}")
+        self.assertEqual(settings.CPU_COUNT, os.cpu_count())
+
+    def test_copy(self):
+        """
+        Copies of pending attributes are still pending
+        """
+        attributes = django_yamlconf.bootstrap_attributes("/tmp")
+        self.assertTrue(attributes["USER"].pending)
+        attributes = copy.deepcopy(attributes)
+        self.assertTrue(attributes["USER"].pending)
+        self.assertEqual(attributes["OS_SYSTEM"]['value'], platform.system())
+        self.assertFalse(attributes["OS_SYSTEM"].pending)
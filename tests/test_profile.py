@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the profiling of loads.
+"""
+
+import json
+import os
+import time
+from io import StringIO
+
+import django_yamlconf
+from django_yamlconf import profiling
+from tests import YCTestCase
+from tests import new_settings
+
+
+class TestProfile(YCTestCase):
+    """
+    Test class
+    """
+
+    def test_load_profile(self):
+        """
+        A profiled load records the phases, files and expansions
+        """
+        settings = new_settings()
+        profile = profiling.LoadProfile()
+        django_yamlconf.load(
+            project="lazy",
+            settings=settings,
+            profile=profile
+        )
+        self.assertEqual(settings.A, "ab")
+        for phase in ("setup", "discovery", "read", "merge", "environment",
+                      "expansion", "injection"):
+            self.assertIn(phase, profile.phases)
+        self.assertAlmostEqual(profile.total, sum(profile.phases.values()))
+        filename = os.path.join(os.path.dirname(__file__), "lazy.yaml")
+        self.assertEqual(profile.files[0]['filename'], filename)
+        self.assertEqual(profile.files[0]['bytes'], os.path.getsize(filename))
+        self.assertEqual(profile.attributes['A'][1], 1)
+        self.assertEqual(profile.attributes['B'][1], 0)
+        self.assertNotIn('X', profile.attributes)
+
+    def test_profile_load(self):
+        """
+        Profiling the load does not change the settings
+        """
+        settings = new_settings()
+        django_yamlconf.load(project="lazy", settings=settings)
+        attributes = django_yamlconf.get_cached_attributes(settings)
+        profile = django_yamlconf.profile_load(settings, project="lazy")
+        self.assertIs(
+            django_yamlconf.get_cached_attributes(settings),
+            attributes
+        )
+        self.assertEqual(settings.NESTED, {"A": 1, "B": "b"})
+        self.assertIn("A", profile.attributes)
+        self.assertGreater(profile.format_passes, 0)
+
+    def test_json(self):
+        """
+        The JSON output lists the slowest attributes
+        """
+        settings = new_settings()
+        profile = django_yamlconf.profile_load(settings, project="lazy")
+        out = StringIO()
+        profile.write_json(out, count=2)
+        data = json.loads(out.getvalue())
+        self.assertEqual(len(data['slowest']), 2)
+        self.assertEqual(data['passes']['A'], 1)
+        self.assertEqual(
+            data['bytes'],
+            sum(info['bytes'] for info in profile.files)
+        )
+        self.assertEqual(list(data['phases'])[0], "setup")
+
+    def test_nested_phases(self):
+        """
+        Phase times exclude the time of nested phases
+        """
+        profile = profiling.LoadProfile()
+        with profile.phase("outer"):
+            with profile.phase("inner"):
+                time.sleep(0.01)
+        self.assertAlmostEqual(
+            profile.total,
+            profile.phases["outer"] + profile.phases["inner"]
+        )
+        self.assertLess(profile.phases["outer"], profile.phases["inner"])
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the incremental reloading of YAMLCONF files.
+"""
+
+import os
+import tempfile
+import threading
+import types
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestReload(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Load reloadable attributes from a temporary configuration file
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.conffile = os.path.join(self.tmpdir.name, "conf.yaml")
+        self.write_conffile(
+            "A: 'a{B}'\nB: b\nC: '{TOP_DIR}/c'\nLIST:append: b\nX: x\n"
+        )
+        self.environ = mock.patch.dict(
+            os.environ,
+            {"YAMLCONF_CONFFILE": self.conffile},
+        )
+        self.environ.start()
+        self.settings = MockSettings()
+        self.settings.LIST = ["z"]
+        self.settings.X = "original"
+        django_yamlconf.load(
+            project="reload",
+            settings=self.settings,
+            reloadable=True,
+        )
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.environ.stop()
+        self.tmpdir.cleanup()
+
+    def write_conffile(self, contents):
+        """
+        Rewrite the configuration file with a new modification time
+        """
+        with open(self.conffile, "w", encoding="utf-8") as dest:
+            dest.write(contents)
+        stat = os.stat(self.conffile)
+        os.utime(self.conffile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    def test_unchanged(self):
+        """
+        Nothing is parsed if the files are unchanged
+        """
+        with mock.patch("django_yamlconf.read_conffile") as read_conffile:
+            self.assertEqual(django_yamlconf.reload(self.settings), set())
+        read_conffile.assert_not_called()
+
+    def test_changed_value(self):
+        """
+        Changed values, and the values referencing them, are updated
+        """
+        self.write_conffile(
+            "A: 'a{B}'\nB: c\nC: '{TOP_DIR}/c'\nLIST:append: b\nX: x\n"
+        )
+        changed = django_yamlconf.reload(self.settings)
+        self.assertEqual(changed, {"A", "B"})
+        self.assertEqual(self.settings.A, "ac")
+        self.assertEqual(self.settings.LIST, ["z", "b"])
+        info = django_yamlconf.get_attr_info("A", self.settings)
+        self.assertEqual(info['evalue'], "ac")
+
+    def test_pending_predefined(self):
+        """
+        Pending predefined values are not computed by a reload
+        """
+        settings = types.ModuleType("reload_settings")
+        settings.LIST = ["z"]
+        django_yamlconf.load(
+            project="reload",
+            settings=settings,
+            reloadable=True,
+        )
+        attributes = django_yamlconf.get_cached_attributes(settings)
+        self.assertTrue(attributes["USER"].pending)
+        self.write_conffile(
+            "A: 'a{B}'\nB: c\nC: '{TOP_DIR}/c'\nLIST:append: b\nX: x\n"
+        )
+        with mock.patch("getpass.getuser", return_value="bob") as getuser:
+            changed = django_yamlconf.reload(settings)
+            getuser.assert_not_called()
+            self.assertEqual(changed, {"A", "B"})
+            attributes = django_yamlconf.get_cached_attributes(settings)
+            self.assertTrue(attributes["USER"].pending)
+            self.assertEqual(settings.USER, "bob")
+
+    def test_removed_value(self):
+        """
+        Removed values are restored to the settings value
+        """
+        self.write_conffile("A: 'a{B}'\nB: b\nC: '{TOP_DIR}/c'\n")
+        changed = django_yamlconf.reload(self.settings)
+        self.assertEqual(changed, {"LIST", "X"})
+        self.assertEqual(self.settings.LIST, ["z"])
+        self.assertEqual(self.settings.X, "original")
+
+    def test_environment(self):
+        """
+        Changes to YAMLCONF environment variables are reloaded
+        """
+        with mock.patch.dict(os.environ, {"YAMLCONF_B": "d"}):
+            self.assertEqual(
+                django_yamlconf.reload(self.settings),
+                {"A", "B"},
+            )
+        self.assertEqual(self.settings.A, "ad")
+
+    def test_not_reloadable(self):
+        """
+        Reloading requires the "reloadable" option
+        """
+        settings = MockSettings()
+        django_yamlconf.load(project="reload", settings=settings)
+        with self.assertLogs("", level="ERROR") as logs:
+            self.assertEqual(django_yamlconf.reload(settings), set())
+        self.assertIn('not loaded as "reloadable"', logs.output[0])
+
+    def test_watch(self):
+        """
+        The watcher reloads changed files calling the callback
+        """
+        reloaded = threading.Event()
+        changes = []
+
+        def callback(changed):
+            changes.append(changed)
+            reloaded.set()
+
+        watcher = django_yamlconf.watch(
+            self.settings,
+            interval=0.01,
+            debounce=0.01,
+            callback=callback,
+        )
+        try:
+            self.write_conffile(
+                "A: 'a{B}'\nB: b\nC: '{TOP_DIR}/c'\nLIST:append: b\nX: y\n"
+            )
+            self.assertTrue(reloaded.wait(5))
+        finally:
+            watcher.stop()
+            watcher.join()
+        self.assertEqual(changes, [{"X"}])
+        self.assertEqual(self.settings.X, "y")
+
+    def test_watch_callback_error(self):
+        """
+        The watcher keeps polling if the callback fails
+        """
+        failed = threading.Event()
+        reloaded = threading.Event()
+        changes = []
+
+        def callback(changed):
+            changes.append(changed)
+            if not failed.is_set():
+                failed.set()
+                raise ValueError("callback failure")
+            reloaded.set()
+
+        watcher = django_yamlconf.watch(
+            self.settings,
+            interval=0.01,
+            debounce=0.01,
+            callback=callback,
+        )
+        try:
+            with self.assertLogs("django_yamlconf", level="ERROR") as logs:
+                for value, event in (("y", failed), ("z", reloaded)):
+                    self.write_conffile(
+                        "A: 'a{B}'\nB: b\nC: '{TOP_DIR}/c'\n"
+                        f"LIST:append: b\nX: {value}\n"
+                    )
+                    self.assertTrue(event.wait(5))
+        finally:
+            watcher.stop()
+            watcher.join()
+        self.assertIn("YAMLCONF reload callback failed", logs.output[0])
+        self.assertIn("callback failure", logs.output[0])
+        self.assertEqual(changes, [{"X"}, {"X"}])
+        self.assertEqual(self.settings.X, "z")
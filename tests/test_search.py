@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the search index for the attribute names
+"""
+
+import django_yamlconf
+
+from django_yamlconf import search
+from tests import MockSettings
+from tests import YCTestCase
+
+
+def make_attributes():
+    attributes = {}
+    for name, source in (
+            ("DEBUG", "base.yaml"),
+            ("LOGGING.handlers.console.level", "base.yaml"),
+            ("LOGGING.handlers.file.level", "prod.yaml"),
+            ("LOGGING.root.level", "base.yaml"),
+            ("LOG_DIR", "prod.yaml"),
+            ("DATABASES.default.NAME", "prod.yaml"),
+            ("SECRET_KEY", "settings")):
+        django_yamlconf.add_attr_info(attributes, name, "value", source)
+    return attributes
+
+
+class TestSearch(YCTestCase):
+
+    def setUp(self):
+        self.index = search.AttributeIndex(make_attributes())
+
+    def test_all(self):
+        self.assertEqual(self.index.search(), sorted(make_attributes()))
+
+    def test_prefix(self):
+        self.assertEqual(
+            self.index.search("LOG", "prefix"),
+            [
+                "LOGGING.handlers.console.level",
+                "LOGGING.handlers.file.level",
+                "LOGGING.root.level",
+                "LOG_DIR",
+            ]
+        )
+        self.assertEqual(self.index.search("log", "prefix"), [])
+        self.assertEqual(self.index.search("ZZZ", "prefix"), [])
+
+    def test_substring(self):
+        self.assertEqual(
+            self.index.search("level"),
+            [
+                "LOGGING.handlers.console.level",
+                "LOGGING.handlers.file.level",
+                "LOGGING.root.level",
+            ]
+        )
+        self.assertEqual(
+            self.index.search("e"),
+            [name for name in sorted(make_attributes()) if name != "LOG_DIR"]
+        )
+        self.assertEqual(self.index.search("g.h"), [
+            "LOGGING.handlers.console.level",
+            "LOGGING.handlers.file.level",
+        ])
+        self.assertEqual(self.index.search("l\nl"), [])
+
+    def test_glob(self):
+        self.assertEqual(
+            self.index.search("LOGGING.handlers.*"),
+            [
+                "LOGGING.handlers.console.level",
+                "LOGGING.handlers.file.level",
+            ]
+        )
+        self.assertEqual(
+            self.index.search("*.level"),
+            [
+                "LOGGING.handlers.console.level",
+                "LOGGING.handlers.file.level",
+                "LOGGING.root.level",
+            ]
+        )
+        self.assertEqual(self.index.search("DEBUG", "glob"), ["DEBUG"])
+        self.assertEqual(self.index.search("DEBU", "glob"), [])
+
+    def test_source(self):
+        self.assertEqual(
+            self.index.sources,
+            ["base.yaml", "prod.yaml", "settings"]
+        )
+        self.assertEqual(
+            self.index.search(source="prod.yaml"),
+            [
+                "DATABASES.default.NAME",
+                "LOGGING.handlers.file.level",
+                "LOG_DIR",
+            ]
+        )
+        self.assertEqual(
+            self.index.search("LOG", "prefix", "prod.yaml"),
+            ["LOGGING.handlers.file.level", "LOG_DIR"]
+        )
+        self.assertEqual(self.index.search(source="nosuch.yaml"), [])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            self.index.search("LOG", "regex")
+
+    def test_get_index(self):
+        settings = MockSettings()
+        attributes = make_attributes()
+        django_yamlconf.inject_attr(attributes, settings)
+        index = search.get_index(settings)
+        self.assertIs(search.get_index(settings), index)
+        django_yamlconf.add_attributes(settings, {'NEW_ATTR': 1}, "test")
+        index = search.get_index(settings)
+        self.assertIn("NEW_ATTR", index.names)
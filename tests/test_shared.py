@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the shared, memory mapped, attribute table.
+"""
+
+import os
+import tempfile
+from io import StringIO
+
+import django_yamlconf
+from django_yamlconf.snapshot import SharedAttributes
+from tests import MockSettings
+from tests import YCTestCase
+from tests import new_settings
+
+
+class TestShared(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Load the "ycexplain" attributes with a shared table
+        """
+        self.settings = MockSettings()
+        self.settings.A = "settings value"
+        django_yamlconf.load(
+            project="ycexplain",
+            settings=self.settings,
+            shared=True,
+        )
+
+    def test_table(self):
+        """
+        The cached attributes are the read-only shared table
+        """
+        attributes = django_yamlconf.get_cached_attributes(self.settings)
+        self.assertIsInstance(attributes, SharedAttributes)
+        self.assertIn("B", attributes)
+        self.assertEqual(attributes["B"]['evalue'], "Value of A")
+        self.assertEqual(self.settings.B, "Value of A")
+
+    def test_explain(self):
+        """
+        The explain output matches the non-shared attributes
+        """
+        settings = MockSettings()
+        settings.A = "settings value"
+        django_yamlconf.load(project="ycexplain", settings=settings)
+        shared_out = StringIO()
+        private_out = StringIO()
+        django_yamlconf.explain("A", self.settings, shared_out)
+        django_yamlconf.explain("A", settings, private_out)
+        self.assertIn("settings value", shared_out.getvalue())
+        self.assertEqual(shared_out.getvalue(), private_out.getvalue())
+
+    def test_read_only(self):
+        """
+        Changes to the attribute information are not saved
+        """
+        info = django_yamlconf.get_attr_info("B", self.settings)
+        info['evalue'] = "changed"
+        info = django_yamlconf.get_attr_info("B", self.settings)
+        self.assertEqual(info['evalue'], "Value of A")
+
+    def test_add_attributes(self):
+        """
+        Adding attributes uses a private copy of the table
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {"A": "new value"},
+            "**TESTING**",
+        )
+        attributes = django_yamlconf.get_cached_attributes(self.settings)
+        self.assertIsInstance(attributes, dict)
+        self.assertEqual(self.settings.B, "new value")
+        self.assertEqual(attributes["A"]['history'][0][0], "Value of A")
+
+    def test_lazy(self):
+        """
+        The hooks for the pending predefined values of a settings module
+        use the shared table, not the private table
+        """
+        settings = new_settings()
+        django_yamlconf.load(
+            project="ycexplain",
+            settings=settings,
+            shared=True,
+            lazy=True,
+        )
+        attributes = django_yamlconf.get_cached_attributes(
+            settings,
+            expand=False
+        )
+        self.assertIsInstance(attributes, SharedAttributes)
+        self.assertTrue(attributes["OS_SYSTEM"].pending)
+        for cell in settings.__getattr__.__closure__:
+            self.assertNotIsInstance(
+                cell.cell_contents,
+                django_yamlconf.LazyExpansion
+            )
+            self.assertNotIsInstance(cell.cell_contents, dict)
+        self.assertEqual(settings.OS_SYSTEM, os.uname().sysname)
+        self.assertEqual(settings.B, "Value of A")
+
+    def test_path(self):
+        """
+        The table can be written to a given file
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "attributes.table")
+            settings = MockSettings()
+            django_yamlconf.load(
+                project="ycexplain",
+                settings=settings,
+                shared=path,
+            )
+            self.assertTrue(os.path.exists(path))
+            attributes = django_yamlconf.get_cached_attributes(settings)
+            self.assertEqual(attributes.path, path)
+            self.assertEqual(attributes["B"]['value'], "{A}")
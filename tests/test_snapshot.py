@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the on-disk snapshots of the loaded attributes.
+"""
+
+import os
+import tempfile
+import types
+from unittest import mock
+
+import django_yamlconf
+from tests import MockSettings
+from tests import YCTestCase
+
+
+class TestSnapshot(YCTestCase):
+    """
+    Test class
+    """
+
+    def setUp(self):
+        """
+        Create a temporary snapshot directory and configuration file
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.snapshot_dir = os.path.join(self.tmpdir.name, "snapshots")
+        self.conffile = os.path.join(self.tmpdir.name, "conf.yaml")
+        self.write_conffile("A: 'a{B}'\nB: b\n")
+        self.environ = mock.patch.dict(
+            os.environ,
+            {"YAMLCONF_CONFFILE": self.conffile},
+        )
+        self.environ.start()
+
+    def tearDown(self):
+        """
+        Remove the temporary files
+        """
+        self.environ.stop()
+        self.tmpdir.cleanup()
+
+    def write_conffile(self, contents):
+        """
+        (Re)write the configuration file, forcing a new modification time
+        """
+        with open(self.conffile, "w", encoding="utf-8") as dest:
+            dest.write(contents)
+
+    def load(self, settings=None):
+        """
+        Load into a new settings object returning the settings and the
+        number of configuration files parsed.
+        """
+        if settings is None:
+            settings = MockSettings()
+        with mock.patch(
+            "django_yamlconf.read_conffile",
+            wraps=django_yamlconf.read_conffile,
+        ) as read_conffile:
+            django_yamlconf.load(
+                project="snapshot",
+                settings=settings,
+                snapshot_dir=self.snapshot_dir,
+            )
+        return settings, read_conffile.call_count
+
+    def test_cold_load(self):
+        """
+        The first load parses the files and writes the snapshot
+        """
+        settings, n_parsed = self.load()
+        self.assertEqual(settings.A, "ab")
+        self.assertEqual(n_parsed, 1)
+        self.assertEqual(len(os.listdir(self.snapshot_dir)), 1)
+
+    def test_warm_load(self):
+        """
+        The second load uses the snapshot
+        """
+        self.load()
+        settings, n_parsed = self.load()
+        self.assertEqual(n_parsed, 0)
+        self.assertEqual(settings.A, "ab")
+        self.assertEqual(
+            django_yamlconf.get_attr_info("A", settings)['source'],
+            self.conffile,
+        )
+
+    def test_predefined_not_computed(self):
+        """
+        The snapshot key does not compute the unused predefined values
+        """
+        settings_file = os.path.join(self.tmpdir.name, "settings.py")
+        with open(settings_file, "w", encoding="utf-8") as dest:
+            dest.write("")
+        for _ in range(2):
+            settings = types.ModuleType("snapshot_settings")
+            settings.__file__ = settings_file
+            settings, n_parsed = self.load(settings)
+            self.assertTrue(
+                django_yamlconf.get_cached_attributes(
+                    settings,
+                    expand=False
+                )['OS_PROCESSOR'].pending
+            )
+        self.assertEqual(n_parsed, 0)
+        self.assertEqual(settings.A, "ab")
+
+    def test_changed_predefined(self):
+        """
+        A predefined value used by the snapshot, e.g., "USER", is checked on
+        a warm start: a different user does not reuse the snapshot
+        """
+        self.write_conffile("LOG_DIR: '/home/{USER}/log'\n")
+        with mock.patch("getpass.getuser", return_value="alice"):
+            settings, n_parsed = self.load()
+            self.assertEqual(settings.LOG_DIR, "/home/alice/log")
+            settings, n_parsed = self.load()
+            self.assertEqual(n_parsed, 0)
+        with mock.patch("getpass.getuser", return_value="bob"):
+            settings, n_parsed = self.load()
+            self.assertEqual(n_parsed, 1)
+            self.assertEqual(settings.LOG_DIR, "/home/bob/log")
+            settings, n_parsed = self.load()
+            self.assertEqual(n_parsed, 0)
+            self.assertEqual(settings.LOG_DIR, "/home/bob/log")
+
+    def test_changed_file(self):
+        """
+        Changing a configuration file invalidates the snapshot
+        """
+        self.load()
+        self.write_conffile("A: 'a{B}'\nB: c\n")
+        settings, n_parsed = self.load()
+        self.assertEqual(n_parsed, 1)
+        self.assertEqual(settings.A, "ac")
+
+    def test_changed_environment(self):
+        """
+        Changing a YAMLCONF environment variable invalidates the snapshot
+        """
+        self.load()
+        with mock.patch.dict(os.environ, {"YAMLCONF_B": "d"}):
+            settings, n_parsed = self.load()
+        self.assertEqual(n_parsed, 1)
+        self.assertEqual(settings.A, "ad")
+
+    def test_changed_settings(self):
+        """
+        Changing a settings value updated by YAMLCONF invalidates the snapshot
+        """
+        self.load()
+        self.write_conffile("LIST:append: b\n")
+        self.load()
+        settings = MockSettings()
+        settings.LIST = ["z"]
+        django_yamlconf.load(
+            project="snapshot",
+            settings=settings,
+            snapshot_dir=self.snapshot_dir,
+        )
+        self.assertEqual(settings.LIST, ["z", "b"])
+
+    def test_invalid_snapshot(self):
+        """
+        An unreadable snapshot is ignored
+        """
+        self.load()
+        for name in os.listdir(self.snapshot_dir):
+            with open(os.path.join(self.snapshot_dir, name), "wb") as dest:
+                dest.write(b"garbage")
+        settings, n_parsed = self.load()
+        self.assertEqual(n_parsed, 1)
+        self.assertEqual(settings.A, "ab")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2025 Broadcom, Inc.  All rights reserved.
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+Test the rendering of values for the YAMLCONF views
+"""
+
+import re
+
+from django.template import engines
+from django.template.loader import render_to_string
+from django_yamlconf import views
+from django_yamlconf.templatetags import yamconf_tags
+from tests import YCTestCase
+
+VALUE = {
+    'version': 1,
+    'handlers': {
+        'console': {'class': "logging.StreamHandler", 'level': None},
+        'file': {'filename': "<log> & 'out'", 'backups': [1, (2, 3)]},
+    },
+    'empty_list': [],
+    'empty_dict': {},
+    '<key>': ["a", ["b", {'c': True}]],
+}
+
+
+def normalize(html):
+    """
+    Remove the whitespace between the HTML tags.
+    """
+    return re.sub(r"\s*(<[^>]*>)\s*", r"\1", html).strip()
+
+
+class TestValueTag(YCTestCase):
+
+    def assert_same(self, value, hide=False):
+        self.assertEqual(
+            normalize(yamconf_tags.render_value(value, hide)),
+            normalize(render_to_string(
+                "yamlconf/value.html",
+                {'value': value, 'hide': hide},
+                using="django"
+            ))
+        )
+
+    def test_scalars(self):
+        for value in ("text", "<b>&</b>", 10, 1.5, None, True, ""):
+            self.assert_same(value)
+
+    def test_nested(self):
+        self.assert_same(VALUE)
+        self.assert_same([VALUE, (1, 2), []])
+
+    def test_hidden(self):
+        self.assert_same(VALUE, hide=True)
+
+    def test_max_depth(self):
+        html = yamconf_tags.render_value(VALUE, max_depth=1)
+        self.assertIn("2 VALUES NOT SHOWN", html)
+        self.assertNotIn("logging.StreamHandler", html)
+        self.assertIn("<tt>1</tt>", html)
+
+    def test_max_items(self):
+        html = yamconf_tags.render_value(list(range(100)), max_items=10)
+        self.assertEqual(html.count("<li>"), 11)
+        self.assertIn("<b>100 values:</b>", html)
+        self.assertIn("<li><em>90 VALUES NOT SHOWN</em></li>", html)
+        self.assertTrue(html.endswith("</ol></div>"))
+
+    def test_deep(self):
+        value = "leaf"
+        for _ in range(5000):
+            value = [value]
+        html = yamconf_tags.render_value(value, max_depth=10000)
+        self.assertEqual(html.count("<ol>"), 5000)
+        self.assertIn("<tt>leaf</tt>", html)
+
+    def test_tag(self):
+        rendered = engines["django"].from_string(
+            "{% load yamconf_tags %}{% yamlconf_value value hide %}"
+        ).render({'value': ["<x>"], 'hide': False})
+        self.assertIn("<tt>&lt;x&gt;</tt>", rendered)
+        with self.settings(YAMLCONF_VIEW_MAX_ITEMS=0):
+            rendered = engines["django"].from_string(
+                "{% load yamconf_tags %}{% yamlconf_value value %}"
+            ).render({'value': ["<x>"]})
+        self.assertIn("1 VALUES NOT SHOWN", rendered)
+
+    def test_value_size(self):
+        self.assertEqual(views.value_size("text"), 0)
+        self.assertEqual(views.value_size([]), 0)
+        self.assertEqual(views.value_size([1, [2, 3]]), 4)
+        self.assertEqual(views.value_size(VALUE), 20)
+
+    def test_lazy_tag(self):
+        template = engines["django"].from_string(
+            "{% load yamconf_tags %}"
+            "{% yamlconf_value value hide name history=1 %}"
+        )
+        context = {'value': VALUE, 'hide': False, 'name': "XMPL"}
+        with self.settings(YAMLCONF_VIEW_INLINE_SIZE=10):
+            rendered = template.render(context)
+            self.assertIn("dict, 5 items, 20 nested values", rendered)
+            self.assertIn("?path=XMPL&amp;history=1", rendered)
+            self.assertNotIn("logging.StreamHandler", rendered)
+            context['hide'] = True
+            self.assertIn("Hidden", template.render(context))
+        context['hide'] = False
+        self.assertIn("logging.StreamHandler", template.render(context))
@@ -5,12 +5,18 @@
 Test the URL views defined by YAMLCONF
 """
 
+import json
+import re
 import pytest
 import django_yamlconf
 
+from unittest import mock
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
+from django_yamlconf import views
 from tests import YCTestCase
 
 
@@ -18,6 +24,23 @@ User = get_user_model()
 _USERNAME = "testuser"
 _ADMINNAME = "testadmin"
 _PASSWORD = "welcome123"
+_NAME_LINK = re.compile(r'<td valign="top">\s*<a href="[^"]*">([^<]*)</a>')
+
+
+def page_content(response):
+    """
+    Return the content of a response, streamed or not.
+    """
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def page_names(content):
+    """
+    Return the attribute names listed on an index page.
+    """
+    return _NAME_LINK.findall(content.decode("utf-8"))
 
 
 @pytest.mark.django_db
@@ -34,6 +57,7 @@ class ViewTests(YCTestCase):
             is_staff=True,
         )
         django_yamlconf.load(project="tests", settings=settings)
+        cache.clear()
 
     def test_no_access(self):
         self.client.login(username=_USERNAME, password=_PASSWORD)
@@ -65,3 +89,384 @@ class ViewTests(YCTestCase):
             reverse("django_yamlconf:attr", args=["NO_SUCH_SETTING"])
         )
         self.assertEqual(response.status_code, 404)
+
+    def test_index_not_modified(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(reverse("django_yamlconf:index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_index_cached(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        with mock.patch.object(
+                views,
+                "render_to_string",
+                wraps=views.render_to_string) as render:
+            first = self.client.get(reverse("django_yamlconf:index"))
+            self.assertTrue(first.streaming)
+            content = page_content(first)
+            rendered = render.call_count
+            second = self.client.get(reverse("django_yamlconf:index"))
+        self.assertEqual(render.call_count, rendered)
+        self.assertFalse(second.streaming)
+        self.assertEqual(content, second.content)
+
+    def test_index_changed(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(reverse("django_yamlconf:index"))
+        etag = response["ETag"]
+        self.assertNotIn(b"view-test-value", page_content(response))
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_TEST': "view-test-value"},
+            "**TEST**"
+        )
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn(b"view-test-value", page_content(response))
+
+    def test_index_no_cache(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        with self.settings(YAMLCONF_VIEW_CACHE=""), mock.patch.object(
+                views,
+                "render_to_string",
+                wraps=views.render_to_string) as render:
+            for _ in range(2):
+                page_content(self.client.get(reverse("django_yamlconf:index")))
+                rendered, render.call_count = render.call_count, 0
+                self.assertGreater(rendered, 0)
+
+    def test_attr_not_modified(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        url = reverse("django_yamlconf:attr", args=["CPU_COUNT"])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(
+            url,
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_attr_notdef_no_etag(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse("django_yamlconf:attr", args=["NO_SUCH_SETTING"]),
+            HTTP_IF_NONE_MATCH="*"
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_index_search(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'q': "CPU_C", 'mode': "prefix"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(page_names(page_content(response)), ["CPU_COUNT"])
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'q': "os_*"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(page_names(page_content(response)), [])
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'q': "OS_*"}
+        )
+        names = page_names(page_content(response))
+        self.assertIn("OS_NODE", names)
+        self.assertTrue(all(name.startswith("OS_") for name in names))
+
+    def test_index_source(self):
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_SOURCE': "value"},
+            "**VIEW-TEST**"
+        )
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'source': "**VIEW-TEST**"}
+        )
+        self.assertEqual(
+            page_names(page_content(response)),
+            ["VIEW_SOURCE"]
+        )
+
+    def test_index_pages(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        count = len(django_yamlconf.get_cached_attributes(settings))
+        pages = (count + 1) // 2
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'per_page': 2, 'page': 2}
+        )
+        self.assertEqual(response.status_code, 200)
+        content = page_content(response)
+        self.assertEqual(len(page_names(content)), 2)
+        self.assertIn(f"Page 2 of {pages}".encode("utf-8"), content)
+        self.assertIn(
+            f"Attributes 3 to 4 of\n  {count}".encode("utf-8"),
+            content
+        )
+        self.assertIn(b"per_page=2&amp;page=3", content)
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'per_page': "x", 'page': 10000}
+        )
+        self.assertEqual(response.status_code, 200)
+        start = (count - 1) // 100 * 100 + 1
+        self.assertIn(
+            f"Attributes {start} to {count} of".encode("utf-8"),
+            page_content(response)
+        )
+
+    def test_index_all(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        with mock.patch.object(views, "_ROWS_BATCH", 10):
+            response = self.client.get(
+                reverse("django_yamlconf:index"),
+                {'per_page': "all"}
+            )
+            self.assertTrue(response.streaming)
+            chunks = list(response.streaming_content)
+        names = page_names(b"".join(chunks))
+        self.assertEqual(
+            names,
+            sorted(django_yamlconf.get_cached_attributes(settings))
+        )
+        self.assertEqual(len(chunks), (len(names) + 9) // 10 + 2)
+        self.assertIn(
+            f"Attributes 1 to {len(names)} of".encode("utf-8"),
+            b"".join(chunks)
+        )
+        response = self.client.get(
+            reverse("django_yamlconf:index"),
+            {'per_page': "all"}
+        )
+        self.assertTrue(response.streaming)
+
+    def value_get(self, **params):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        return self.client.get(reverse("django_yamlconf:attr_value"), params)
+
+    def test_attr_lazy(self):
+        handlers = {
+            f"h{i}": {'level': "DEBUG", 'backups': [i, i + 1]}
+            for i in range(20)
+        }
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_LOG': {'version': 1, 'handlers': handlers}},
+            "**VIEW-TEST**"
+        )
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        with self.settings(YAMLCONF_VIEW_INLINE_SIZE=10):
+            response = self.client.get(
+                reverse("django_yamlconf:attr", args=["VIEW_LOG"])
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(
+                b"dict, 2 items, 102 nested values",
+                response.content
+            )
+            self.assertIn(b"value.json?path=VIEW_LOG", response.content)
+            self.assertNotIn(b"DEBUG", response.content)
+            record = json.loads(self.value_get(path="VIEW_LOG").content)
+            self.assertEqual(record['size'], 102)
+            self.assertNotIn('value', record)
+            self.assertEqual(
+                record['items'][0],
+                {
+                    'key': "version",
+                    'path': "VIEW_LOG.version",
+                    'type': "int",
+                    'size': 0,
+                    'value': 1,
+                }
+            )
+            self.assertEqual(
+                record['items'][1]['url'],
+                views.value_url("VIEW_LOG.handlers")
+            )
+            record = json.loads(
+                self.value_get(path="VIEW_LOG.handlers.h3.backups.1").content
+            )
+            self.assertEqual(record['value'], 4)
+        cache.clear()
+        response = self.client.get(
+            reverse("django_yamlconf:attr", args=["VIEW_LOG"])
+        )
+        self.assertIn(b"DEBUG", response.content)
+
+    def test_attr_value(self):
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_PASSWORD': ["secret"]},
+            "**VIEW-TEST**"
+        )
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_LIST': ["{VIEW_LIST_ITEM}"], 'VIEW_LIST_ITEM': "x"},
+            "**VIEW-TEST**"
+        )
+        record = json.loads(
+            self.value_get(path="VIEW_LIST", field="value").content
+        )
+        self.assertEqual(
+            record,
+            {
+                'path': "VIEW_LIST",
+                'type': "list",
+                'size': 1,
+                'value': ["{VIEW_LIST_ITEM}"],
+            }
+        )
+        record = json.loads(self.value_get(path="VIEW_LIST.0").content)
+        self.assertEqual(record['value'], "x")
+        text = self.value_get(path="VIEW_PASSWORD").content.decode("utf-8")
+        self.assertNotIn("secret", text)
+        self.assertEqual(json.loads(text)['value'], views.HIDDEN_VALUE)
+        for params in ({'path': "VIEW_LIST.1"}, {'path': "NO_SUCH.0"},
+                       {'path': "VIEW_LIST", 'history': 5}):
+            self.assertEqual(self.value_get(**params).status_code, 404)
+        for params in ({}, {'path': "VIEW_LIST", 'field': "doc"},
+                       {'path': "VIEW_LIST", 'history': "x"}):
+            self.assertEqual(self.value_get(**params).status_code, 400)
+
+    def test_attr_value_dotted_keys(self):
+        loggers = {
+            "django.request": {'level': "ERROR", 'handlers': ["a", "b"]},
+            "back\\slash": {'level': "INFO"},
+        }
+        django_yamlconf.add_attributes(
+            settings,
+            {'VIEW_LOGGING': {'loggers': loggers}},
+            "**VIEW-TEST**"
+        )
+        with self.settings(YAMLCONF_VIEW_INLINE_SIZE=2):
+            record = json.loads(
+                self.value_get(path="VIEW_LOGGING.loggers").content
+            )
+            paths = {item['key']: item['path'] for item in record['items']}
+            self.assertEqual(
+                paths,
+                {
+                    "django.request": "VIEW_LOGGING.loggers.django\\.request",
+                    "back\\slash": "VIEW_LOGGING.loggers.back\\\\slash",
+                }
+            )
+            for key, path in paths.items():
+                record = json.loads(self.value_get(path=path).content)
+                self.assertEqual(record['path'], path)
+                self.assertEqual(
+                    [item['key'] for item in record.get('items', ())] or
+                    list(record['value']),
+                    list(loggers[key])
+                )
+            record = json.loads(self.value_get(
+                path="VIEW_LOGGING.loggers.django\\.request.handlers.1"
+            ).content)
+            self.assertEqual(record['value'], "b")
+        self.assertEqual(
+            self.value_get(
+                path="VIEW_LOGGING.loggers.django.request"
+            ).status_code,
+            404
+        )
+
+    def api_get(self, fmt, **params):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse(f"django_yamlconf:attributes_{fmt}"),
+            params
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_api_json(self):
+        records = json.loads(self.api_get("json"))
+        attributes = django_yamlconf.get_cached_attributes(settings)
+        self.assertEqual(
+            [record['name'] for record in records],
+            sorted(attributes)
+        )
+        self.assertEqual(set(records[0]), {"name", "evalue", "source"})
+
+    def test_api_ndjson(self):
+        lines = self.api_get("ndjson", q="CPU_COUNT").splitlines()
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual(record['name'], "CPU_COUNT")
+
+    def test_api_fields(self):
+        records = json.loads(
+            self.api_get("json", q="CPU_COUNT", fields="name,hide,position")
+        )
+        self.assertEqual(
+            records,
+            [{'name': "CPU_COUNT", 'hide': False, 'position': None}]
+        )
+
+    def test_api_hidden(self):
+        django_yamlconf.add_attributes(
+            settings,
+            {'API_PASSWORD': "secret"},
+            "**API-TEST**"
+        )
+        django_yamlconf.add_attributes(
+            settings,
+            {'API_PASSWORD': "secret2"},
+            "**API-TEST**"
+        )
+        text = self.api_get(
+            "ndjson",
+            q="API_PASSWORD",
+            fields="name,value,evalue,history"
+        )
+        self.assertNotIn("secret", text)
+        record = json.loads(text)
+        self.assertEqual(record['evalue'], views.HIDDEN_VALUE)
+        self.assertEqual(
+            record['history'][0],
+            {'value': views.HIDDEN_VALUE, 'source': "**API-TEST**"}
+        )
+        self.assertTrue(all(
+            item['value'] == views.HIDDEN_VALUE for item in record['history']
+        ))
+
+    def test_api_empty(self):
+        self.assertEqual(json.loads(self.api_get("json", q="NO_SUCH")), [])
+        self.assertEqual(self.api_get("ndjson", q="NO_SUCH"), "")
+
+    def test_api_invalid_field(self):
+        self.client.login(username=_ADMINNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse("django_yamlconf:attributes_json"),
+            {'fields': "name,secret"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_no_access(self):
+        self.client.login(username=_USERNAME, password=_PASSWORD)
+        response = self.client.get(
+            reverse("django_yamlconf:attributes_ndjson")
+        )
+        self.assertEqual(response.status_code, 302)
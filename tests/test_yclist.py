@@ -5,11 +5,13 @@
 Test the "ycexplain" management command
 """
 
+import json
 from io import StringIO
 
 import django_yamlconf
 from tests import MockSettings
 from tests import YCTestCase
+from tests import new_settings
 
 
 class TestYCList(YCTestCase):
@@ -46,3 +48,105 @@ class TestYCList(YCTestCase):
                 self.assertIn(
                     "No YAMLCONF attributes defined", logs.output[0]
                 )
+
+    def list_attrs(self, **kwargs):
+        """
+        Return the output listing the attributes
+        """
+        out = StringIO()
+        django_yamlconf.list_attrs(
+            settings=self.settings,
+            stream=out,
+            **kwargs
+        )
+        return out.getvalue()
+
+    def test_yclist_json(self):
+        """
+        Verify the JSON list for the attributes selected by name
+        """
+        records = json.loads(self.list_attrs(fmt="json", pattern="EX*"))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['name'], "EXAMPLE")
+        self.assertEqual(records[0]['value'], "value")
+        self.assertTrue(records[0]['source'].endswith("yclist.yaml"))
+        self.assertEqual(
+            json.loads(self.list_attrs(fmt="json", pattern="NONE*")),
+            []
+        )
+
+    def test_yclist_ndjson(self):
+        """
+        Verify the NDJSON records, sorted by name, for a source
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {'LIST_B': "{LIST_A}/b", 'LIST_A': "a"},
+            "**LIST-TEST**"
+        )
+        lines = self.list_attrs(
+            fmt="ndjson",
+            source="**LIST-TEST**",
+            evalue=True
+        ).splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {'name': "LIST_A", 'evalue': "a", 'source': "**LIST-TEST**"},
+                {'name': "LIST_B", 'evalue': "a/b", 'source': "**LIST-TEST**"},
+            ]
+        )
+
+    def test_yclist_tsv(self):
+        """
+        Verify the tab separated values, special characters escaped
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {'LIST_TSV': "a\tb\nc", 'LIST_DICT': {'key': 1}},
+            "**LIST-TEST**"
+        )
+        lines = self.list_attrs(fmt="tsv", pattern="LIST_*").splitlines()
+        self.assertEqual(
+            lines,
+            [
+                "name\tvalue\tsource",
+                'LIST_DICT\t{"key": 1}\t**LIST-TEST**',
+                "LIST_TSV\ta\\tb\\nc\t**LIST-TEST**",
+            ]
+        )
+
+    def test_yclist_batches(self):
+        """
+        Verify the JSON list written a batch of attributes at a time
+        """
+        django_yamlconf.add_attributes(
+            self.settings,
+            {f"LIST_{i:03}": i for i in range(250)},
+            "**LIST-TEST**"
+        )
+        records = json.loads(self.list_attrs(fmt="json", pattern="LIST_*"))
+        self.assertEqual(
+            [record['value'] for record in records],
+            list(range(250))
+        )
+
+    def test_yclist_predefined(self):
+        """
+        Verify the predefined values not listed are not computed
+        """
+        settings = new_settings()
+        django_yamlconf.load(project="yclist", settings=settings)
+        out = StringIO()
+        django_yamlconf.list_attrs(
+            settings=settings,
+            stream=out,
+            fmt="ndjson",
+            pattern="EX*"
+        )
+        self.assertEqual(json.loads(out.getvalue())['name'], "EXAMPLE")
+        attributes = django_yamlconf.get_cached_attributes(
+            settings,
+            expand=False
+        )
+        self.assertTrue(attributes['OS_PROCESSOR'].pending)